@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 # Ensure local src is importable in CI and local runs
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
 
-from PIL import Image, ImageDraw, ImageFont  # type: ignore
+from PIL import Image, ImageFont  # type: ignore
 
 
 def font_path() -> str:
@@ -26,21 +27,56 @@ def font_path() -> str:
     raise FileNotFoundError('Could not find a monospaced TTF font; set SNAPSHOT_FONT to a .ttf')
 
 
+# Rasterized glyph masks keyed by (font path, size, char); snapshot text is a
+# small alphabet of ASCII and box-drawing characters repeated across cells.
+_GLYPHS: Dict[Tuple[str, int, str], tuple] = {}
+
+
+def _glyph(font, fp: str, size: int, ch: str) -> tuple:
+    key = (fp, size, ch)
+    g = _GLYPHS.get(key)
+    if g is None:
+        mask, offset = font.getmask2(ch, mode='L')
+        g = _GLYPHS[key] = (mask, offset, mask.size)
+    return g
+
+
+@lru_cache(maxsize=None)
+def _font_metrics(fp: str, size: int):
+    """Load the font once per (path, size) with its monospace cell metrics."""
+    font = ImageFont.truetype(fp, size)
+    advance = font.getlength('M')
+    # getbbox returns (l,t,r,b)
+    bbox = font.getbbox('Mg')
+    return font, advance, bbox[3] - bbox[1]
+
+
 def draw_text_image(lines: List[str], out: Path, *, pad: int = 10, bg=(248, 250, 252), fg=(20, 20, 20), size: int = 16) -> None:
     fp = font_path()
-    font = ImageFont.truetype(fp, size)
+    font, advance, h_char = _font_metrics(fp, size)
+    w_char = int(advance)
     # Measure
-    max_len = max((len(l) for l in lines), default=0)
-    # getbbox returns (l,t,r,b)
-    w_char = int(font.getlength('M'))
-    h_char = font.getbbox('Mg')[3] - font.getbbox('Mg')[1]
+    max_len = 0
+    for ln in lines:
+        if len(ln) > max_len:
+            max_len = len(ln)
     W = max(1, max_len) * w_char + pad * 2
     H = max(1, len(lines)) * h_char + pad * 2
     img = Image.new('RGB', (W, H), color=bg)
-    draw = ImageDraw.Draw(img)
+    # Blit cached glyph masks on the monospace grid instead of having PIL
+    # re-rasterize every line through draw.text.
+    paste = img.im.paste
     y = pad
     for ln in lines:
-        draw.text((pad, y), ln, font=font, fill=fg)
+        for i, ch in enumerate(ln):
+            if ch == ' ':
+                continue
+            mask, (ox, oy), (mw, mh) = _glyph(font, fp, size, ch)
+            if not mw or not mh:
+                continue
+            x0 = pad + int(i * advance) + ox
+            y0 = y + oy
+            paste(fg, (x0, y0, x0 + mw, y0 + mh), mask)
         y += h_char
     out.parent.mkdir(parents=True, exist_ok=True)
     img.save(out)
@@ -49,7 +85,7 @@ def draw_text_image(lines: List[str], out: Path, *, pad: int = 10, bg=(248, 250,
 def render_snapshots() -> Tuple[str, list[Path]]:
     # Import after sys.path tweak
     from ratatui_py import List, Table, Gauge
-    from ratatui_py import headless_render_list, headless_render_table, headless_render_gauge
+    from ratatui_py import headless_render_many
 
     assets = []
     lines = []
@@ -61,21 +97,24 @@ def render_snapshots() -> Tuple[str, list[Path]]:
     for i in range(1, 6):
         lst.append_item(f'Item {i}')
     lst.set_selected(2)
-    tl = headless_render_list(30, 7, lst)
-    p_lst = Path('docs/assets/snapshots/list.png')
-    draw_text_image(tl.splitlines(), p_lst)
-    assets.append(p_lst)
 
     tbl = Table()
     tbl.set_headers(['A', 'B', 'C'])
     tbl.append_row(['1', '2', '3'])
-    tt = headless_render_table(30, 7, tbl)
+
+    g = Gauge().ratio(0.42).label('42%')
+
+    # One FFI round trip for all three renders.
+    tl, tt, tg = headless_render_many([(30, 7, lst), (30, 7, tbl), (30, 3, g)])
+
+    p_lst = Path('docs/assets/snapshots/list.png')
+    draw_text_image(tl.splitlines(), p_lst)
+    assets.append(p_lst)
+
     p_tbl = Path('docs/assets/snapshots/table.png')
     draw_text_image(tt.splitlines(), p_tbl)
     assets.append(p_tbl)
 
-    g = Gauge().ratio(0.42).label('42%')
-    tg = headless_render_gauge(30, 3, g)
     p_g = Path('docs/assets/snapshots/gauge.png')
     draw_text_image(tg.splitlines(), p_g)
     assets.append(p_g)
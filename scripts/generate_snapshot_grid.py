@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-import sys, csv, pathlib
+import sys, pathlib
 
 def main(argv):
     if len(argv) not in (3, 4):
@@ -8,15 +8,18 @@ def main(argv):
     index = pathlib.Path(argv[1])
     out = pathlib.Path(argv[2])
     rows = []
-    with index.open('r', encoding='utf-8') as f:
-        rdr = csv.reader(f, delimiter='\t')
-        for row in rdr:
-            if not row or row[0].strip().startswith('#') or row[0] == 'cast':
-                continue
-            # cast, gif, mp4, theme, speed, scale
-            cast, gif, mp4, *_ = row + [None] * (6 - len(row))
-            name = pathlib.Path(cast).stem
-            rows.append((name, gif, mp4))
+    # Plain TSV without quoting, so a split is enough; csv's state machine
+    # is not needed.
+    for raw in index.read_text(encoding='utf-8').splitlines():
+        if not raw:
+            continue
+        row = raw.split('\t')
+        if row[0].strip().startswith('#') or row[0] == 'cast':
+            continue
+        # cast, gif, mp4, theme, speed, scale
+        cast, gif, mp4, *_ = row + [None] * (6 - len(row))
+        name = pathlib.Path(cast).stem
+        rows.append((name, gif, mp4))
     # Simple 3-column grid
     cols = 3
     lines = []
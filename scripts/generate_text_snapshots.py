@@ -1,57 +1,128 @@
 #!/usr/bin/env python3
+import hashlib
+import os
 import sys
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
 
 TEMPLATE_BEGIN = "<!-- BEGIN: SNAPSHOTS -->"
 TEMPLATE_END = "<!-- END: SNAPSHOTS -->"
 
+# Rendered text is cached per (widget spec, size, library build); set
+# RATATUI_SNAPSHOT_CACHE to an empty string to disable the on-disk layer.
+CACHE_DIR = os.getenv("RATATUI_SNAPSHOT_CACHE", ".cache/snapshots")
+_MEMO: Dict[bytes, str] = {}
+
+
+def _lib_stamp() -> str:
+    from ratatui_py._ffi import load_library
+    name = getattr(load_library(), "_name", None) or ""
+    try:
+        st = os.stat(name)
+    except OSError:
+        return name
+    return f"{name}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _code_stamp() -> bytes:
+    # The widget builders live in this script and the wrappers they call can
+    # change how a widget is configured, so either source changing is a miss.
+    from ratatui_py import wrappers
+    h = hashlib.blake2b(digest_size=16)
+    for src in (__file__, wrappers.__file__):
+        h.update(Path(src).read_bytes())
+    return h.digest()
+
+
+def render_cached(entries: Sequence[Tuple[tuple, int, int, Callable[[], Any]]]) -> List[str]:
+    """Render ``(spec, width, height, build)`` entries, memoized on spec, code and library build.
+
+    ``spec`` must describe everything the widget is built from. Only cache
+    misses call ``build()``, and all of them are rendered together in one
+    headless frame.
+    """
+    from ratatui_py import headless_render_many
+
+    stamp = _lib_stamp().encode("utf-8") + _code_stamp()
+    keys: List[bytes] = []
+    for spec, width, height, _build in entries:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr(spec).encode("utf-8"))
+        h.update(width.to_bytes(2, "little") + height.to_bytes(2, "little"))
+        h.update(stamp)
+        keys.append(h.digest())
+
+    texts: List[Optional[str]] = [None] * len(entries)
+    missing: List[int] = []
+    for i, key in enumerate(keys):
+        text = _MEMO.get(key)
+        path = Path(CACHE_DIR) / f"{key.hex()}.txt" if CACHE_DIR else None
+        if text is None and path is not None and path.exists():
+            text = _MEMO[key] = path.read_text(encoding="utf-8")
+        if text is None:
+            missing.append(i)
+        texts[i] = text
+
+    if missing:
+        rendered = headless_render_many([(entries[i][1], entries[i][2], entries[i][3]()) for i in missing])
+        for i, text in zip(missing, rendered):
+            key = keys[i]
+            _MEMO[key] = texts[i] = text
+            if CACHE_DIR:
+                path = Path(CACHE_DIR) / f"{key.hex()}.txt"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(text, encoding="utf-8")
+    return texts  # type: ignore[return-value]
+
 
 def render_widgets_section() -> str:
     try:
-        from ratatui_py import List, Table, Gauge
-        from ratatui_py import headless_render_list, headless_render_table, headless_render_gauge
-        lst = List()
-        for i in range(1, 6):
-            lst.append_item(f"Item {i}")
-        lst.set_selected(2)
-        tl = headless_render_list(30, 7, lst)
-
-        tbl = Table()
-        tbl.set_headers(["A", "B", "C"])
-        tbl.append_row(["1", "2", "3"])
-        tt = headless_render_table(30, 7, tbl)
-
-        g = Gauge().ratio(0.42).label("42%")
-        tg = headless_render_gauge(30, 3, g)
-
-        return (
-            "<table><tr>"
-            f"<td><pre><code>{escape_html(tl)}</code></pre></td>"
-            f"<td><pre><code>{escape_html(tt)}</code></pre></td>"
-            f"<td><pre><code>{escape_html(tg)}</code></pre></td>"
-            "</tr><tr>"
-            "<td align=\"center\"><code>List</code></td>"
-            "<td align=\"center\"><code>Table</code></td>"
-            "<td align=\"center\"><code>Gauge</code></td>"
-            "</tr></table>\n\n"
-        )
+        from ratatui_py import List as ListWidget, Table, Gauge
+
+        items = [f"Item {i}" for i in range(1, 6)]
+        headers, rows = ["A", "B", "C"], [["1", "2", "3"]]
+
+        def build_list() -> ListWidget:
+            lst = ListWidget()
+            lst.extend_items(items)
+            lst.set_selected(2)
+            return lst
+
+        def build_table() -> Table:
+            tbl = Table()
+            tbl.set_headers(headers)
+            tbl.extend_rows(rows)
+            return tbl
+
+        tl, tt, tg = render_cached([
+            (("list", items, 2), 30, 7, build_list),
+            (("table", headers, rows), 30, 7, build_table),
+            (("gauge", 0.42, "42%"), 30, 3, lambda: Gauge().ratio(0.42).label("42%")),
+        ])
+
+        parts = ["<table><tr>"]
+        for text in (tl, tt, tg):
+            parts += ("<td><pre><code>", escape_html(text), "</code></pre></td>")
+        parts.append("</tr><tr>")
+        for name in ("List", "Table", "Gauge"):
+            parts += ('<td align="center"><code>', name, "</code></td>")
+        parts.append("</tr></table>\n\n")
+        return "".join(parts)
     except Exception as e:
         return f"<p>Snapshot generation failed: {e}</p>\n\n"
 
 
+_HTML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
 def escape_html(s: str) -> str:
-    return (
-        s.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-    )
+    # One pass over the text instead of a full copy per replaced character.
+    return s.translate(_HTML_ESCAPES)
 
 
 def generate_snapshots_md() -> str:
-    md = ["# UI Snapshots\n", "A grid of text snapshots rendered in CI.\n\n"]
-    md.append(render_widgets_section())
-    return "".join(md)
+    return "".join(("# UI Snapshots\n", "A grid of text snapshots rendered in CI.\n\n", render_widgets_section()))
 
 
 def inject_into_readme(readme_path: Path, content: str) -> None:
@@ -59,7 +130,7 @@ def inject_into_readme(readme_path: Path, content: str) -> None:
     if TEMPLATE_BEGIN in txt and TEMPLATE_END in txt:
         before, rest = txt.split(TEMPLATE_BEGIN, 1)
         _, after = rest.split(TEMPLATE_END, 1)
-        new = before + TEMPLATE_BEGIN + "\n\n" + content + "\n" + TEMPLATE_END + after
+        new = "".join((before, TEMPLATE_BEGIN, "\n\n", content, "\n", TEMPLATE_END, after))
         readme_path.write_text(new, encoding="utf-8")
 
 
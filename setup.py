@@ -41,15 +41,55 @@ def copy_lib_to_bundle(path: Path) -> None:
     print(f"Bundled: {target}")
 
 
+def _release_env(rustflags: str = "") -> dict:
+    # Fat LTO with a single codegen unit for the shipped cdylib. Cargo's
+    # CARGO_PROFILE_* overrides leave the upstream Cargo.toml untouched, and
+    # anything already set in the environment wins.
+    env = dict(os.environ)
+    env.setdefault("CARGO_PROFILE_RELEASE_LTO", "fat")
+    env.setdefault("CARGO_PROFILE_RELEASE_CODEGEN_UNITS", "1")
+    if rustflags:
+        env["RUSTFLAGS"] = (env.get("RUSTFLAGS", "") + " " + rustflags).strip()
+    return env
+
+
+def _pgo_train(lib: Path, workdir: Path) -> None:
+    # Exercise the instrumented library through the Python bindings so the
+    # profile reflects real call patterns (snapshot rendering + test suite).
+    env = dict(os.environ, RATATUI_FFI_LIB=str(lib), RATATUI_SNAPSHOT_CACHE="")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PKG_ROOT / "src"), env.get("PYTHONPATH")]))
+    script = PKG_ROOT / "scripts" / "generate_text_snapshots.py"
+    if script.exists():
+        subprocess.call([sys.executable, str(script), str(workdir / "train.md")], cwd=PKG_ROOT, env=env)
+    if (PKG_ROOT / "tests").is_dir():
+        subprocess.call([sys.executable, "-m", "pytest", "-q", "-x", str(PKG_ROOT / "tests")], cwd=PKG_ROOT, env=env)
+
+
 def build_from_src(src_path: Path) -> Path:
     # Build the Rust cdylib via cargo in the provided repository path
     profile = os.environ.get("RATATUI_FFI_PROFILE", "release").lower()
     if profile not in ("release", "debug"):
         profile = "release"
     print(f"Building ratatui_ffi from {src_path} (profile={profile})…")
-    args = ["cargo", "build"] + ([] if profile == "debug" else ["--release"])
-    subprocess.check_call(args, cwd=src_path)
     target = src_path / "target" / ("debug" if profile == "debug" else "release") / plat_lib_name()
+    if profile == "debug":
+        subprocess.check_call(["cargo", "build"], cwd=src_path)
+    elif os.environ.get("RATATUI_FFI_PGO") == "1" and shutil.which("llvm-profdata"):
+        with tempfile.TemporaryDirectory() as td:
+            prof_dir = Path(td) / "pgo"
+            print("PGO: building instrumented library…")
+            subprocess.check_call(["cargo", "build", "--release"], cwd=src_path, env=_release_env(f"-Cprofile-generate={prof_dir}"))
+            instrumented = Path(td) / plat_lib_name()
+            shutil.copy2(target, instrumented)
+            _pgo_train(instrumented, Path(td))
+            merged = Path(td) / "merged.profdata"
+            subprocess.check_call(["llvm-profdata", "merge", "-o", str(merged), str(prof_dir)])
+            print("PGO: rebuilding with collected profile…")
+            subprocess.check_call(["cargo", "build", "--release"], cwd=src_path, env=_release_env(f"-Cprofile-use={merged}"))
+    else:
+        if os.environ.get("RATATUI_FFI_PGO") == "1":
+            print("Warning: RATATUI_FFI_PGO=1 but llvm-profdata was not found; building without PGO.")
+        subprocess.check_call(["cargo", "build", "--release"], cwd=src_path, env=_release_env())
     if not target.exists():
         raise FileNotFoundError(f"Built library not found: {target}")
     return target
@@ -34,6 +34,7 @@ from .wrappers import (
     ListState,
     TableState,
     DrawCmd,
+    FrameBuilder,
     App,
     headless_render_paragraph,
     headless_render_list,
@@ -46,6 +47,8 @@ from .wrappers import (
     headless_render_frame,
     headless_render_frame_styles_ex,
     headless_render_frame_cells,
+    headless_render_frame_cells_np,
+    headless_render_many,
     headless_render_canvas,
     headless_render_logo,
     headless_render_logo_sized,
@@ -57,8 +60,8 @@ from .types import Mod
 from .prelude import *  # re-export convenience prelude
 from .types import (
     Rect, RectLike, Point, Size,
-    Color, KeyCode, KeyMods, MouseKind, MouseButton,
-    KeyEvt, ResizeEvt, MouseEvt, Event,
+    Color, KeyCode, KeyMods, MouseKind, MouseButton, EventKind, WidgetKind,
+    KeyEvt, ResizeEvt, MouseEvt, Event, EventRecord,
 )
 
 __all__ = [
@@ -89,6 +92,7 @@ __all__ = [
     "ListState",
     "TableState",
     "DrawCmd",
+    "FrameBuilder",
     "App",
     "Rect",
     "RectLike",
@@ -99,10 +103,13 @@ __all__ = [
     "KeyMods",
     "MouseKind",
     "MouseButton",
+    "EventKind",
+    "WidgetKind",
     "KeyEvt",
     "ResizeEvt",
     "MouseEvt",
     "Event",
+    "EventRecord",
     "Mod",
     "Keymap",
     "headless_render_paragraph",
@@ -113,6 +120,8 @@ __all__ = [
     "headless_render_barchart",
     "headless_render_sparkline",
     "headless_render_chart",
+    "headless_render_many",
+    "headless_render_frame_cells_np",
     "margin",
     "split_h",
     "split_v",
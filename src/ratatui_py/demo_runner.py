@@ -1,8 +1,15 @@
 from __future__ import annotations
 import os
+import re
 import sys
 import time
 import inspect
+import math
+import pathlib
+import random
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 from typing import Optional, Tuple, List
 
 from . import (
@@ -12,18 +19,25 @@ from . import (
     Table as UiTable,
     Gauge as UiGauge,
     Chart as UiChart,
+    BarChart,
+    Sparkline,
+    Tabs,
     Style,
     FFI_COLOR,
     DrawCmd,
 )
 from . import examples as ex
 from .layout import margin, split_h, split_v
+from .util import _numba, _numpy
 
 # Recording-friendly knobs
 _REC = bool(os.getenv("ASCIINEMA_REC") or os.getenv("RATATUI_PY_RECORDING"))
 _FPS = int(os.getenv("RATATUI_PY_FPS", "30"))
 _STATIC = os.getenv("RATATUI_PY_STATIC", "0") not in ("0", "false", "False", "")
 _NO_CODE = os.getenv("RATATUI_PY_NO_CODE", "1" if _REC else "0") not in ("0", "false", "False", "")
+# Idle hub frames are skipped; this bounds how stale a static demo may get (seconds).
+_IDLE_REPAINT = float(os.getenv("RATATUI_PY_IDLE_REPAINT", "1.0"))
+_IDLE_WAIT_MS = max(1, int(_IDLE_REPAINT * 1000))
 
 # Prefer inline mode (preserve scrollback) by default
 os.environ.setdefault("RATATUI_FFI_NO_ALTSCR", "1")
@@ -64,17 +78,112 @@ def _cursor_show():
         pass
 
 
+def _speed_up(demo) -> None:
+    demo.speed = min(5.0, demo.speed * 1.25)
+
+
+def _speed_down(demo) -> None:
+    demo.speed = max(0.2, demo.speed * 0.8)
+
+
+_SPEED_KEYS = {ord("+"): _speed_up, ord("-"): _speed_down}
+
+
+def _lut_rows(np, lut, idx) -> bytes:
+    # Map an (h, w) index array through a uint8 character LUT into
+    # newline-separated rows, ready for Paragraph.from_text.
+    h, w = idx.shape
+    buf = np.empty((h, w + 1), dtype=np.uint8)
+    buf[:, w] = 0x0A
+    np.take(lut, idx, out=buf[:, :w])
+    return buf.tobytes()[:-1]
+
+
+_MANDEL_NB = None
+
+
+def _mandel_kernel():
+    """Compile (once) and return the numba escape-time kernel, or None without numba."""
+    global _MANDEL_NB
+    if _MANDEL_NB is None:
+        nb = _numba()
+        if nb is None:
+            _MANDEL_NB = False
+        else:
+            @nb.njit(parallel=True, cache=True)
+            def iters(xs, ys, max_iter, out):
+                h, w = out.shape
+                for j in nb.prange(h):
+                    cy = ys[j]
+                    for i in range(w):
+                        cx = xs[i]
+                        zx = 0.0
+                        zy = 0.0
+                        it = 0
+                        while it < max_iter and zx*zx + zy*zy <= 4.0:
+                            zx, zy = zx*zx - zy*zy + cx, 2.0*zx*zy + cy
+                            it += 1
+                        out[j, i] = it
+            _MANDEL_NB = iters
+    return _MANDEL_NB or None
+
+
+def _mandel_np(np, xs, ys, max_iter):
+    # Escape times without numba: every point iterates as one vector, and
+    # points drop out of the working set as they escape. Real and imaginary
+    # parts are kept apart so the arithmetic matches the scalar loop.
+    h, w = len(ys), len(xs)
+    its = np.full(h * w, max_iter, dtype=np.uint16)
+    pos = np.arange(h * w)
+    cx = np.tile(xs, h)
+    cy = np.repeat(ys, w)
+    zx = np.zeros(h * w)
+    zy = np.zeros(h * w)
+    for it in range(max_iter):
+        inside = zx*zx + zy*zy <= 4.0
+        if not inside.all():
+            its[pos[~inside]] = it
+            pos, cx, cy, zx, zy = pos[inside], cx[inside], cy[inside], zx[inside], zy[inside]
+            if not pos.size:
+                break
+        zx, zy = zx*zx - zy*zy + cx, 2.0*zx*zy + cy
+    return its.reshape(h, w)
+
+
 class DemoBase:
     name: str = "Demo"
     desc: str = ""
     source_obj = None  # object to inspect for source
+    # Character code -> handler(self); letters are keyed lowercase and match
+    # either case.
+    _KEY_ACTIONS: dict = {}
 
     def on_key(self, evt: dict) -> None:
-        pass
+        if evt.get("kind") == "key":
+            self._char_action(evt.get("ch", 0))
+
+    def _char_action(self, ch: int) -> None:
+        # Only A-Z fold onto a-z; every other code point matches as is
+        # (ch | 0x20 elsewhere would alias '\r' -> '-' or '[' -> '{').
+        fn = self._KEY_ACTIONS.get(ch | 0x20 if 0x41 <= ch <= 0x5A else ch)
+        if fn is not None:
+            fn(self)
 
     def tick(self, dt: float) -> None:
         pass
 
+    def needs_redraw(self) -> bool:
+        # Whether tick() may have changed the picture since the last frame.
+        # Input is tracked by the hub; demos without a tick() only change on
+        # input, so the hub can skip redrawing them while idle.
+        return type(self).tick is not DemoBase.tick
+
+    def wait_ms(self, frame_ms: int) -> int:
+        # How long the hub may block on input before the next frame (input
+        # always wakes it early): a frame for ticking demos, the idle repaint
+        # interval for static ones.
+        return frame_ms if type(self).tick is not DemoBase.tick else _IDLE_WAIT_MS
+
     def render_cmds(self, rect: Tuple[int, int, int, int]) -> list:
         return []
 
@@ -158,45 +267,60 @@ class LifeDemo(DemoBase):
     source_obj = ex.life_main
 
     def __init__(self) -> None:
-        self.grid: List[List[int]] = []
+        self.grid = ex._rand_grid(0, 0)
+        self._spare = None  # previous generation, reused as the next output
         self.paused = False
         self.delay = 0.1
         self._acc = 0.0
+        self._stepped = True  # a generation has not been drawn yet
 
     def _ensure(self, w: int, h: int) -> None:
-        if not self.grid or len(self.grid) != h or len(self.grid[0]) != w:
-            # new random grid
+        if ex._grid_size(self.grid) != (w, h):
+            # new random grid; the spare no longer matches and is dropped
+            # rather than kept alive until _step replaces it
             self.grid = ex._rand_grid(w, h, p=0.25)
+            self._spare = None
 
-    def on_key(self, evt: dict) -> None:
-        if evt.get("kind") != "key":
-            return
-        ch = evt.get("ch", 0)
-        if not ch:
-            return
-        c = chr(ch).lower()
-        if c == "p":
-            self.paused = not self.paused
-        elif c == "+":
-            self.delay = max(0.01, self.delay * 0.8)
-        elif c == "-":
-            self.delay = min(1.0, self.delay * 1.25)
-        elif c == "r":
-            if self.grid:
-                self.grid = ex._rand_grid(len(self.grid[0]), len(self.grid), p=0.25)
+    def _toggle_pause(self) -> None:
+        self.paused = not self.paused
+
+    def _faster(self) -> None:
+        self.delay = max(0.01, self.delay * 0.8)
+
+    def _slower(self) -> None:
+        self.delay = min(1.0, self.delay * 1.25)
+
+    def _randomize(self) -> None:
+        w, h = ex._grid_size(self.grid)
+        if h:
+            self.grid = ex._rand_grid(w, h, p=0.25)
+
+    _KEY_ACTIONS = {ord("p"): _toggle_pause, ord("+"): _faster, ord("-"): _slower, ord("r"): _randomize}
 
     def tick(self, dt: float) -> None:
         if self.paused:
             return
         self._acc += dt
         if self._acc >= self.delay:
-            self.grid = ex._step(self.grid) if self.grid else self.grid
+            self.grid, self._spare = ex._step(self.grid, self._spare), self.grid
             self._acc = 0.0
+            self._stepped = True
+
+    def needs_redraw(self) -> bool:
+        # Only new generations change the picture, not the time between them.
+        return self._stepped
+
+    def wait_ms(self, frame_ms: int) -> int:
+        # Sleep until the next generation is due.
+        if self.paused:
+            return _IDLE_WAIT_MS
+        return max(1, int((self.delay - self._acc) * 1000))
 
     def render_cmds(self, rect: Tuple[int, int, int, int]) -> list:
         x, y, w, h = rect
         self._ensure(w, h - 2 if h > 2 else h)
         text = ex._render_text(self.grid)
+        self._stepped = False
         hints = "\n[q]uit [Tab] next [p]ause [+/-] speed [r]andomize"
         p = Paragraph.from_text(text + hints)
         p.set_block_title("Conway's Life", True)
@@ -206,6 +330,7 @@ class LifeDemo(DemoBase):
         x, y, w, h = rect
         self._ensure(w, h - 2 if h > 2 else h)
         text = ex._render_text(self.grid)
+        self._stepped = False
         hints = "\n[q]uit [Tab] next [p]ause [+/-] speed [r]andomize"
         p = Paragraph.from_text(text + hints)
         p.set_block_title("Conway's Life", True)
@@ -224,8 +349,51 @@ class DashboardDemo(DemoBase):
         self.sel = 0
         self.cpu = 0.35
         self.mem = 0.55
-        self.spark = [10, 12, 9, 14, 11, 13, 12, 16, 15, 14, 17, 16, 18]
+        # Bounded history: appends evict the oldest sample in O(1).
+        self.spark = deque([10, 12, 9, 14, 11, 13, 12, 16, 15, 14, 17, 16, 18], maxlen=50)
         self.t = 0.0
+        # Widgets live across frames; see _widgets().
+        self._w: Optional[tuple] = None
+        self._w_tab = self._w_sel = -1
+
+    def _widgets(self, chart_k: int, spark_k: int) -> tuple:
+        """Return (tabs, list, chart, cpu gauge, mem gauge, sparkline) for this frame.
+
+        Titles are set once; the tabs and service list are only touched when
+        the selection changes. The chart is rebuilt since its data moves
+        every tick.
+        """
+        if self._w is None:
+            tabs = Tabs()
+            tabs.set_titles(self.tabs)
+            tabs.set_block_title("ratatui-py Dashboard (a/d tabs, j/k move, r spike, q quit)", True)
+            g1 = UiGauge()
+            g1.set_block_title("CPU", True)
+            g2 = UiGauge()
+            g2.set_block_title("Memory", True)
+            sp = Sparkline()
+            sp.set_block_title("Throughput", True)
+            self._w = (tabs, None, g1, g2, sp)
+        tabs, lst, g1, g2, sp = self._w
+        if self._w_tab != self.tab_idx:
+            tabs.set_selected(self.tab_idx)
+            self._w_tab = self.tab_idx
+        if lst is None or self._w_sel != self.sel:
+            # No clear_items in the API: rebuild the list on selection change.
+            lst = UiList()
+            lst.extend_items(f"{'> ' if i == self.sel else '  '}{name}" for i, name in enumerate(self.services))
+            lst.set_selected(self.sel)
+            lst.set_block_title("Services", True)
+            self._w = (tabs, lst, g1, g2, sp)
+            self._w_sel = self.sel
+        ch = UiChart()
+        ch.add_line("cpu", [(float(i), float(v)) for i, v in enumerate(self._spark_tail(chart_k))])
+        ch.set_axes_titles("t", "%")
+        ch.set_block_title("CPU history", True)
+        g1.ratio(self.cpu).label(f"CPU {int(self.cpu*100)}%")
+        g2.ratio(self.mem).label(f"Mem {int(self.mem*100)}%")
+        sp.set_values(self._spark_tail(spark_k))
+        return tabs, lst, ch, g1, g2, sp
 
     def on_key(self, evt: dict) -> None:
         if evt.get("kind") != "key":
@@ -234,43 +402,54 @@ class DashboardDemo(DemoBase):
         ch = int(evt.get("ch", 0))
         # Support both arrow keys (codes) and vim-style chars
         if code == 2:  # Left
-            self.tab_idx = (self.tab_idx - 1) % len(self.tabs)
-            return
-        if code in (3, 9):  # Right or Tab
-            self.tab_idx = (self.tab_idx + 1) % len(self.tabs)
-            return
-        if code == 5:  # Down
-            self.sel = (self.sel + 1) % len(self.services)
-            return
-        if code == 4:  # Up
-            self.sel = (self.sel - 1) % len(self.services)
-            return
-        if ch:
-            c = chr(ch).lower()
-            if c == 'a':
-                self.tab_idx = (self.tab_idx - 1) % len(self.tabs)
-            elif c == 'd':
-                self.tab_idx = (self.tab_idx + 1) % len(self.tabs)
-            elif c == 'j':
-                self.sel = (self.sel + 1) % len(self.services)
-            elif c == 'k':
-                self.sel = (self.sel - 1) % len(self.services)
-            elif c == 'r':
-                # randomize a small spike
-                self.cpu = min(0.99, self.cpu + 0.2)
-                self.mem = min(0.99, self.mem + 0.15)
+            self._prev_tab()
+        elif code in (3, 9):  # Right or Tab
+            self._next_tab()
+        elif code == 5:  # Down
+            self._next_service()
+        elif code == 4:  # Up
+            self._prev_service()
+        elif ch:
+            self._char_action(ch)
+
+    def _prev_tab(self) -> None:
+        self.tab_idx = (self.tab_idx - 1) % len(self.tabs)
+
+    def _next_tab(self) -> None:
+        self.tab_idx = (self.tab_idx + 1) % len(self.tabs)
+
+    def _next_service(self) -> None:
+        self.sel = (self.sel + 1) % len(self.services)
+
+    def _prev_service(self) -> None:
+        self.sel = (self.sel - 1) % len(self.services)
+
+    def _spike(self) -> None:
+        # randomize a small spike
+        self.cpu = min(0.99, self.cpu + 0.2)
+        self.mem = min(0.99, self.mem + 0.15)
+
+    _KEY_ACTIONS = {
+        ord("a"): _prev_tab,
+        ord("d"): _next_tab,
+        ord("j"): _next_service,
+        ord("k"): _prev_service,
+        ord("r"): _spike,
+    }
 
     def tick(self, dt: float) -> None:
         self.t += dt
         # gentle random walk for cpu/mem
-        import random
         self.cpu = max(0.02, min(0.98, self.cpu + random.uniform(-0.05, 0.05)))
         self.mem = max(0.02, min(0.98, self.mem + random.uniform(-0.03, 0.03)))
         # update sparkline history
         val = max(1, min(50, (self.spark[-1] if self.spark else 20) + random.randint(-4, 5)))
         self.spark.append(val)
-        if len(self.spark) > 50:
-            self.spark.pop(0)
+
+    def _spark_tail(self, k: int) -> list:
+        # deque has no slicing; ``k`` <= 0 keeps the whole history like ``[-0:]``.
+        n = len(self.spark)
+        return list(islice(self.spark, n - k, None)) if 0 < k < n else list(self.spark)
 
     def render(self, term: Terminal, rect: Tuple[int, int, int, int]) -> None:
         x, y, w, h = rect
@@ -287,51 +466,20 @@ class DashboardDemo(DemoBase):
         main = (x, y + header_h, w, main_h)
         footer = (x, y + header_h + main_h, w, footer_h)
 
-        # header: tabs
-        from . import Tabs
-        tabs = Tabs()
-        tabs.set_titles(self.tabs)
-        tabs.set_selected(self.tab_idx)
-        tabs.set_block_title("ratatui-py Dashboard (a/d tabs, j/k move, r spike, q quit)", True)
-        term.draw_tabs(tabs, header)
-
-        # main: left list, right chart
+        # main: left list, right chart; footer: two gauges + sparkline bar
         left, right = split_v(main, 0.38, 0.62, gap=1)
-        lst = UiList()
-        for i, name in enumerate(self.services):
-            lst.append_item(f"{'> ' if i == self.sel else '  '}{name}")
-        lst.set_selected(self.sel)
-        lst.set_block_title("Services", True)
-        term.draw_list(lst, left)
-
-        # Chart of CPU over time
-        points = [(i, v) for i, v in enumerate(self.spark[-min(len(self.spark), max(10, right[2]-4)):])]
-        ch = UiChart()
-        ch.add_line("cpu", [(float(x), float(y)) for x, y in points])
-        ch.set_axes_titles("t", "%")
-        ch.set_block_title("CPU history", True)
-        term.draw_chart(ch, right)
-
-        # footer: two gauges + sparkline bar
         bottom_top, bottom_bot = split_h(footer, 0.5, 0.5, gap=1)
         g_left, g_right = split_v(bottom_top, 0.5, 0.5, gap=1)
-        g1 = UiGauge().ratio(self.cpu).label(f"CPU {int(self.cpu*100)}%")
-        g1.set_block_title("CPU", True)
+        tabs, lst, ch, g1, g2, sp = self._widgets(max(10, right[2]-4), bottom_bot[2]-2)
+        term.draw_tabs(tabs, header)
+        term.draw_list(lst, left)
+        term.draw_chart(ch, right)
         term.draw_gauge(g1, g_left)
-        g2 = UiGauge().ratio(self.mem).label(f"Mem {int(self.mem*100)}%")
-        g2.set_block_title("Memory", True)
         term.draw_gauge(g2, g_right)
-
-        from . import Sparkline
-        sp = Sparkline()
-        sp.set_values(self.spark[-(bottom_bot[2]-2 if bottom_bot[2] > 2 else len(self.spark)):])
-        sp.set_block_title("Throughput", True)
         term.draw_sparkline(sp, bottom_bot)
 
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import Tabs, Sparkline, DrawCmd
         x, y, w, h = rect
-        out = []
         if w < 20 or h < 8:
             p = Paragraph.from_text("Increase terminal size for dashboard…")
             p.set_block_title("Dashboard", True)
@@ -342,37 +490,18 @@ class DashboardDemo(DemoBase):
         header = (x, y, w, header_h)
         main = (x, y + header_h, w, main_h)
         footer = (x, y + header_h + main_h, w, footer_h)
-        tabs = Tabs()
-        tabs.set_titles(self.tabs)
-        tabs.set_selected(self.tab_idx)
-        tabs.set_block_title("ratatui-py Dashboard (a/d tabs, j/k move, r spike, q quit)", True)
-        out.append(DrawCmd.tabs(tabs, header))
         left, right = split_v(main, 0.38, 0.62, gap=1)
-        lst = UiList()
-        for i, name in enumerate(self.services):
-            lst.append_item(f"{'> ' if i == self.sel else '  '}{name}")
-        lst.set_selected(self.sel)
-        lst.set_block_title("Services", True)
-        out.append(DrawCmd.list(lst, left))
-        points = [(i, v) for i, v in enumerate(self.spark[-min(len(self.spark), max(10, right[2]-4)):])]
-        ch = UiChart()
-        ch.add_line("cpu", [(float(x), float(y)) for x, y in points])
-        ch.set_axes_titles("t", "%")
-        ch.set_block_title("CPU history", True)
-        out.append(DrawCmd.chart(ch, right))
         bottom_top, bottom_bot = split_h(footer, 0.5, 0.5, gap=1)
         g_left, g_right = split_v(bottom_top, 0.5, 0.5, gap=1)
-        g1 = UiGauge().ratio(self.cpu).label(f"CPU {int(self.cpu*100)}%")
-        g1.set_block_title("CPU", True)
-        out.append(DrawCmd.gauge(g1, g_left))
-        g2 = UiGauge().ratio(self.mem).label(f"Mem {int(self.mem*100)}%")
-        g2.set_block_title("Memory", True)
-        out.append(DrawCmd.gauge(g2, g_right))
-        sp = Sparkline()
-        sp.set_values(self.spark[-(bottom_bot[2]-2 if bottom_bot[2] > 2 else len(self.spark)):])
-        sp.set_block_title("Throughput", True)
-        out.append(DrawCmd.sparkline(sp, bottom_bot))
-        return out
+        tabs, lst, ch, g1, g2, sp = self._widgets(max(10, right[2]-4), bottom_bot[2]-2)
+        return [
+            DrawCmd.tabs(tabs, header),
+            DrawCmd.list(lst, left),
+            DrawCmd.chart(ch, right),
+            DrawCmd.gauge(g1, g_left),
+            DrawCmd.gauge(g2, g_right),
+            DrawCmd.sparkline(sp, bottom_bot),
+        ]
 
 
 def _load_source(obj) -> str:
@@ -399,17 +528,77 @@ def _load_source(obj) -> str:
     return "<source unavailable>"
 
 
+# Code pane highlighter: one regex pass per line. Strings run to the closing
+# quote or end of line (no escapes), identifiers continue over ASCII word
+# characters, and anything else is a single-character 'other' token.
+_TOKEN_RE = re.compile(
+    r"(?P<com>#.*)"
+    r"|(?P<str>\"[^\"]*\"?|'[^']*'?)"
+    r"|(?P<dec>@[A-Za-z0-9_]*)"
+    r"|(?P<id>[^\W\d][A-Za-z0-9_]*)"
+    r"|(?P<num>\d+)"
+    r"|(?P<other>.)",
+    re.S,
+)
+_KW = frozenset({
+    'def','class','return','if','elif','else','for','while','try','except','finally','from','import','as','with','lambda','True','False','None','yield','in','and','or','not'
+})
+# Token kind -> span style, built once; tokens carry the Style directly.
+_TOKEN_STYLES = {
+    'kw': Style(fg=FFI_COLOR['LightMagenta']),
+    'str': Style(fg=FFI_COLOR['LightYellow']),
+    'com': Style(fg=FFI_COLOR['DarkGray']),
+    'num': Style(fg=FFI_COLOR['LightCyan']),
+    'dec': Style(fg=FFI_COLOR['LightGreen']),
+    'id': Style(),
+    'other': Style(),
+}
+
+
+def _tokenize_lines(lines: List[str]) -> List[List[Tuple[str, Style]]]:
+    """Split source lines into ``(text, style)`` spans for the code pane."""
+    styles, kw_style = _TOKEN_STYLES, _TOKEN_STYLES['kw']
+    out = []
+    for line in lines:
+        row = []
+        for m in _TOKEN_RE.finditer(line):
+            text = m.group()
+            kind = m.lastgroup
+            row.append((text, kw_style if kind == 'id' and text in _KW else styles[kind]))
+        out.append(row)
+    return out
+
+
+@lru_cache(maxsize=32)
+def _cached_source(obj) -> Tuple[List[str], List[List[Tuple[str, Style]]]]:
+    # Source is fixed at runtime: read, split and tokenize once per object.
+    lines = _load_source(obj).splitlines()
+    return lines, _tokenize_lines(lines)
+
+
 def _render_code(term: Terminal, rect: Tuple[int, int, int, int], title: str, code: str, scroll: int) -> None:
     lines = code.splitlines()
     if scroll < 0:
         scroll = 0
-    visible = lines[scroll:]
-    text = "\n".join(visible)
-    p = Paragraph.from_text(text)
+    p = Paragraph.from_text("\n".join(islice(lines, scroll, None)))
     p.set_block_title(title, True)
     term.draw_paragraph(p, rect)
 
 
+def _draw_unbatched(term: Terminal, chrome: list, demo: DemoBase, demo_rect) -> None:
+    # draw_frame failed (e.g. a library without batched draws): draw the hub's
+    # own paragraphs one by one and let the demo render itself.
+    for cmd in chrome:
+        r = cmd.rect
+        term.draw_paragraph(cmd.owner, (r.x, r.y, r.width, r.height))
+    demo.render(term, demo_rect)
+
+
+# Code pane scrollbar rows, pre-encoded.
+_SB_TRACK = "│\n".encode("utf-8")
+_SB_THUMB = "█\n".encode("utf-8")
+
+
 def run_demo_hub() -> None:
     # Enable diagnostics only when explicitly requested
     if os.getenv("RATATUI_PY_DEBUG"):
@@ -452,14 +641,17 @@ def run_demo_hub() -> None:
     code_scroll = 0
     last = time.monotonic()
     frame_budget = max(1, int(1000 / max(1, _FPS)))
-    # Caches to reduce per-frame work
-    src_cache: dict[object, tuple[str, list[str]]] = {}
-    tokens_cache: dict[object, list[list[tuple[str, str]]]] = {}
+    # Caches to reduce per-frame work (source lines/tokens: _cached_source)
     last_title_w = -1
     ptitle = None
     last_nav = {"w": -1, "idx": -1, "names": [], "pnav": None}
+    # Code pane paragraphs only change with the demo, scroll or pane height.
+    last_code = {"key": None, "pcode": None, "pscroll": None}
     last_draw = 0.0
-    last_draw = 0.0
+    # Set by input, demo switches, scrolling and resizes, and whenever the
+    # demo reports that its tick changed something.
+    dirty = True
+    last_frame_key = None
     with Terminal() as term:
         while True:
             now = time.monotonic()
@@ -491,10 +683,12 @@ def run_demo_hub() -> None:
 
             demo = demos[idx]
             demo.tick(dt)
+            frame_key = (width, height, idx)
+            if demo.needs_redraw() or frame_key != last_frame_key or now - last_draw >= _IDLE_REPAINT:
+                dirty = True
 
             # Build title bar spanning full width
             if use_title:
-                from . import Style, FFI_COLOR
                 title_bg = FFI_COLOR.get('DarkGray', 0x40_40_40)
                 title_fg = FFI_COLOR.get('White', 0xFF_FF_FF)
                 max_w = title_rect[2]
@@ -523,7 +717,6 @@ def run_demo_hub() -> None:
 
             # Build top navbar as contiguous blocks: inactive light bg, active vivid bg
             if use_nav:
-                from . import Style, FFI_COLOR
                 accent = FFI_COLOR.get('LightBlue', 0x00_00_FF)
                 bg_inactive = FFI_COLOR.get('Gray', 0x80_80_80)
                 fg_active = FFI_COLOR.get('Black', 0x00_00_00)
@@ -562,25 +755,17 @@ def run_demo_hub() -> None:
 
             # Build code pane content (cached source and tokenized lines)
             if _NO_CODE:
-                demo_cmds = demo.render_cmds(demo_rect)
-                if demo_cmds:
-                    cmds = []
-                    if title_cmd is not None:
-                        cmds.append(title_cmd)
-                    if nav_cmd is not None:
-                        cmds.append(nav_cmd)
-                    cmds.extend(demo_cmds)
-                    _sync_start(); ok = term.draw_frame(cmds); _sync_end()
-                    if not ok:
-                        demo.render(term, demo_rect)
-                else:
-                    if use_title:
-                        _sync_start(); term.draw_paragraph(ptitle, title_rect); _sync_end()
-                    if use_nav:
-                        _sync_start(); term.draw_paragraph(pnav, nav_rect); _sync_end()
-                    _sync_start(); demo.render(term, demo_rect); _sync_end()
+                if dirty:
+                    chrome = [c for c in (title_cmd, nav_cmd) if c is not None]
+                    _sync_start()
+                    if not term.draw_frame(chrome + demo.render_cmds(demo_rect)):
+                        _draw_unbatched(term, chrome, demo, demo_rect)
+                    _sync_end()
+                    dirty, last_frame_key, last_draw = False, frame_key, now
                 # Input handling (fast path) and lightweight nav
-                evt = term.next_event(min(20, frame_budget))
+                evt = term.next_event(demo.wait_ms(min(20, frame_budget)))
+                if evt:
+                    dirty = True
                 if evt and evt.get("kind") == "key":
                     code = int(evt.get("code", 0))
                     ch = int(evt.get("ch", 0))
@@ -602,139 +787,64 @@ def run_demo_hub() -> None:
                 # Skip the rest of the code-pane path
                 continue
             src_key = getattr(demo, 'source_obj', None) or demo.__class__
-            if src_key not in src_cache:
-                src = _load_source(src_key)
-                lines = src.splitlines()
-                src_cache[src_key] = (src, lines)
-                # Tokenize once for all frames
-                kw = {
-                    'def','class','return','if','elif','else','for','while','try','except','finally','from','import','as','with','lambda','True','False','None','yield','in','and','or','not'
-                }
-                import string
-                ident_chars = set(string.ascii_letters + string.digits + '_')
-                toks_all = []
-                for line in lines:
-                    i = 0; n = len(line); in_str = False; sd = ''
-                    row = []
-                    while i < n:
-                        ch = line[i]
-                        if in_str:
-                            j = i
-                            while j < n and line[j] != sd:
-                                j += 1
-                            j = min(n, j+1)
-                            row.append((line[i:j], 'str'))
-                            i = j; in_str = False; continue
-                        if ch == '#':
-                            row.append((line[i:], 'com'))
-                            i = n; break
-                        if ch in ('"', "'"):
-                            in_str = True; sd = ch; continue
-                        if ch == '@':
-                            j = i+1
-                            while j < n and line[j] in ident_chars:
-                                j += 1
-                            row.append((line[i:j], 'dec'))
-                            i = j; continue
-                        if ch.isalpha() or ch == '_':
-                            j = i+1
-                            while j < n and line[j] in ident_chars:
-                                j += 1
-                            word = line[i:j]
-                            row.append((word, 'kw' if word in kw else 'id'))
-                            i = j; continue
-                        if ch.isdigit():
-                            j = i+1
-                            while j < n and line[j].isdigit():
-                                j += 1
-                            row.append((line[i:j], 'num'))
-                            i = j; continue
-                        row.append((ch, 'other'))
-                        i += 1
-                    toks_all.append(row)
-                tokens_cache[src_key] = toks_all
-            src, code_lines = src_cache[src_key]
+            code_lines, toks_all = _cached_source(src_key)
             # determine visible slice and scrollbar
             max_vis = max(1, code_rect[3] - 2)
             code_scroll = max(0, min(code_scroll, max(0, len(code_lines) - max_vis)))
-            pcode = Paragraph.new_empty()
-            from . import Style, FFI_COLOR
-            styles = {
-                'kw': Style(fg=FFI_COLOR['LightMagenta']),
-                'str': Style(fg=FFI_COLOR['LightYellow']),
-                'com': Style(fg=FFI_COLOR['DarkGray']),
-                'num': Style(fg=FFI_COLOR['LightCyan']),
-                'dec': Style(fg=FFI_COLOR['LightGreen']),
-                'id': Style(),
-                'other': Style(),
-            }
-            toks_all = tokens_cache[src_key]
-            start = code_scroll
-            end = min(len(code_lines), code_scroll + max_vis)
-            for line_idx in range(start, end):
-                for t, kind in toks_all[line_idx]:
-                    pcode.append_span(t, styles.get(kind) or Style())
-                pcode.line_break()
-            # build a simple ASCII scrollbar on the far-right of code pane
-            sb_cmd = []
-            total = max(1, len(code_lines))
-            bar_h = max(1, code_rect[3])
-            # position of thumb within bar
-            thumb_h = max(1, int(bar_h * min(1.0, max_vis / total)))
-            thumb_y = int((bar_h - thumb_h) * (code_scroll / max(1, total - max_vis))) if total > max_vis else 0
-            sb_lines = []
-            for j in range(bar_h):
-                sb_lines.append('█' if thumb_y <= j < thumb_y + thumb_h else '│')
             sb_rect = (code_rect[0] + max(0, code_rect[2]-1), code_rect[1], 1, code_rect[3])
-            pscroll = Paragraph.from_text("\n".join(sb_lines))
-            pcode.set_block_title(f"{demo.name} – Source", True)
-
-            # If the demo provides batched commands, render both panes in one frame.
-            # Otherwise, draw code first and let the demo render itself.
-            demo_cmds = demo.render_cmds(demo_rect)
-            # Optionally coalesce draws in static mode to avoid visible flashing
-            if _STATIC and (now - last_draw) < 0.10:
-                evt = term.next_event(min(20, frame_budget))
-                if evt and evt.get("kind") == "key":
-                    # process below as usual
-                    pass
-                else:
-                    # Skip drawing this cycle
-                    continue
-
-            if demo_cmds:
-                cmds = []
-                if title_cmd is not None:
-                    cmds.append(title_cmd)
-                if nav_cmd is not None:
-                    cmds.append(nav_cmd)
-                cmds.extend([DrawCmd.paragraph(pcode, code_rect), DrawCmd.paragraph(pscroll, sb_rect)])
-                cmds.extend(demo_cmds)
-                _sync_start()
-                ok = term.draw_frame(cmds)
-                _sync_end()
-                if not ok:
-                    demo.render(term, demo_rect)
+            code_key = (idx, code_scroll, code_rect[3])
+            if last_code["key"] != code_key:
+                pcode = Paragraph.new_empty()
+                start = code_scroll
+                end = min(len(code_lines), code_scroll + max_vis)
+                # All visible lines go across in one append_lines_spans call.
+                pcode.append_lines_spans(toks_all[start:end])
+                # build a simple ASCII scrollbar on the far-right of code pane
+                total = max(1, len(code_lines))
+                bar_h = max(1, code_rect[3])
+                # position of thumb within bar
+                thumb_h = max(1, int(bar_h * min(1.0, max_vis / total)))
+                thumb_y = int((bar_h - thumb_h) * (code_scroll / max(1, total - max_vis))) if total > max_vis else 0
+                # Encoded once as repeated UTF-8 rows; identical bars (same
+                # height and thumb) share one paragraph across demos.
+                sb_text = _SB_TRACK * thumb_y + _SB_THUMB * thumb_h + _SB_TRACK * (bar_h - thumb_y - thumb_h)
+                pscroll = Paragraph.from_text_cached(sb_text[:-1])
+                pcode.set_block_title(f"{demo.name} – Source", True)
+                last_code.update({"key": code_key, "pcode": pcode, "pscroll": pscroll})
             else:
-                # Bracket the entire multi-call frame in one synchronized update
+                pcode, pscroll = last_code["pcode"], last_code["pscroll"]
+
+            if dirty:
+                demo_cmds = demo.render_cmds(demo_rect)
+                # Optionally coalesce draws in static mode to avoid visible flashing
+                if _STATIC and (now - last_draw) < 0.10:
+                    evt = term.next_event(min(20, frame_budget))
+                    if evt and evt.get("kind") == "key":
+                        # process below as usual
+                        pass
+                    else:
+                        # Skip drawing this cycle
+                        continue
+
+                # Title, navbar, code pane, scrollbar and demo go out as one
+                # draw_frame call, bracketed in one synchronized update.
+                chrome = [c for c in (title_cmd, nav_cmd) if c is not None]
+                chrome += [DrawCmd.paragraph(pcode, code_rect), DrawCmd.paragraph(pscroll, sb_rect)]
                 _sync_start()
-                if use_title:
-                    term.draw_paragraph(ptitle, title_rect)
-                if use_nav:
-                    term.draw_paragraph(pnav, nav_rect)
-                term.draw_paragraph(pcode, code_rect)
-                demo.render(term, demo_rect)
+                if not term.draw_frame(chrome + demo_cmds):
+                    _draw_unbatched(term, chrome, demo, demo_rect)
                 _sync_end()
-            last_draw = now
+                dirty, last_frame_key, last_draw = False, frame_key, now
 
             # input handling with event drain to avoid backlog
-            evt = term.next_event(min(20, frame_budget))
+            evt = term.next_event(demo.wait_ms(min(20, frame_budget)))
             if _REC and not evt:
                 now3 = time.monotonic()
                 sleep_ms = frame_budget - int((now3 - now) * 1000)
                 if sleep_ms > 0:
                     time.sleep(sleep_ms / 1000.0)
             if evt:
+                dirty = True
                 if evt.get("kind") == "key":
                     nav_delta = 0
                     scroll_delta = 0
@@ -867,10 +977,10 @@ def run_dashboard() -> None:
                     continue
                 # Prefer batched frame if available
                 cmds = demo.render_cmds((0, 0, w, h))
-                if cmds:
-                    _sync_start(); term.draw_frame(cmds); _sync_end()
-                else:
-                    _sync_start(); demo.render(term, (0, 0, w, h)); _sync_end()
+                _sync_start()
+                if not (cmds and term.draw_frame(cmds)):
+                    demo.render(term, (0, 0, w, h))
+                _sync_end()
                 last_draw = now
                 # Idle pacing only if we didn't process input this loop
                 if _REC and not pre_evt:
@@ -894,48 +1004,38 @@ class ChartPlaygroundDemo(DemoBase):
         self.zoom = 1.0
         self.speed = 1.0
 
-    def on_key(self, evt: dict) -> None:
-        if evt.get("kind") != "key":
-            return
-        ch = evt.get("ch", 0)
-        if not ch:
-            return
-        c = chr(ch).lower()
-        if c == '+':
-            self.zoom = min(4.0, self.zoom * 1.25)
-        elif c == '-':
-            self.zoom = max(0.25, self.zoom * 0.8)
-        elif c == 'f':
-            self.speed = min(8.0, self.speed * 1.4)
-        elif c == 's':
-            self.speed = max(0.125, self.speed * 0.7)
+    def _zoom_in(self) -> None:
+        self.zoom = min(4.0, self.zoom * 1.25)
+
+    def _zoom_out(self) -> None:
+        self.zoom = max(0.25, self.zoom * 0.8)
+
+    def _faster(self) -> None:
+        self.speed = min(8.0, self.speed * 1.4)
+
+    def _slower(self) -> None:
+        self.speed = max(0.125, self.speed * 0.7)
+
+    _KEY_ACTIONS = {ord("+"): _zoom_in, ord("-"): _zoom_out, ord("f"): _faster, ord("s"): _slower}
 
     def tick(self, dt: float) -> None:
         self.t += dt * self.speed
 
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import Chart, Style, FFI_COLOR, DrawCmd
         x, y, w, h = rect
-        ch = Chart()
-        n = max(20, w - 4)
-        import math
-        zoom = max(0.001, self.zoom)
-        pts1 = [( (i/n)*(8.0/zoom), math.sin((i/n)*(8.0/zoom) + self.t)) for i in range(n)]
-        pts2 = [( (i/n)*(8.0/zoom), math.cos((i/n)*(8.0/zoom) * 1.2 + self.t*0.8)) for i in range(n)]
-        ch.add_line("sin", pts1, Style(fg=FFI_COLOR["LightCyan"]))
-        ch.add_line("cos", pts2, Style(fg=FFI_COLOR["LightMagenta"]))
-        ch.set_axes_titles("t", "val")
-        ch.set_block_title("Chart Playground [+/- zoom, f/s speed, q quit]", True)
-        return [DrawCmd.chart(ch, rect)]
-
-    def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import Chart, Style, FFI_COLOR, DrawCmd
-        x, y, w, h = rect
-        ch = Chart()
+        ch = UiChart()
         n = max(20, w - 4)
-        import math
-        pts1 = [( (i/n)*(8.0/self.zoom), math.sin((i/n)*(8.0/self.zoom) + self.t)) for i in range(n)]
-        pts2 = [( (i/n)*(8.0/self.zoom), math.cos((i/n)*(8.0/self.zoom) * 1.2 + self.t*0.8)) for i in range(n)]
+        span = 8.0 / max(0.001, self.zoom)
+        np = _numpy()
+        if np is not None:
+            # (n, 2) float64 arrays go to Chart.add_line without per-point boxing.
+            xs = np.arange(n, dtype=np.float64) * (span / n)
+            pts1 = np.column_stack((xs, np.sin(xs + self.t)))
+            pts2 = np.column_stack((xs, np.cos(xs * 1.2 + self.t * 0.8)))
+        else:
+            xs = [(i / n) * span for i in range(n)]
+            pts1 = [(v, math.sin(v + self.t)) for v in xs]
+            pts2 = [(v, math.cos(v * 1.2 + self.t * 0.8)) for v in xs]
         ch.add_line("sin", pts1, Style(fg=FFI_COLOR["LightCyan"]))
         ch.add_line("cos", pts2, Style(fg=FFI_COLOR["LightMagenta"]))
         ch.set_axes_titles("t", "val")
@@ -949,10 +1049,11 @@ class LogViewerDemo(DemoBase):
     source_obj = None
 
     def __init__(self) -> None:
-        from . import List
-        self.lst = List()
+        self.lst = UiList()
         self.sel = None
-        self.buf: list[str] = []
+        # Log lines plus their lower-cased twins for the case-insensitive filter.
+        self.buf: deque[str] = deque(maxlen=500)
+        self.buf_lower: deque[str] = deque(maxlen=500)
         self.q = ""
         self.t = 0.0
 
@@ -972,24 +1073,23 @@ class LogViewerDemo(DemoBase):
 
     def tick(self, dt: float) -> None:
         self.t += dt
-        import random
         if self.t >= 0.1:
             self.t = 0.0
             lvl = random.choice(["INFO", "WARN", "DEBUG", "ERROR"]) 
             msg = random.choice(["started", "connected", "timeout", "retry", "ok"]) 
             line = f"{lvl} service={random.randint(1,4)} msg={msg} id={random.randint(1000,9999)}"
             self.buf.append(line)
-            if len(self.buf) > 500:
-                self.buf.pop(0)
+            self.buf_lower.append(line.lower())
 
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import List, Paragraph, DrawCmd
         x, y, w, h = rect
         top, bot = split_h(rect, 1.0, 3.0, gap=1)
-        rows = [s for s in self.buf if self.q.lower() in s.lower()]
-        lst = List()
-        for s in rows[-(h-4):]:
-            lst.append_item(s)
+        ql = self.q.lower()
+        # Only the last h-4 matches are shown; a bounded deque keeps just those.
+        k = h - 4
+        rows = (s for s, sl in zip(self.buf, self.buf_lower) if ql in sl) if ql else self.buf
+        lst = UiList()
+        lst.extend_items(deque(rows, maxlen=k) if k > 0 else rows)
         lst.set_block_title("Logs", True)
         p = Paragraph.from_text(f"/ {self.q}\nType to filter. Backspace deletes. q to quit")
         p.set_block_title("Search", True)
@@ -1017,7 +1117,6 @@ class MarkdownViewerDemo(DemoBase):
         ]
         # Try to load README.md; fall back to sample
         try:
-            import pathlib
             p = pathlib.Path(__file__).resolve().parents[2] / "README.md"
             if p.exists():
                 text = p.read_text(encoding="utf-8", errors="replace")
@@ -1027,26 +1126,26 @@ class MarkdownViewerDemo(DemoBase):
         except Exception:
             self.lines = sample
         self.off = 0
+        # (offset, height) -> Paragraph; the text only changes on scroll/resize.
+        self._cache: tuple = (None, None)
 
-    def on_key(self, evt: dict) -> None:
-        if evt.get("kind") != "key":
-            return
-        ch = evt.get("ch", 0)
-        if not ch:
-            return
-        c = chr(ch).lower()
-        if c == 'j':
-            self.off = min(max(0, len(self.lines) - 1), self.off + 1)
-        elif c == 'k':
-            self.off = max(0, self.off - 1)
+    def _down(self) -> None:
+        self.off = min(max(0, len(self.lines) - 1), self.off + 1)
+
+    def _up(self) -> None:
+        self.off = max(0, self.off - 1)
+
+    _KEY_ACTIONS = {ord("j"): _down, ord("k"): _up}
 
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import Paragraph, DrawCmd
         x, y, w, h = rect
-        view = self.lines[self.off:self.off+max(1, h-2)]
-        p = Paragraph.from_text("\n".join(view))
-        p.set_block_title(f"Markdown (lines {self.off+1}-{self.off+len(view)} / {len(self.lines)})", True)
-        return [DrawCmd.paragraph(p, rect)]
+        key = (self.off, h)
+        if self._cache[0] != key:
+            view = self.lines[self.off:self.off+max(1, h-2)]
+            p = Paragraph.from_text("\n".join(view))
+            p.set_block_title(f"Markdown (lines {self.off+1}-{self.off+len(view)} / {len(self.lines)})", True)
+            self._cache = (key, p)
+        return [DrawCmd.paragraph(self._cache[1], rect)]
 
 
 class SpectrumAnalyzerDemo(DemoBase):
@@ -1054,28 +1153,39 @@ class SpectrumAnalyzerDemo(DemoBase):
     desc = "Synthetic audio spectrum (bars)"
     source_obj = None
 
+    # (amplitude, frequency) of the synthetic peaks
+    peaks = ((0.1, 8.0), (0.2, 4.5), (0.35, 6.2), (0.55, 7.0))
+
     def __init__(self) -> None:
-        import math
         self.t = 0.0
         self.n = 48
         self.vals = [0] * self.n
         self.decay = 0.85
+        np = _numpy()
+        if np is not None:
+            # Bars x peaks grid, evaluated in one np.sin per tick.
+            # uint64 matches the FFI, so BarChart.set_values reads it in place.
+            self.vals = np.zeros(self.n, dtype=np.uint64)
+            self._x = np.linspace(0.0, 1.0, self.n)[:, None]
+            self._amps = np.array([a for a, _ in self.peaks])[None, :]
+            self._freqs = np.array([f for _, f in self.peaks])[None, :]
 
     def tick(self, dt: float) -> None:
-        import math, random
         self.t += dt
+        np = _numpy()
+        if np is not None:
+            v = (self._amps * np.maximum(0.0, np.sin(self._x * self._freqs + self.t * 2.0))).sum(axis=1)
+            v += 0.05 * np.random.random(self.n)
+            new = (np.maximum(0.0, v) * 40).astype(np.uint64)
+            # decay / peak-hold style
+            self.vals = np.maximum((self.vals * self.decay).astype(np.uint64), new)
+            return
         # generate a few sine peaks + noise
-        peaks = [
-            (0.1, 8.0),
-            (0.2, 4.5),
-            (0.35, 6.2),
-            (0.55, 7.0),
-        ]
         new = []
         for i in range(self.n):
             x = i / max(1, self.n - 1)
             v = 0.0
-            for a, f in peaks:
+            for a, f in self.peaks:
                 v += a * max(0.0, math.sin((x * f + self.t * 2.0)))
             v += 0.05 * random.random()
             new.append(int(max(0.0, v) * 40))
@@ -1083,7 +1193,6 @@ class SpectrumAnalyzerDemo(DemoBase):
         self.vals = [max(int(self.vals[i] * self.decay), new[i]) for i in range(self.n)]
 
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import BarChart, DrawCmd
         b = BarChart()
         b.set_values(self.vals)
         b.set_labels([""] * len(self.vals))
@@ -1097,30 +1206,37 @@ class FileManagerDemo(DemoBase):
     source_obj = None
 
     def __init__(self) -> None:
-        import os
         self.left_dir = os.getcwd()
         self.right_dir = os.getcwd()
         self.left_sel = 0
         self.right_sel = 0
         self.focus = 'left'
+        self._dir_cache: dict[str, tuple[int, list[str]]] = {}
+        self._panes: dict[str, tuple[list[str], str, UiList]] = {}
 
     def _listdir(self, path: str) -> list[str]:
-        import os
+        # Listings are cached per directory and reused until its mtime changes
+        # (entries added, removed or renamed), so steady frames skip the scan.
         try:
-            entries = os.listdir(path)
-        except Exception:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
             return []
-        entries.sort(key=str.lower)
+        cached = self._dir_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            with os.scandir(path) as it:
+                # DirEntry.is_dir() answers from the directory read itself and
+                # only stats symlinks, which it follows like os.path.isdir.
+                entries = [(e.name, e.is_dir()) for e in it]
+        except OSError:
+            return []
+        entries.sort(key=lambda e: e[0].lower())
         # show parent and directories first
         out = [".."]
-        for e in entries:
-            p = os.path.join(path, e)
-            if os.path.isdir(p):
-                out.append(e + "/")
-        for e in entries:
-            p = os.path.join(path, e)
-            if not os.path.isdir(p):
-                out.append(e)
+        out.extend(name + "/" for name, is_dir in entries if is_dir)
+        out.extend(name for name, is_dir in entries if not is_dir)
+        self._dir_cache[path] = (mtime, out)
         return out
 
     def on_key(self, evt: dict) -> None:
@@ -1128,65 +1244,71 @@ class FileManagerDemo(DemoBase):
             return
         code = evt.get("code", 0)
         ch = evt.get("ch", 0)
-        import os
         if code in (2,):  # left
             self.focus = 'left'
-            return
-        if code in (3,):  # right
+        elif code in (3,):  # right
             self.focus = 'right'
-            return
-        if ch:
-            c = chr(ch).lower()
-            if c == 'j':
-                if self.focus == 'left':
-                    self.left_sel += 1
-                else:
-                    self.right_sel += 1
-            elif c == 'k':
-                if self.focus == 'left':
-                    self.left_sel = max(0, self.left_sel - 1)
-                else:
-                    self.right_sel = max(0, self.right_sel - 1)
-            elif c == '\r':
-                # enter directory
-                if self.focus == 'left':
-                    items = self._listdir(self.left_dir)
-                    idx = min(self.left_sel, max(0, len(items)-1))
-                    target = items[idx] if items else None
-                    if target:
-                        path = os.path.normpath(os.path.join(self.left_dir, target))
-                        if target == "..":
-                            self.left_dir = os.path.dirname(self.left_dir)
-                            self.left_sel = 0
-                        elif os.path.isdir(path):
-                            self.left_dir = path
-                            self.left_sel = 0
-                else:
-                    items = self._listdir(self.right_dir)
-                    idx = min(self.right_sel, max(0, len(items)-1))
-                    target = items[idx] if items else None
-                    if target:
-                        path = os.path.normpath(os.path.join(self.right_dir, target))
-                        if target == "..":
-                            self.right_dir = os.path.dirname(self.right_dir)
-                            self.right_sel = 0
-                        elif os.path.isdir(path):
-                            self.right_dir = path
-                            self.right_sel = 0
+        elif ch:
+            self._char_action(ch)
+
+    def _down(self) -> None:
+        if self.focus == 'left':
+            self.left_sel += 1
+        else:
+            self.right_sel += 1
+
+    def _up(self) -> None:
+        if self.focus == 'left':
+            self.left_sel = max(0, self.left_sel - 1)
+        else:
+            self.right_sel = max(0, self.right_sel - 1)
+
+    def _enter(self) -> None:
+        # enter directory
+        if self.focus == 'left':
+            items = self._listdir(self.left_dir)
+            idx = min(self.left_sel, max(0, len(items)-1))
+            target = items[idx] if items else None
+            if target:
+                path = os.path.normpath(os.path.join(self.left_dir, target))
+                if target == "..":
+                    self.left_dir = os.path.dirname(self.left_dir)
+                    self.left_sel = 0
+                elif os.path.isdir(path):
+                    self.left_dir = path
+                    self.left_sel = 0
+        else:
+            items = self._listdir(self.right_dir)
+            idx = min(self.right_sel, max(0, len(items)-1))
+            target = items[idx] if items else None
+            if target:
+                path = os.path.normpath(os.path.join(self.right_dir, target))
+                if target == "..":
+                    self.right_dir = os.path.dirname(self.right_dir)
+                    self.right_sel = 0
+                elif os.path.isdir(path):
+                    self.right_dir = path
+                    self.right_sel = 0
+
+    _KEY_ACTIONS = {ord("j"): _down, ord("k"): _up, ord("\r"): _enter}
+
+    def _pane(self, side: str, items: list[str], title: str, sel: int) -> UiList:
+        # Each pane keeps its List until the listing (a new object from
+        # _listdir) or directory changes; moving the selection is one call.
+        cached = self._panes.get(side)
+        if cached is None or cached[0] is not items or cached[1] != title:
+            lst = UiList()
+            lst.extend_items(items)
+            lst.set_block_title(title, True)
+            cached = self._panes[side] = (items, title, lst)
+        lst = cached[2]
+        lst.set_selected(min(sel, max(0, len(items)-1)))
+        return lst
 
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import List, DrawCmd
         left, right = split_v(rect, 0.5, 0.5, gap=1)
-        litems = self._listdir(self.left_dir)
-        ritems = self._listdir(self.right_dir)
-        l = List()
-        for s in litems: l.append_item(s)
-        r = List()
-        for s in ritems: r.append_item(s)
-        l.set_selected(min(self.left_sel, max(0, len(litems)-1)))
-        r.set_selected(min(self.right_sel, max(0, len(ritems)-1)))
-        l.set_block_title(f"{self.left_dir}  (j/k, Enter, ← focus)", True)
-        r.set_block_title(f"{self.right_dir}  (j/k, Enter, → focus)", True)
+        l = self._pane("left", self._listdir(self.left_dir), f"{self.left_dir}  (j/k, Enter, ← focus)", self.left_sel)
+        r = self._pane("right", self._listdir(self.right_dir), f"{self.right_dir}  (j/k, Enter, → focus)", self.right_sel)
         return [DrawCmd.list(l, left), DrawCmd.list(r, right)]
 
 
@@ -1196,8 +1318,16 @@ class ChatDemo(DemoBase):
     source_obj = None
 
     def __init__(self) -> None:
-        self.msgs: list[str] = ["Welcome to ratatui-py chat! (Enter sends, q quits)"]
+        self.msgs: deque[str] = deque(["Welcome to ratatui-py chat! (Enter sends, q quits)"], maxlen=200)
         self.input = ""
+        # Widgets are kept across frames and rebuilt only when their content
+        # changes: the list per (messages sent, first visible), the input box
+        # per text.
+        self._sent = 0
+        self._lst: Optional[UiList] = None
+        self._lst_key = None
+        self._inp: Optional[Paragraph] = None
+        self._inp_text = None
 
     def on_key(self, evt: dict) -> None:
         if evt.get("kind") != "key":
@@ -1209,7 +1339,7 @@ class ChatDemo(DemoBase):
         if c == '\r':
             if self.input.strip():
                 self.msgs.append(self.input)
-                if len(self.msgs) > 200: self.msgs.pop(0)
+                self._sent += 1
                 self.input = ""
         elif c == '\b' or ord(c) == 127:
             self.input = self.input[:-1]
@@ -1217,15 +1347,19 @@ class ChatDemo(DemoBase):
             self.input += c
 
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import List, Paragraph, DrawCmd
         main, inp = split_h(rect, 1.0, 3.0, gap=1)
-        lst = List()
         start = max(0, len(self.msgs) - (main[3] - 2))
-        for s in self.msgs[start:]: lst.append_item(s)
-        lst.set_block_title("Messages", True)
-        p = Paragraph.from_text(self.input)
-        p.set_block_title("Input", True)
-        return [DrawCmd.list(lst, main), DrawCmd.paragraph(p, inp)]
+        key = (self._sent, start)
+        if self._lst_key != key:
+            self._lst = UiList()
+            self._lst.extend_items(islice(self.msgs, start, None))
+            self._lst.set_block_title("Messages", True)
+            self._lst_key = key
+        if self._inp_text != self.input:
+            self._inp = Paragraph.from_text(self.input)
+            self._inp.set_block_title("Input", True)
+            self._inp_text = self.input
+        return [DrawCmd.list(self._lst, main), DrawCmd.paragraph(self._inp, inp)]
 
 
 class PlasmaDemo(DemoBase):
@@ -1239,32 +1373,42 @@ class PlasmaDemo(DemoBase):
         self.speed = 1.0
         # simple ASCII gradient (light to dark)
         self.grad = " .:-=+*#%@"
+        np = _numpy()
+        self._lut = np.frombuffer(self.grad.encode("ascii"), dtype=np.uint8) if np is not None else None
 
-    def on_key(self, evt: dict) -> None:
-        if evt.get("kind") != "key":
-            return
-        ch = evt.get("ch", 0)
-        if not ch:
-            return
-        c = chr(ch).lower()
-        if c == 'p':
-            self.paused = not self.paused
-        elif c == '+':
-            self.speed = min(5.0, self.speed * 1.25)
-        elif c == '-':
-            self.speed = max(0.2, self.speed * 0.8)
+    def _toggle_pause(self) -> None:
+        self.paused = not self.paused
+
+    _KEY_ACTIONS = {ord("p"): _toggle_pause, **_SPEED_KEYS}
 
     def tick(self, dt: float) -> None:
         if not self.paused:
             self.t += dt * self.speed
 
+    def needs_redraw(self) -> bool:
+        return not self.paused
+
+    def wait_ms(self, frame_ms: int) -> int:
+        return _IDLE_WAIT_MS if self.paused else frame_ms
+
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import Paragraph
         x, y, w, h = rect
         if w <= 0 or h <= 0:
             return []
-        import math
         # plasma based on combined sines in screen space + time
+        np = _numpy()
+        if np is not None:
+            # Same sums as the loop below, over a row and a column vector
+            # broadcast to the whole frame.
+            xf = np.arange(w) / max(1, w - 1)
+            yf = (np.arange(h) / max(1, h - 1))[:, None]
+            v = np.sin((xf * 6.283) + self.t)
+            v = v + np.sin((yf * 6.283) * 1.5 - self.t * 0.8)
+            v += np.sin((xf + yf) * 6.283 * 0.7 + self.t * 0.5)
+            idx = ((v / 3.0 + 1.0) * 0.5 * (len(self.grad) - 1)).astype(np.intp)
+            p = Paragraph.from_text(_lut_rows(np, self._lut, idx))
+            p.set_block_title("Plasma (p pause, +/- speed)", True)
+            return [DrawCmd.paragraph(p, rect)]
         lines = []
         for j in range(h):
             row = []
@@ -1303,6 +1447,20 @@ class MandelbrotDemo(DemoBase):
             " .,:;ox%#@",
         ]
         self.grad_idx = 0
+        self._it_lut = (None, None)
+
+    def _iter_lut(self, np):
+        # Escape count -> character byte for the current palette and
+        # max_iter, built once per change; points inside the set get ' '.
+        key = (self.grad_idx, self.max_iter)
+        if self._it_lut[0] != key:
+            grad = self.grad_sets[self.grad_idx]
+            gmax = len(grad) - 1
+            chars = np.frombuffer((grad + " ").encode("ascii"), dtype=np.uint8)
+            idx = (np.arange(self.max_iter + 1) / self.max_iter * gmax).astype(np.intp)
+            idx[self.max_iter] = gmax + 1
+            self._it_lut = (key, chars[idx])
+        return self._it_lut[1]
 
     def on_key(self, evt: dict) -> None:
         if evt.get("kind") != "key":
@@ -1310,17 +1468,7 @@ class MandelbrotDemo(DemoBase):
         code = evt.get("code", 0)
         ch = evt.get("ch", 0)
         if ch:
-            c = chr(ch).lower()
-            if c == '+':
-                self.scale *= 0.8
-            elif c == '-':
-                self.scale *= 1.25
-            elif c == 'i':
-                self.max_iter = min(500, self.max_iter + 10)
-            elif c == 'k':
-                self.max_iter = max(20, self.max_iter - 10)
-            elif c == 'c':
-                self.grad_idx = (self.grad_idx + 1) % len(self.grad_sets)
+            self._char_action(ch)
         # pan with arrows
         step = self.scale * 0.2
         if code == 2:  # left
@@ -1332,8 +1480,30 @@ class MandelbrotDemo(DemoBase):
         elif code == 5:  # down
             self.cy += step
 
+    def _zoom_in(self) -> None:
+        self.scale *= 0.8
+
+    def _zoom_out(self) -> None:
+        self.scale *= 1.25
+
+    def _more_iter(self) -> None:
+        self.max_iter = min(500, self.max_iter + 10)
+
+    def _fewer_iter(self) -> None:
+        self.max_iter = max(20, self.max_iter - 10)
+
+    def _next_gradient(self) -> None:
+        self.grad_idx = (self.grad_idx + 1) % len(self.grad_sets)
+
+    _KEY_ACTIONS = {
+        ord("+"): _zoom_in,
+        ord("-"): _zoom_out,
+        ord("i"): _more_iter,
+        ord("k"): _fewer_iter,
+        ord("c"): _next_gradient,
+    }
+
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import Paragraph, DrawCmd
         x, y, w, h = rect
         if w <= 0 or h <= 0:
             return []
@@ -1347,12 +1517,26 @@ class MandelbrotDemo(DemoBase):
         ymax = self.cy + half_h
         grad = self.grad_sets[self.grad_idx]
         gmax = len(grad) - 1
+        np = _numpy()
+        if np is not None:
+            # Pixel -> plane coordinates once per frame rather than per pixel.
+            xs = xmin + (xmax - xmin) * (np.arange(w) / max(1, w - 1))
+            ys = ymin + (ymax - ymin) * (np.arange(h) / max(1, h - 1))
+            kernel = _mandel_kernel()
+            if kernel is not None:
+                its = np.empty((h, w), dtype=np.uint16)
+                kernel(xs, ys, self.max_iter, its)
+            else:
+                its = _mandel_np(np, xs, ys, self.max_iter)
+            p = Paragraph.from_text(_lut_rows(np, self._iter_lut(np), its))
+            p.set_block_title(f"Mandelbrot (+/- zoom, arrows pan, i/k iters={self.max_iter}, c palette)", True)
+            return [DrawCmd.paragraph(p, rect)]
+        xs = [xmin + (xmax - xmin) * (i / max(1, w - 1)) for i in range(w)]
         lines = []
         for j in range(h):
             cy = ymin + (ymax - ymin) * (j / max(1, h - 1))
             row = []
-            for i in range(w):
-                cx = xmin + (xmax - xmin) * (i / max(1, w - 1))
+            for cx in xs:
                 zx = 0.0
                 zy = 0.0
                 it = 0
@@ -1393,12 +1577,10 @@ class FireDemo(DemoBase):
         pass
 
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import Paragraph, DrawCmd
         x, y, w, h = rect
         if w <= 0 or h <= 0:
             return []
         self._ensure(w, h)
-        import random
         # Seed bottom row with noisy high values
         base = 200
         row = (h-1)*w
@@ -1446,21 +1628,12 @@ class TunnelDemo(DemoBase):
         self.speed = 1.0
         self.grad = " .:-=+*#%@"
 
-    def on_key(self, evt: dict) -> None:
-        if evt.get("kind") != "key":
-            return
-        ch = evt.get("ch", 0)
-        if not ch:
-            return
-        c = chr(ch).lower()
-        if c == '+': self.speed = min(5.0, self.speed*1.25)
-        elif c == '-': self.speed = max(0.2, self.speed*0.8)
+    _KEY_ACTIONS = _SPEED_KEYS
 
     def tick(self, dt: float) -> None:
         self.t += dt * self.speed
 
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import Paragraph, DrawCmd
         x, y, w, h = rect
         if w <= 0 or h <= 0:
             return []
@@ -1468,7 +1641,6 @@ class TunnelDemo(DemoBase):
         cy = (h-1)/2
         g = self.grad
         gm = len(g)-1
-        import math
         lines = []
         for j in range(h):
             row = []
@@ -1499,23 +1671,15 @@ class CubeDemo(DemoBase):
         self.t = 0.0
         self.speed = 1.0
 
-    def on_key(self, evt: dict) -> None:
-        if evt.get("kind") != "key": return
-        ch = evt.get("ch", 0)
-        if not ch: return
-        c = chr(ch).lower()
-        if c == '+': self.speed = min(5.0, self.speed*1.25)
-        elif c == '-': self.speed = max(0.2, self.speed*0.8)
+    _KEY_ACTIONS = _SPEED_KEYS
 
     def tick(self, dt: float) -> None:
         self.t += dt * self.speed
 
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import Paragraph, DrawCmd
         x, y, w, h = rect
         if w <= 0 or h <= 0:
             return []
-        import math
         # simple orthographic projection with rotation
         # cube vertices
         verts = [
@@ -1573,20 +1737,13 @@ class WidgetSceneDemo(DemoBase):
         self.speed = 1.0
         self.sel = 0
 
-    def on_key(self, evt: dict) -> None:
-        if evt.get("kind") != "key": return
-        ch = evt.get("ch", 0)
-        if not ch: return
-        c = chr(ch).lower()
-        if c == '+': self.speed = min(5.0, self.speed*1.25)
-        elif c == '-': self.speed = max(0.2, self.speed*0.8)
+    _KEY_ACTIONS = _SPEED_KEYS
 
     def tick(self, dt: float) -> None:
         self.t += dt * self.speed
         self.sel = int(self.t*2) % 4
 
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import Tabs, BarChart, Sparkline, Gauge, List, Paragraph, DrawCmd, Style, FFI_COLOR
         out = []
         x, y, w, h = rect
         if w < 20 or h < 8:
@@ -1605,7 +1762,6 @@ class WidgetSceneDemo(DemoBase):
         out.append(DrawCmd.tabs(tabs, top))
 
         # Left: BarChart as rising/falling equalizer
-        import math
         n = max(8, min(32, left[2]//2))
         vals = []
         for i in range(n):
@@ -1628,10 +1784,10 @@ class WidgetSceneDemo(DemoBase):
 
         # Bottom: dual gauges + scrolling list
         g_left, g_right = split_v(bottom, 0.5, 0.5, gap=1)
-        g1 = Gauge().ratio(0.5 + 0.49*math.sin(self.t*1.7)).label("Pulse")
+        g1 = UiGauge().ratio(0.5 + 0.49*math.sin(self.t*1.7)).label("Pulse")
         g1.set_block_title("Pulse", True)
         out.append(DrawCmd.gauge(g1, g_left))
-        g2 = Gauge().ratio(0.5 + 0.49*math.sin(self.t*2.3 + 1.2)).label("Wave")
+        g2 = UiGauge().ratio(0.5 + 0.49*math.sin(self.t*2.3 + 1.2)).label("Wave")
         g2.set_block_title("Wave", True)
         out.append(DrawCmd.gauge(g2, g_right))
 
@@ -1651,7 +1807,6 @@ class CACubeDemo(DemoBase):
         self.t = 0.0
         self.speed = 1.0
         # Precompute radial distance from kernel (center)
-        import math
         c = (self.n-1)/2
         self.rad = []
         maxr = math.sqrt(3)*c
@@ -1665,21 +1820,24 @@ class CACubeDemo(DemoBase):
     def idx(self, x,y,z):
         return (z*self.n + y)*self.n + x
 
-    def on_key(self, evt: dict) -> None:
-        if evt.get("kind") != "key": return
-        code = evt.get("code", 0)
-        ch = evt.get("ch", 0)
-        if ch:
-            c = chr(ch).lower()
-            if c == '+': self.speed = min(5.0, self.speed*1.25)
-            elif c == '-': self.speed = max(0.2, self.speed*0.8)
-            elif c == 'i': self.threshold = min(0.9, self.threshold+0.02)
-            elif c == 'k': self.threshold = max(0.1, self.threshold-0.02)
-            elif c == 'r': self.field = [0.0]*len(self.field)
+    def _raise_threshold(self) -> None:
+        self.threshold = min(0.9, self.threshold+0.02)
+
+    def _lower_threshold(self) -> None:
+        self.threshold = max(0.1, self.threshold-0.02)
+
+    def _reset_field(self) -> None:
+        self.field = [0.0]*len(self.field)
+
+    _KEY_ACTIONS = {
+        **_SPEED_KEYS,
+        ord("i"): _raise_threshold,
+        ord("k"): _lower_threshold,
+        ord("r"): _reset_field,
+    }
 
     def tick(self, dt: float) -> None:
         # Evolve CA (26-neighborhood) a few microsteps per frame
-        import math
         self.t += dt * self.speed
         n = self.n
         steps = 2
@@ -1719,10 +1877,8 @@ class CACubeDemo(DemoBase):
             self.field, self.nextf = self.nextf, self.field
 
     def render_cmds(self, rect: Tuple[int,int,int,int]) -> list:
-        from . import Paragraph, DrawCmd
         x, y, w, h = rect
         if w<=0 or h<=0: return []
-        import math
         # Projection setup like CubeDemo
         sx, sy = w*0.5, h*0.5
         scale = min(w,h)*0.22
@@ -1785,7 +1941,6 @@ class CACubeDemo(DemoBase):
                 ch = '#' if v>0.7 else ('*' if v>0.5 else ('+' if v>0.35 else '.'))
                 plot(px,py,ch)
         lines = [''.join(r) for r in buf]
-        from . import Paragraph
         p = Paragraph.from_text('\n'.join(lines))
         p.set_block_title(f"CA Cube (+/- speed, i/k thresh={self.threshold:.2f})", True)
         return [DrawCmd.paragraph(p, rect)]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Tuple, Optional, Sequence
 import ctypes as C
 from .types import Rect as _Rect, RectLike
@@ -19,22 +20,31 @@ def margin(rect: Rect, *, all: Optional[int] = None, x: int = 0, y: int = 0) ->
     return (nx, ny, nw, nh)
 
 
+def _split_spans(start: int, length: int, fractions: Sequence[float], gap: int) -> list[tuple[int, int]]:
+    """Shared kernel for the fraction splitters: (offset, size) along one axis.
+
+    The last span absorbs rounding so the spans always end at ``start + length``.
+    """
+    last = len(fractions) - 1
+    avail = max(0, length - max(0, last * gap))
+    fr_sum = sum(fractions) or 1.0
+    end = start + length
+    spans = []
+    pos = start
+    for i, f in enumerate(fractions):
+        size = int(round(avail * (f / fr_sum))) if i < last else (end - pos)
+        spans.append((pos, max(0, size)))
+        pos += size + gap
+    return spans
+
+
 def split_h(rect: Rect, *fractions: float, gap: int = 0) -> tuple[Rect, ...]:
     """Split horizontally (stacked vertically) by fractions.
 
     Example: split_h((0,0,80,24), 0.7, 0.3, gap=1)
     """
     x, y, w, h = rect
-    total_gap = max(0, (len(fractions) - 1) * gap)
-    avail = max(0, h - total_gap)
-    fr_sum = sum(fractions) or 1.0
-    rows = []
-    yy = y
-    for i, f in enumerate(fractions):
-        hh = int(round(avail * (f / fr_sum))) if i < len(fractions) - 1 else (y + h - yy)
-        rows.append((x, yy, w, max(0, hh)))
-        yy += hh + (gap if i < len(fractions) - 1 else 0)
-    return tuple(rows)
+    return tuple([(x, yy, w, hh) for yy, hh in _split_spans(y, h, fractions, gap)])
 
 
 def split_v(rect: Rect, *fractions: float, gap: int = 0) -> tuple[Rect, ...]:
@@ -43,16 +53,7 @@ def split_v(rect: Rect, *fractions: float, gap: int = 0) -> tuple[Rect, ...]:
     Example: split_v((0,0,80,24), 0.25, 0.5, 0.25, gap=1)
     """
     x, y, w, h = rect
-    total_gap = max(0, (len(fractions) - 1) * gap)
-    avail = max(0, w - total_gap)
-    fr_sum = sum(fractions) or 1.0
-    cols = []
-    xx = x
-    for i, f in enumerate(fractions):
-        ww = int(round(avail * (f / fr_sum))) if i < len(fractions) - 1 else (x + w - xx)
-        cols.append((xx, y, max(0, ww), h))
-        xx += ww + (gap if i < len(fractions) - 1 else 0)
-    return tuple(cols)
+    return tuple([(xx, y, ww, h) for xx, ww in _split_spans(x, w, fractions, gap)])
 
 
 # Typed variants that return Rect dataclass for richer hints
@@ -69,30 +70,12 @@ def margin_rect(rect: RectLike, *, all: Optional[int] = None, x: int = 0, y: int
 
 def split_h_rect(rect: RectLike, *fractions: float, gap: int = 0) -> tuple[_Rect, ...]:
     x, y, w, h = (rect.to_tuple() if hasattr(rect, 'to_tuple') else rect)  # type: ignore[attr-defined]
-    total_gap = max(0, (len(fractions) - 1) * gap)
-    avail = max(0, h - total_gap)
-    fr_sum = sum(fractions) or 1.0
-    rows = []
-    yy = y
-    for i, f in enumerate(fractions):
-        hh = int(round(avail * (f / fr_sum))) if i < len(fractions) - 1 else (y + h - yy)
-        rows.append(_Rect(x, yy, w, max(0, hh)))
-        yy += hh + (gap if i < len(fractions) - 1 else 0)
-    return tuple(rows)
+    return tuple([_Rect(x, yy, w, hh) for yy, hh in _split_spans(y, h, fractions, gap)])
 
 
 def split_v_rect(rect: RectLike, *fractions: float, gap: int = 0) -> tuple[_Rect, ...]:
     x, y, w, h = (rect.to_tuple() if hasattr(rect, 'to_tuple') else rect)  # type: ignore[attr-defined]
-    total_gap = max(0, (len(fractions) - 1) * gap)
-    avail = max(0, w - total_gap)
-    fr_sum = sum(fractions) or 1.0
-    cols = []
-    xx = x
-    for i, f in enumerate(fractions):
-        ww = int(round(avail * (f / fr_sum))) if i < len(fractions) - 1 else (x + w - xx)
-        cols.append(_Rect(xx, y, max(0, ww), h))
-        xx += ww + (gap if i < len(fractions) - 1 else 0)
-    return tuple(cols)
+    return tuple([_Rect(xx, y, ww, h) for xx, ww in _split_spans(x, w, fractions, gap)])
 
 
 # ---- FFI-driven splits (v0.2.0+) ----
@@ -121,6 +104,47 @@ def _build_constraints(constraints: Sequence[tuple[str, int] | tuple[str, int, i
     return kinds, a_vals, (b_vals if has_ratio else None)
 
 
+def _constraint_key(constraints: Sequence[tuple[str, int] | tuple[str, int, int]]) -> tuple:
+    # Hashable form for the solver cache; list constraints such as ['len', 3]
+    # are accepted and share entries with their tuple spelling.
+    key = []
+    for c in constraints:
+        if not isinstance(c, (tuple, list)):
+            raise ValueError("constraint must be ('len'|'pct'|'min'|'ratio', ...)")
+        key.append(tuple(c))
+    return tuple(key)
+
+
+@lru_cache(maxsize=64)
+def _solve_layout(
+    w: int,
+    h: int,
+    dir_val: int,
+    constraints: tuple,
+    spacing: int,
+    margins: Tuple[int, int, int, int],
+) -> tuple[Rect, ...]:
+    # The solver only sees the area's size, so results are cached per
+    # (size, direction, constraints, spacing, margins) and shifted to the
+    # caller's origin. UIs re-split the same few areas every frame.
+    lib = load_library()
+    kinds, a_vals, b_vals = _build_constraints(constraints)
+    l, t, r, b = margins
+    out = (FfiRect * max(1, len(kinds)))()
+    arr_k = (C.c_uint * len(kinds))(*kinds)
+    arr_a = (C.c_uint16 * len(a_vals))(*a_vals)
+    arr_b = (C.c_uint16 * len(b_vals))(*b_vals) if b_vals is not None else None
+    if b_vals is not None and hasattr(lib, 'ratatui_layout_split_ex2'):
+        n = lib.ratatui_layout_split_ex2(w, h, dir_val, arr_k, arr_a, arr_b, len(kinds), spacing, l, t, r, b, out, len(out))
+    elif hasattr(lib, 'ratatui_layout_split_ex'):
+        n = lib.ratatui_layout_split_ex(w, h, dir_val, arr_k, arr_a, arr_b, len(kinds), spacing, l, t, r, b, out, len(out))
+    else:
+        # Base split has no spacing/margins; apply the margins here.
+        n = lib.ratatui_layout_split(max(0, w - l - r), max(0, h - t - b), dir_val, arr_k, arr_a, arr_b, len(kinds), out, len(out))
+        return tuple([(l + int(rr.x), t + int(rr.y), int(rr.width), int(rr.height)) for rr in out[:int(n)]])
+    return tuple([(int(rr.x), int(rr.y), int(rr.width), int(rr.height)) for rr in out[:int(n)]])
+
+
 def layout_split_ffi(
     rect: RectLike,
     *,
@@ -134,31 +158,16 @@ def layout_split_ffi(
     constraints: list of ('len', n) | ('pct', p) | ('min', n) | ('ratio', a, b)
     direction: 'vertical' stacks top-to-bottom; 'horizontal' splits into columns
     margins: (l, t, r, b)
+
+    Solved layouts are cached by area size, so repeated splits only pay for
+    the solver once.
     """
-    lib = load_library()
     x, y, w, h = (rect.to_tuple() if hasattr(rect, 'to_tuple') else rect)  # type: ignore[attr-defined]
-    kinds, a_vals, b_vals = _build_constraints(constraints)
     dir_val = 0 if direction.lower().startswith('v') else 1
-    l, t, r, b = margins
-    out = (FfiRect * max(1, len(kinds)))()
-    if b_vals is not None and hasattr(lib, 'ratatui_layout_split_ex2'):
-        arr_k = (C.c_uint * len(kinds))(*kinds)
-        arr_a = (C.c_uint16 * len(a_vals))(*a_vals)
-        arr_b = (C.c_uint16 * len(b_vals))(*b_vals)
-        n = lib.ratatui_layout_split_ex2(C.c_uint16(w), C.c_uint16(h), C.c_uint(dir_val), arr_k, arr_a, arr_b, len(kinds), C.c_uint16(spacing), C.c_uint16(l), C.c_uint16(t), C.c_uint16(r), C.c_uint16(b), out, len(out))
-    else:
-        arr_k = (C.c_uint * len(kinds))(*kinds)
-        arr_a = (C.c_uint16 * len(a_vals))(*a_vals)
-        if hasattr(lib, 'ratatui_layout_split_ex'):
-            n = lib.ratatui_layout_split_ex(C.c_uint16(w), C.c_uint16(h), C.c_uint(dir_val), arr_k, arr_a, len(kinds), C.c_uint16(spacing), C.c_uint16(l), C.c_uint16(t), C.c_uint16(r), C.c_uint16(b), out, len(out))
-        else:
-            # fallback to simple margin-only variant
-            n = lib.ratatui_layout_split(C.c_uint16(w), C.c_uint16(h), C.c_uint(dir_val), arr_k, arr_a, len(kinds), C.c_uint16(l), C.c_uint16(t), C.c_uint16(r), C.c_uint16(b), out, len(out))
-    rects: list[Rect] = []
-    for i in range(int(n)):
-        rr = out[i]
-        rects.append((x + int(rr.x), y + int(rr.y), int(rr.width), int(rr.height)))
-    return tuple(rects)
+    solved = _solve_layout(int(w), int(h), dir_val, _constraint_key(constraints), int(spacing), tuple(int(m) for m in margins))
+    if not (x or y):
+        return solved
+    return tuple([(x + rx, y + ry, rw, rh) for rx, ry, rw, rh in solved])
 
 
 def split_h_ffi(rect: RectLike, constraints: Sequence[tuple[str, int] | tuple[str, int, int]], *, gap: int = 0, margins: Tuple[int, int, int, int] = (0, 0, 0, 0)) -> tuple[Rect, ...]:
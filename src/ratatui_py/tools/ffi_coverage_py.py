@@ -86,8 +86,8 @@ def nm_exports(libpath: str) -> Set[str]:
 def parse_python_bound_symbols(ffi_py: Path) -> Set[str]:
     text = ffi_py.read_text(encoding="utf-8")
     names: Set[str] = set()
-    # find lib.ratatui_foo_bar occurrences being assigned with .argtypes/.restype or accessed in hasattr
-    for m in re.finditer(r"lib\.\s*(ratatui_[A-Za-z0-9_]+)", text):
+    # find lib.ratatui_foo_bar attribute accesses and the quoted names keyed in _SIGS/_UNDECLARED
+    for m in re.finditer(r"(?:lib\.\s*|['\"])(ratatui_[A-Za-z0-9_]+)", text):
         names.add(m.group(1))
     return names
 
@@ -1,7 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Iterator, Tuple, TypeAlias, Union, Sequence, Any, Optional
+from typing import Iterator, Tuple, TypeAlias, Union, Sequence, Any, Dict, Optional
 import enum
+import sys
+
+# dataclass(slots=True) is 3.10+; older interpreters keep the __dict__ layout.
+_DC_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 @dataclass(frozen=True)
@@ -194,7 +198,25 @@ class MouseButton(enum.IntEnum):
     Middle = 3
 
 
-@dataclass(frozen=True)
+class EventKind(enum.IntEnum):
+    NONE = 0
+    KEY = 1
+    RESIZE = 2
+    MOUSE = 3
+
+
+class WidgetKind(enum.IntEnum):
+    Paragraph = 1
+    List = 2
+    Table = 3
+    Gauge = 4
+    Tabs = 5
+    BarChart = 6
+    Sparkline = 7
+    Chart = 8
+
+
+@dataclass(frozen=True, **_DC_SLOTS)
 class KeyEvt:
     kind: str
     code: KeyCode
@@ -202,14 +224,14 @@ class KeyEvt:
     mods: KeyMods
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DC_SLOTS)
 class ResizeEvt:
     kind: str
     width: int
     height: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DC_SLOTS)
 class MouseEvt:
     kind: str
     x: int
@@ -221,6 +243,105 @@ class MouseEvt:
 
 Event: TypeAlias = Union[KeyEvt, ResizeEvt, MouseEvt]
 
+
+_KEY_FIELDS = ("kind", "code", "ch", "mods")
+_RESIZE_FIELDS = ("kind", "width", "height")
+_MOUSE_FIELDS = ("kind", "x", "y", "mouse_kind", "mouse_btn", "mods")
+_NONE_FIELDS = ("kind",)
+
+
+class EventRecord:
+    """Lightweight event returned by ``Terminal.next_event``.
+
+    Fields are plain attributes (``evt.kind``, ``evt.ch``), and the mapping
+    interface of the dicts returned previously still works: ``evt["kind"]``,
+    ``evt.get("ch", 0)``, ``"width" in evt``, ``dict(evt)``. Only the fields
+    relevant to the event kind are present. Records are not ``dict`` instances
+    and cannot be modified; use ``to_dict()`` for a mutable, JSON-ready copy.
+    """
+
+    __slots__ = (
+        "_fields", "kind", "code", "ch", "mods", "x", "y",
+        "mouse_kind", "mouse_btn", "width", "height",
+    )
+
+    @classmethod
+    def key(cls, code: int, ch: int, mods: int) -> "EventRecord":
+        r = object.__new__(cls)
+        r._fields = _KEY_FIELDS
+        r.kind = "key"
+        r.code = code
+        r.ch = ch
+        r.mods = mods
+        return r
+
+    @classmethod
+    def resize(cls, width: int, height: int) -> "EventRecord":
+        r = object.__new__(cls)
+        r._fields = _RESIZE_FIELDS
+        r.kind = "resize"
+        r.width = width
+        r.height = height
+        return r
+
+    @classmethod
+    def mouse(cls, x: int, y: int, mouse_kind: int, mouse_btn: int, mods: int) -> "EventRecord":
+        r = object.__new__(cls)
+        r._fields = _MOUSE_FIELDS
+        r.kind = "mouse"
+        r.x = x
+        r.y = y
+        r.mouse_kind = mouse_kind
+        r.mouse_btn = mouse_btn
+        r.mods = mods
+        return r
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the event as a new plain ``dict``, as ``next_event`` did before."""
+        return {k: getattr(self, k) for k in self._fields}
+
+    # Mapping compatibility
+    def keys(self) -> Tuple[str, ...]:
+        return self._fields
+
+    def values(self) -> list:
+        return [getattr(self, k) for k in self._fields]
+
+    def items(self) -> list:
+        return [(k, getattr(self, k)) for k in self._fields]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return getattr(self, name) if name in self._fields else default
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._fields:
+            return getattr(self, name)
+        raise KeyError(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._fields
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (EventRecord, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"EventRecord({dict(self.items())!r})"
+
+
+EVENT_NONE = object.__new__(EventRecord)
+EVENT_NONE._fields = _NONE_FIELDS
+EVENT_NONE.kind = "none"
+
 __all__ += [
     "Color",
     "KeyCode",
@@ -228,8 +349,12 @@ __all__ += [
     "Mod",
     "MouseKind",
     "MouseButton",
+    "EventKind",
+    "WidgetKind",
     "KeyEvt",
     "ResizeEvt",
     "MouseEvt",
     "Event",
+    "EventRecord",
+    "EVENT_NONE",
 ]
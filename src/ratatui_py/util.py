@@ -7,6 +7,37 @@ from typing import Callable, Optional, Any
 # impacting interpreter start and to play nicely with frozen apps on Windows.
 _MP = None  # populated on first ProcessTask.start()
 
+# NumPy is optional; resolved on first use (False once known to be missing).
+_NP = None
+
+
+def _numpy():
+    """Return the numpy module if installed, else None."""
+    global _NP
+    if _NP is None:
+        try:
+            import numpy as np
+        except ImportError:
+            np = False
+        _NP = np
+    return _NP or None
+
+
+# Numba is optional too; only demo kernels use it.
+_NB = None
+
+
+def _numba():
+    """Return the numba module if installed, else None."""
+    global _NB
+    if _NB is None:
+        try:
+            import numba as nb
+        except ImportError:
+            nb = False
+        _NB = nb
+    return _NB or None
+
 _DEFAULT_BUDGET_MS = 12
 
 class FrameBudget:
@@ -1,16 +1,26 @@
 from __future__ import annotations
 import ctypes as C
 from dataclasses import dataclass
-from typing import Optional, Tuple, Iterable, Sequence, Callable, Any, List as _List, Union
+from typing import Optional, Tuple, Iterable, Sequence, Callable, Any, Dict, List as _List, Union
 import enum
+import struct
+import threading
+import weakref
+from array import array
+from collections import OrderedDict
 from time import monotonic
+from functools import lru_cache
 
 from ._ffi import (
     load_library,
     FfiRect,
     FfiStyle,
+    FfiSpan,
+    FfiLineSpans,
+    FfiCellLines,
+    FfiRowCellsLines,
+    FfiDrawCmd,
     FfiEvent,
-    FFI_EVENT_KIND,
     FFI_COLOR,
     FFI_KEY_CODE,
     FFI_KEY_MODS,
@@ -21,18 +31,55 @@ from ._ffi import (
     FFI_BORDER_TYPE,
     FFI_WIDGET_KIND,
 )
-from .types import RectLike, Color, KeyCode, KeyMods, MouseKind, MouseButton, Mod
+from .types import RectLike, Color, KeyCode, KeyMods, MouseKind, MouseButton, Mod, KeyEvt, ResizeEvt, MouseEvt, EventRecord, EVENT_NONE
+from .types import EventKind, WidgetKind, _DC_SLOTS
+from .util import _numpy
 
-@dataclass
+
+# Interned FfiStyle/FfiRect values. UIs use a handful of styles and rects
+# over and over; sharing one instance per value is safe because ctypes copies
+# structs passed by value. The pooled instances reach callers through
+# Style.to_ffi() and DrawCmd.rect, so they are read-only subclasses: writing a
+# field raises instead of changing the value for every other holder.
+class _PooledStyle(FfiStyle):
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("pooled FfiStyle is shared and read-only; build a new FfiStyle instead")
+
+
+class _PooledRect(FfiRect):
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("pooled FfiRect is shared and read-only; build a new FfiRect instead")
+
+
+@lru_cache(maxsize=256)
+def _pooled_style(fg: int, bg: int, mods: int) -> FfiStyle:
+    # from_buffer_copy fills the fields without going through __setattr__.
+    return _PooledStyle.from_buffer_copy(FfiStyle(fg, bg, mods))
+
+
+@lru_cache(maxsize=256)
+def _pooled_rect(rect: tuple) -> FfiRect:
+    x, y, w, h = rect
+    return _PooledRect.from_buffer_copy(FfiRect(int(x), int(y), int(w), int(h)))
+
+
+def _style_ffi(style: Optional["Style"]) -> FfiStyle:
+    return _pooled_style(0, 0, 0) if style is None else style.to_ffi()
+
+
+@dataclass(**_DC_SLOTS)
 class Style:
     fg: Union[int, enum.IntEnum] = 0  # accepts raw int or Color-like enums
     bg: Union[int, enum.IntEnum] = 0
     mods: int = 0
 
     def to_ffi(self) -> FfiStyle:
-        fg = int(self.fg) if isinstance(self.fg, enum.IntEnum) else int(self.fg)
-        bg = int(self.bg) if isinstance(self.bg, enum.IntEnum) else int(self.bg)
-        return FfiStyle(fg, bg, int(self.mods))
+        # int() covers both raw ints and IntEnum members.
+        return _pooled_style(int(self.fg), int(self.bg), int(self.mods))
 
     # Fluent helpers (return a new Style for chaining)
     def with_fg(self, fg: Union[int, enum.IntEnum]) -> "Style":
@@ -65,37 +112,206 @@ class Style:
     def crossed_out(self) -> "Style":
         return self.add_mods(Mod.CROSSED_OUT)
 
+# Plain int for the per-item loop in Terminal.draw_batch.
+_WK_PARAGRAPH = int(WidgetKind.Paragraph)
+
+# Native layout of FfiDrawCmd {u32 kind; void *handle; FfiRect rect}, padded
+# to the ctypes size, so command arrays are filled by struct rather than by
+# per-field ctypes attribute writes.
+_DRAW_CMD = struct.Struct("@IPHHHH" + "x" * (C.sizeof(FfiDrawCmd) - struct.calcsize("@IPHHHH")))
+
+
+def _pack_draw_cmds(buf, cmds: Sequence["DrawCmd"]):
+    """Write ``cmds`` into the ``FfiDrawCmd`` array ``buf`` and return it."""
+    pack, size = _DRAW_CMD.pack_into, _DRAW_CMD.size
+    off = 0
+    for cmd in cmds:
+        h, r = cmd.handle, cmd.rect
+        # Paragraph/Terminal handles are plain ints; the rest are c_void_p.
+        if type(h) is not int:
+            h = getattr(h, "value", None) or 0
+        pack(buf, off, cmd.kind, h, r.x, r.y, r.width, r.height)
+        off += size
+    return buf
+
+# Widget kind -> "draw into rect" entry point, bound per terminal by
+# Terminal.draw.
+_DRAW_IN_SYMBOLS = {
+    int(WidgetKind.Paragraph): "ratatui_terminal_draw_paragraph_in",
+    int(WidgetKind.List): "ratatui_terminal_draw_list_in",
+    int(WidgetKind.Table): "ratatui_terminal_draw_table_in",
+    int(WidgetKind.Gauge): "ratatui_terminal_draw_gauge_in",
+    int(WidgetKind.Tabs): "ratatui_terminal_draw_tabs_in",
+    int(WidgetKind.BarChart): "ratatui_terminal_draw_barchart_in",
+    int(WidgetKind.Sparkline): "ratatui_terminal_draw_sparkline_in",
+    int(WidgetKind.Chart): "ratatui_terminal_draw_chart_in",
+}
+
+
+# Text accepted by the text entry points; bytes-like input must be UTF-8.
+TextLike = Union[str, bytes, bytearray, memoryview]
+
+
+# Only short strings (labels, items, cells) are interned; longer text such as
+# paragraph bodies changes every frame in animated UIs and would just pin
+# memory in the cache.
+_INTERN_MAX = 64
+
+
+@lru_cache(maxsize=4096)
+def _str_bytes(text: str) -> bytes:
+    # UIs redraw the same item texts, cells and labels every frame; interning
+    # their encodings hands ctypes the same bytes object instead of a fresh one.
+    return text.encode("utf-8")
+
+
+def _utf8(text: TextLike) -> bytes:
+    # Callers redrawing the same text every frame can pre-encode once and
+    # pass bytes straight through. bytearray/memoryview are copied once since
+    # c_char_p needs an immutable NUL-terminated buffer, which bytes guarantees.
+    if type(text) is str:
+        return _str_bytes(text) if len(text) <= _INTERN_MAX else text.encode("utf-8")
+    if isinstance(text, str):
+        return text.encode("utf-8")
+    return text if isinstance(text, bytes) else bytes(text)
+
+
+def _tsv(cells: Iterable[TextLike]) -> bytes:
+    # Encode each cell on its own (short ASCII strings hit the encoder's fast
+    # path) and let bytes.join do the concatenation; pre-encoded cells pass
+    # straight through.
+    return b"\t".join([_utf8(c) for c in cells])
+
+
+# array typecode matching c_uint32 ("I" is 4 bytes on every mainstream ABI).
+_U32 = "I" if array("I").itemsize == 4 else "L"
+
+
+def _c_array(ctype, typecode: str, values):
+    # ctypes view over an array.array, filled in one pass from any iterable
+    # (generators included); the view keeps the buffer alive for the call.
+    # numpy arrays of the matching dtype are viewed in place, others are
+    # converted in C.
+    np = _numpy()
+    if np is not None and isinstance(values, np.ndarray):
+        values = np.ascontiguousarray(values, dtype=ctype)
+        if not values.flags.writeable:
+            values = values.copy()
+        return (ctype * len(values)).from_buffer(values)
+    if not (isinstance(values, array) and values.typecode == typecode):
+        values = array(typecode, values)
+    return (ctype * len(values)).from_buffer(values)
+
+
+def _xy_buffer(points):
+    # Flatten (x, y) pairs into contiguous doubles. A float64 numpy array of
+    # shape (N, 2) is passed through without touching its elements.
+    np = _numpy()
+    if np is not None and isinstance(points, np.ndarray):
+        pts = np.ascontiguousarray(points, dtype=np.float64)
+        if pts.ndim != 2 or pts.shape[1] != 2:
+            raise ValueError("points array must have shape (N, 2)")
+        return pts.ctypes.data_as(C.POINTER(C.c_double)), pts.shape[0], pts
+    buf = array("d")
+    buf.extend(v for xy in points for v in xy)
+    return (C.c_double * len(buf)).from_buffer(buf), len(buf) // 2, buf
+
+
+def _label_bytes(text: Optional[str]) -> Optional[bytes]:
+    # Titles, labels and highlight symbols: optional text, None clears.
+    return None if text is None else _utf8(text)
+
+
+def _class_lib(cls) -> C.CDLL:
+    # Resolve the library once per class; tests may preset ``_default_lib``.
+    lib = cls._default_lib
+    if lib is None:
+        lib = cls._default_lib = load_library()
+    return lib
+
+
+# LRU of read-only paragraphs shared by Paragraph.from_text_cached.
+_TEXT_CACHE: "OrderedDict[Union[str, bytes], Paragraph]" = OrderedDict()
+_TEXT_CACHE_MAX = 64
+
+
 class Paragraph:
+    __slots__ = (
+        "_lib", "_handle", "_append", "_append_span", "_set_title", "_free",
+        "_last_title", "_finalizer", "__weakref__",
+    )
+    _default_lib = None
+
     def __init__(self, handle: int, lib=None):
-        self._lib = lib or load_library()
-        self._handle = C.c_void_p(handle)
+        self._lib = lib = lib or _class_lib(type(self))
+        # Bind hot entry points once so per-call paths skip the CDLL lookup.
+        self._append = lib.ratatui_paragraph_append_line
+        self._append_span = lib.ratatui_paragraph_append_span
+        self._set_title = lib.ratatui_paragraph_set_block_title
+        self._free = lib.ratatui_paragraph_free
+        self._last_title: Optional[tuple] = None
+        # Raw int handle: every paragraph entry point declares c_void_p in its
+        # argtypes, and ctypes converts a plain int faster than it unwraps a
+        # c_void_p instance.
+        self._handle = int(handle)
+        # Frees the native paragraph when collected, at exit, or on close().
+        self._finalizer = weakref.finalize(self, self._free, self._handle)
 
     @classmethod
-    def from_text(cls, text: str) -> "Paragraph":
-        lib = load_library()
-        ptr = lib.ratatui_paragraph_new(text.encode("utf-8"))
+    def from_text(cls, text: TextLike) -> "Paragraph":
+        lib = _class_lib(cls)
+        ptr = lib.ratatui_paragraph_new(_utf8(text))
         if not ptr:
             raise RuntimeError("ratatui_paragraph_new failed")
         return cls(ptr, lib)
 
+    @classmethod
+    def from_text_cached(cls, text: Union[str, bytes]) -> "Paragraph":
+        """Return a shared paragraph for ``text``, building it on first use.
+
+        Intended for static panes (help text, banners) drawn every frame.
+        Treat the result as read-only: other callers may hold the same object.
+        Evicted entries are freed once nothing else references them.
+        """
+        p = _TEXT_CACHE.get(text)
+        if p is not None and p._handle:
+            _TEXT_CACHE.move_to_end(text)
+            return p
+        p = cls.from_text(text)
+        _TEXT_CACHE[text] = p
+        if len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+            _TEXT_CACHE.popitem(last=False)
+        return p
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop every paragraph held by ``from_text_cached``."""
+        _TEXT_CACHE.clear()
+
     @classmethod
     def new_empty(cls) -> "Paragraph":
-        lib = load_library()
+        lib = _class_lib(cls)
         ptr = lib.ratatui_paragraph_new_empty()
         if not ptr:
             raise RuntimeError("ratatui_paragraph_new_empty failed")
         return cls(ptr, lib)
 
-    def append_span(self, text: str, style: Optional[Style] = None) -> None:
-        st = (style or Style()).to_ffi()
-        self._lib.ratatui_paragraph_append_span(self._handle, text.encode("utf-8"), st)
+    def append_span(self, text: TextLike, style: Optional[Style] = None) -> None:
+        st = _style_ffi(style)
+        self._append_span(self._handle, _utf8(text), st)
 
     def line_break(self) -> None:
         self._lib.ratatui_paragraph_line_break(self._handle)
 
-    def set_block_title(self, title: Optional[str], show_border: bool = True) -> None:
-        t = title.encode("utf-8") if title is not None else None
-        self._lib.ratatui_paragraph_set_block_title(self._handle, t, bool(show_border))
+    def set_block_title(self, title: Union[str, bytes, None], show_border: bool = True) -> None:
+        # Keyed on the encoded bytes: a mutable title (bytearray, memoryview)
+        # changed in place would still compare equal to itself.
+        t = _utf8(title) if title is not None else None
+        key = (t, bool(show_border))
+        if key == self._last_title:
+            return
+        self._set_title(self._handle, t, key[1])
+        self._last_title = key
 
     def set_alignment(self, align: str | int) -> "Paragraph":
         if hasattr(self._lib, 'ratatui_paragraph_set_alignment'):
@@ -109,9 +325,9 @@ class Paragraph:
             self._lib.ratatui_paragraph_set_block_title_alignment(self._handle, C.c_uint(a))
         return self
 
-    def append_line(self, text: str, style: Optional[Style] = None) -> None:
-        st = (style or Style()).to_ffi()
-        self._lib.ratatui_paragraph_append_line(self._handle, text.encode("utf-8"), st)
+    def append_line(self, text: TextLike, style: Optional[Style] = None) -> None:
+        st = _style_ffi(style)
+        self._append(self._handle, _utf8(text), st)
 
     # Advanced configuration (v0.2.0+)
     def set_style(self, style: Style) -> "Paragraph":
@@ -160,33 +376,89 @@ class Paragraph:
         lines_arr, _keep = _build_lines_spans(lines)
         self._lib.ratatui_paragraph_append_lines_spans(self._handle, lines_arr, len(lines_arr))
 
-    # Note: no __del_name__ shim; rely on __del__ below guardedly.
+    def append_lines_bulk(self, lines: Sequence[tuple[str, Optional["Style"]]]) -> None:
+        """Append many single-style lines in one FFI call when supported.
+
+        Each entry is ``(text, style)``; falls back to ``append_line`` per
+        entry on builds without the batched lines API.
+        """
+        if not lines:
+            return
+        if not hasattr(self._lib, 'ratatui_paragraph_append_lines_spans'):
+            for text, style in lines:
+                self.append_line(text, style)
+            return
+        lines_arr, _keep = _build_lines_spans([((text, style or Style()),) for text, style in lines])
+        self._lib.ratatui_paragraph_append_lines_spans(self._handle, lines_arr, len(lines_arr))
+
+    def extend_lines(self, lines: Iterable[TextLike], style: Optional["Style"] = None) -> None:
+        """Append each text in ``lines`` as a line sharing one style."""
+        self.append_lines_bulk([(text, style) for text in lines])
 
     def close(self) -> None:
         if getattr(self, "_handle", None):
-            self._lib.ratatui_paragraph_free(self._handle)
+            self._finalizer()
             self._handle = None
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
-
-    # Context-managed frame builder for ergonomic batched draws
-    def frame(self) -> "Frame":
-        return Frame(self)
-
 class Terminal:
+    __slots__ = (
+        "_lib", "_handle", "_draw", "_draw_in", "_clear", "_size", "_next", "_free",
+        "_draw_frame", "_scratch_rect", "_scratch_evt", "_evt_ptr", "_batch_buf",
+        "_size_w", "_size_h", "_size_ptrs", "_draw_fns", "_finalizer", "__weakref__",
+    )
+    _default_lib = None
+
     def __init__(self):
-        self._lib = load_library()
-        ptr = self._lib.ratatui_init_terminal()
+        self._lib = lib = _class_lib(type(self))
+        ptr = lib.ratatui_init_terminal()
         if not ptr:
             raise RuntimeError("ratatui_init_terminal failed")
-        self._handle = C.c_void_p(ptr)
+        # Bind per-frame entry points once; see Paragraph.__init__.
+        self._draw = lib.ratatui_terminal_draw_paragraph
+        self._draw_in = lib.ratatui_terminal_draw_paragraph_in
+        self._clear = lib.ratatui_terminal_clear
+        self._size = lib.ratatui_terminal_size
+        self._next = lib.ratatui_next_event
+        self._free = lib.ratatui_terminal_free
+        self._draw_frame = lib.ratatui_terminal_draw_frame
+        self._draw_fns = {kind: getattr(lib, name) for kind, name in _DRAW_IN_SYMBOLS.items()}
+        # Scratch structs reused across calls; FfiRect is passed by value and
+        # the event is copied out into Python objects before returning.
+        self._scratch_rect = FfiRect(0, 0, 0, 0)
+        self._scratch_evt = FfiEvent()
+        self._evt_ptr = C.byref(self._scratch_evt)
+        self._batch_buf = None
+        self._size_w = C.c_uint16(0)
+        self._size_h = C.c_uint16(0)
+        self._size_ptrs = (C.byref(self._size_w), C.byref(self._size_h))
+        self._handle = int(ptr)  # raw int, see Paragraph.__init__
+        self._finalizer = weakref.finalize(self, self._free, self._handle)
+
+    def _rect(self, rect: RectLike) -> FfiRect:
+        # A caller-held FfiRect is already the 8-byte by-value argument the
+        # draw calls take; pass it through instead of copying its fields.
+        if isinstance(rect, FfiRect):
+            return rect
+        r = self._scratch_rect
+        if type(rect) is tuple:
+            # Common case: a tuple of ints assigns directly; anything ctypes
+            # rejects (floats, numpy ints) goes through int() below.
+            try:
+                r.x, r.y, r.width, r.height = rect
+                return r
+            except TypeError:
+                pass
+        if hasattr(rect, "to_tuple"):
+            rect = rect.to_tuple()  # type: ignore[attr-defined]
+        x, y, w, h = rect  # type: ignore[misc]
+        r.x = int(x)
+        r.y = int(y)
+        r.width = int(w)
+        r.height = int(h)
+        return r
 
     def clear(self) -> None:
-        self._lib.ratatui_terminal_clear(self._handle)
+        self._clear(self._handle)
 
     # Raw/alt/cursor/viewport controls (present in v0.2.0+)
     def enable_raw(self) -> None:
@@ -209,86 +481,116 @@ class Terminal:
         if hasattr(self._lib, 'ratatui_terminal_show_cursor'):
             self._lib.ratatui_terminal_show_cursor()
 
+    def draw(self, kind: int, handle: Any, rect: RectLike) -> bool:
+        """Draw the widget ``handle`` of ``WidgetKind`` ``kind`` into ``rect``.
+
+        One dict lookup replaces the per-widget ``draw_*`` method, which lets
+        generic dispatchers draw any widget without binding a method first.
+        """
+        fn = self._draw_fns.get(kind)
+        if fn is None:
+            raise ValueError(f"invalid widget kind: {kind}")
+        return bool(fn(self._handle, handle, self._rect(rect)))
+
     def draw_paragraph(self, p: Paragraph, rect: Optional[RectLike] = None) -> bool:
         if rect is None:
-            return bool(self._lib.ratatui_terminal_draw_paragraph(self._handle, p._handle))
-        r = _ffi_rect(rect)
-        return bool(self._lib.ratatui_terminal_draw_paragraph_in(self._handle, p._handle, r))
+            return bool(self._draw(self._handle, p._handle))
+        r = self._rect(rect)
+        return bool(self._draw_in(self._handle, p._handle, r))
 
     def draw_list(self, lst: "List", rect: RectLike) -> bool:
-        r = _ffi_rect(rect)
+        r = self._rect(rect)
         return bool(self._lib.ratatui_terminal_draw_list_in(self._handle, lst._handle, r))
 
     def draw_table(self, tbl: "Table", rect: RectLike) -> bool:
-        r = _ffi_rect(rect)
+        r = self._rect(rect)
         return bool(self._lib.ratatui_terminal_draw_table_in(self._handle, tbl._handle, r))
 
     def draw_gauge(self, g: "Gauge", rect: RectLike) -> bool:
-        r = _ffi_rect(rect)
+        r = self._rect(rect)
         return bool(self._lib.ratatui_terminal_draw_gauge_in(self._handle, g._handle, r))
 
     def draw_tabs(self, t: "Tabs", rect: RectLike) -> bool:
-        r = _ffi_rect(rect)
+        r = self._rect(rect)
         return bool(self._lib.ratatui_terminal_draw_tabs_in(self._handle, t._handle, r))
 
     def draw_barchart(self, b: "BarChart", rect: RectLike) -> bool:
-        r = _ffi_rect(rect)
+        r = self._rect(rect)
         return bool(self._lib.ratatui_terminal_draw_barchart_in(self._handle, b._handle, r))
 
     def draw_sparkline(self, s: "Sparkline", rect: RectLike) -> bool:
-        r = _ffi_rect(rect)
+        r = self._rect(rect)
         return bool(self._lib.ratatui_terminal_draw_sparkline_in(self._handle, s._handle, r))
 
     # Clear region widget
     def draw_clear(self, rect: RectLike) -> bool:
         if not hasattr(self._lib, 'ratatui_clear_in'):
             return False
-        r = _ffi_rect(rect)
+        r = self._rect(rect)
         return bool(self._lib.ratatui_clear_in(self._handle, r))
 
     # Chart and batched frames
     def draw_chart(self, c: "Chart", rect: RectLike) -> bool:
-        r = _ffi_rect(rect)
+        r = self._rect(rect)
         return bool(self._lib.ratatui_terminal_draw_chart_in(self._handle, c._handle, r))
 
     def draw_canvas(self, canvas: "Canvas", rect: RectLike) -> bool:
         if not hasattr(self._lib, 'ratatui_terminal_draw_canvas_in'):
             return False
-        r = _ffi_rect(rect)
+        r = self._rect(rect)
         return bool(self._lib.ratatui_terminal_draw_canvas_in(self._handle, canvas._handle, r))
 
     def draw_logo(self, rect: RectLike) -> bool:
         if not hasattr(self._lib, 'ratatui_ratatuilogo_draw_in'):
             return False
-        r = _ffi_rect(rect)
+        r = self._rect(rect)
         return bool(self._lib.ratatui_ratatuilogo_draw_in(self._handle, r))
 
     def draw_logo_sized(self, rect: RectLike, size: int) -> bool:
         if not hasattr(self._lib, 'ratatui_ratatuilogo_draw_sized_in'):
             return False
-        r = _ffi_rect(rect)
+        r = self._rect(rect)
         return bool(self._lib.ratatui_ratatuilogo_draw_sized_in(self._handle, r, C.c_uint32(int(size))))
 
     def draw_frame(self, cmds: Sequence["DrawCmd"]) -> bool:
-        FfiDrawCmd = self._lib.FfiDrawCmd
-        arr = (FfiDrawCmd * len(cmds))()
-        # Keep owners alive across the FFI call to prevent use-after-free of handles.
-        owners = []
-        for i, cmd in enumerate(cmds):
-            arr[i] = FfiDrawCmd(cmd.kind, cmd.handle, cmd.rect)
-            if getattr(cmd, 'owner', None) is not None:
-                owners.append(cmd.owner)
-        ok = bool(self._lib.ratatui_terminal_draw_frame(self._handle, arr, len(cmds)))
-        # owners list goes out of scope here, after the draw returns.
-        return ok
+        n = len(cmds)
+        buf = self._batch_buf
+        if buf is None or len(buf) < n:
+            buf = self._batch_buf = (self._lib.FfiDrawCmd * max(n, 8))()
+        _pack_draw_cmds(buf, cmds)
+        # ``cmds`` holds each command's owner, so handles stay alive until the
+        # draw returns.
+        return bool(self._draw_frame(self._handle, buf, n))
+
+    def draw_frame_builder(self, fb: "FrameBuilder") -> bool:
+        """Draw the commands accumulated in ``fb`` with one FFI call."""
+        return bool(self._draw_frame(self._handle, fb._arr, fb._n))
+
+    def draw_batch(self, items: Sequence[Tuple[Paragraph, RectLike]]) -> bool:
+        """Draw several paragraphs with a single ``draw_frame`` FFI call.
+
+        The command array lives on the terminal and is only reallocated when a
+        frame needs more slots than any previous one.
+        """
+        n = len(items)
+        buf = self._batch_buf
+        if buf is None or len(buf) < n:
+            buf = self._batch_buf = (self._lib.FfiDrawCmd * max(n, 8))()
+        kind = _WK_PARAGRAPH
+        pack, size = _DRAW_CMD.pack_into, _DRAW_CMD.size
+        off = 0
+        for p, rect in items:
+            r = _ffi_rect(rect)
+            pack(buf, off, kind, p._handle or 0, r.x, r.y, r.width, r.height)
+            off += size
+        # ``items`` keeps the paragraphs alive until the call returns.
+        return bool(self._draw_frame(self._handle, buf, n))
 
     def size(self) -> Tuple[int, int]:
-        w = C.c_uint16(0)
-        h = C.c_uint16(0)
-        ok = self._lib.ratatui_terminal_size(C.byref(w), C.byref(h))
+        ok = self._size(*self._size_ptrs)
         if not ok:
             raise RuntimeError("ratatui_terminal_size failed")
-        return (int(w.value), int(h.value))
+        return (self._size_w.value, self._size_h.value)
 
     def get_cursor_position(self) -> Tuple[int, int]:
         if not hasattr(self._lib, 'ratatui_terminal_get_cursor_position'):
@@ -317,33 +619,67 @@ class Terminal:
     def set_viewport_area(self, rect: RectLike) -> None:
         if not hasattr(self._lib, 'ratatui_terminal_set_viewport_area'):
             raise RuntimeError('set viewport area not supported by FFI build')
-        r = _ffi_rect(rect)
+        r = self._rect(rect)
         self._lib.ratatui_terminal_set_viewport_area(r)
 
-    def next_event(self, timeout_ms: int) -> Optional[dict]:
-        evt = FfiEvent()
-        ok = self._lib.ratatui_next_event(C.c_uint64(timeout_ms), C.byref(evt))
+    def next_event(self, timeout_ms: int) -> Optional[EventRecord]:
+        """Wait up to ``timeout_ms`` for input; ``None`` on timeout.
+
+        The library is loaded through ``ctypes.CDLL``, which releases the GIL
+        for the duration of each foreign call, so other Python threads keep
+        running while this blocks.
+        """
+        ok = self._next(C.c_uint64(timeout_ms), self._evt_ptr)
         if not ok:
             return None
-        if evt.kind == FFI_EVENT_KIND["KEY"]:
-            return {
-                "kind": "key",
-                "code": int(evt.key.code),
-                "ch": int(evt.key.ch),
-                "mods": int(evt.key.mods),
-            }
-        if evt.kind == FFI_EVENT_KIND["RESIZE"]:
-            return {"kind": "resize", "width": int(evt.width), "height": int(evt.height)}
-        if evt.kind == FFI_EVENT_KIND["MOUSE"]:
-            return {
-                "kind": "mouse",
-                "x": int(evt.mouse_x),
-                "y": int(evt.mouse_y),
-                "mouse_kind": int(evt.mouse_kind),
-                "mouse_btn": int(evt.mouse_btn),
-                "mods": int(evt.mouse_mods),
-            }
-        return {"kind": "none"}
+        return _event_dispatch(_EVT_DICT, self._scratch_evt)
+
+    def next_events(self, timeout_ms: int, max_events: int = 32) -> _List[EventRecord]:
+        """Wait up to ``timeout_ms`` for an event, then drain what is already queued.
+
+        Lets a frame consume a burst of input (key repeat, mouse drags) and
+        redraw once, instead of paying a full loop iteration per event.
+        """
+        out: _List[EventRecord] = []
+        evt = self.next_event(timeout_ms)
+        while evt is not None and evt is not EVENT_NONE:
+            out.append(evt)
+            if len(out) >= max_events:
+                break
+            evt = self.next_event(0)
+        return out
+
+    def next_events_soa(self, timeout_ms: int, max_events: int = 32) -> dict:
+        """Like ``next_events`` but returns one column per event field.
+
+        Each value is an ``array.array`` (a zero-copy numpy view over it when
+        numpy is installed), so batches can be scanned without a Python loop,
+        e.g. ``(cols["kind"] == EventKind.KEY).any()``.
+        """
+        cols = {name: array(code) for name, code, _ in _SOA_FIELDS}
+        evt = self._scratch_evt
+        key = evt.key
+        ok = self._next(C.c_uint64(timeout_ms), self._evt_ptr)
+        n = 0
+        while ok and evt.kind != EventKind.NONE:
+            cols["kind"].append(evt.kind)
+            cols["code"].append(key.code)
+            cols["ch"].append(key.ch)
+            cols["mods"].append(key.mods if evt.kind == EventKind.KEY else evt.mouse_mods)
+            cols["width"].append(evt.width)
+            cols["height"].append(evt.height)
+            cols["x"].append(evt.mouse_x)
+            cols["y"].append(evt.mouse_y)
+            cols["mouse_kind"].append(evt.mouse_kind)
+            cols["mouse_btn"].append(evt.mouse_btn)
+            n += 1
+            if n >= max_events:
+                break
+            ok = self._next(C.c_uint64(0), self._evt_ptr)
+        np = _numpy()
+        if np is not None:
+            return {name: np.frombuffer(cols[name], dtype=dt) for name, _, dt in _SOA_FIELDS}
+        return cols
 
     # Event injection (for tests/automation)
     def inject_key(self, code: int, ch: int = 0, mods: int = 0) -> None:
@@ -360,43 +696,19 @@ class Terminal:
 
     # Typed event API for better IDE hints and fewer stringly-typed checks
     def next_event_typed(self, timeout_ms: int):
-        evt = FfiEvent()
-        ok = self._lib.ratatui_next_event(C.c_uint64(timeout_ms), C.byref(evt))
+        ok = self._next(C.c_uint64(timeout_ms), self._evt_ptr)
         if not ok:
             return None
-        if evt.kind == FFI_EVENT_KIND["KEY"]:
-            return (
-                __import__('ratatui_py.types', fromlist=['KeyEvt']).KeyEvt(
-                    kind="key",
-                    code=KeyCode(int(evt.key.code)),
-                    ch=int(evt.key.ch),
-                    mods=KeyMods(int(evt.key.mods)),
-                )
-            )
-        if evt.kind == FFI_EVENT_KIND["RESIZE"]:
-            return (
-                __import__('ratatui_py.types', fromlist=['ResizeEvt']).ResizeEvt(
-                    kind="resize",
-                    width=int(evt.width),
-                    height=int(evt.height),
-                )
-            )
-        if evt.kind == FFI_EVENT_KIND["MOUSE"]:
-            return (
-                __import__('ratatui_py.types', fromlist=['MouseEvt']).MouseEvt(
-                    kind="mouse",
-                    x=int(evt.mouse_x),
-                    y=int(evt.mouse_y),
-                    mouse_kind=MouseKind(int(evt.mouse_kind)),
-                    mouse_btn=MouseButton(int(evt.mouse_btn)),
-                    mods=KeyMods(int(evt.mouse_mods)),
-                )
-            )
-        return None
+        return _event_dispatch(_EVT_TYPED, self._scratch_evt)
+
+    # Context-managed frame builder for ergonomic batched draws
+    def frame(self) -> "Frame":
+        """Collect draws in a ``with`` block and submit them as one ``draw_frame``."""
+        return Frame(self)
 
     def close(self) -> None:
         if getattr(self, "_handle", None):
-            self._lib.ratatui_terminal_free(self._handle)
+            self._finalizer()
             self._handle = None
 
     def __enter__(self) -> "Terminal":
@@ -405,11 +717,80 @@ class Terminal:
     def __exit__(self, exc_type, exc, tb) -> None:
         self.close()
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
+
+# Columns for Terminal.next_events_soa: (name, array typecode, numpy dtype).
+_SOA_FIELDS = (
+    ("kind", "I", "uint32"),
+    ("code", "I", "uint32"),
+    ("ch", "I", "uint32"),
+    ("mods", "B", "uint8"),
+    ("width", "H", "uint16"),
+    ("height", "H", "uint16"),
+    ("x", "H", "uint16"),
+    ("y", "H", "uint16"),
+    ("mouse_kind", "I", "uint32"),
+    ("mouse_btn", "I", "uint32"),
+)
+
+
+# Event conversion: one converter per FFI event kind, indexed by ``evt.kind``.
+def _evt_none(evt: FfiEvent) -> EventRecord:
+    return EVENT_NONE
+
+
+def _evt_key(evt: FfiEvent) -> EventRecord:
+    key = evt.key
+    return EventRecord.key(key.code, key.ch, key.mods)
+
+
+def _evt_resize(evt: FfiEvent) -> EventRecord:
+    return EventRecord.resize(evt.width, evt.height)
+
+
+def _evt_mouse(evt: FfiEvent) -> EventRecord:
+    return EventRecord.mouse(evt.mouse_x, evt.mouse_y, evt.mouse_kind, evt.mouse_btn, evt.mouse_mods)
+
+
+def _typed_none(evt: FfiEvent) -> None:
+    return None
+
+
+def _typed_key(evt: FfiEvent) -> KeyEvt:
+    key = evt.key
+    return KeyEvt(kind="key", code=KeyCode(key.code), ch=key.ch, mods=KeyMods(key.mods))
+
+
+def _typed_resize(evt: FfiEvent) -> ResizeEvt:
+    return ResizeEvt(kind="resize", width=evt.width, height=evt.height)
+
+
+def _typed_mouse(evt: FfiEvent) -> MouseEvt:
+    return MouseEvt(
+        kind="mouse",
+        x=evt.mouse_x,
+        y=evt.mouse_y,
+        mouse_kind=MouseKind(evt.mouse_kind),
+        mouse_btn=MouseButton(evt.mouse_btn),
+        mods=KeyMods(evt.mouse_mods),
+    )
+
+
+def _event_table(none, key, resize, mouse) -> tuple:
+    table = [none] * (max(EventKind) + 1)
+    table[EventKind.KEY] = key
+    table[EventKind.RESIZE] = resize
+    table[EventKind.MOUSE] = mouse
+    return tuple(table)
+
+
+_EVT_DICT = _event_table(_evt_none, _evt_key, _evt_resize, _evt_mouse)
+_EVT_TYPED = _event_table(_typed_none, _typed_key, _typed_resize, _typed_mouse)
+
+
+def _event_dispatch(table: tuple, evt: FfiEvent):
+    kind = evt.kind
+    # Unknown kinds from newer FFI builds degrade to the "none" converter.
+    return table[kind](evt) if kind < len(table) else table[0](evt)
 
 
 class App:
@@ -483,35 +864,77 @@ class App:
                 if self.on_stop:
                     self.on_stop(None, term, state)
 
-# Convenience: headless render paragraph
 
-def headless_render_paragraph(width: int, height: int, p: Paragraph) -> str:
-    lib = p._lib
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_paragraph(C.c_uint16(width), C.c_uint16(height), p._handle, C.byref(out))
-    if not ok or not out:
-        return ""
+_tls = threading.local()
+
+
+def _string_out() -> Tuple[C.c_char_p, Any]:
+    """Per-thread ``char**`` out-param and its ``byref``, reused across renders."""
+    try:
+        return _tls.string_out
+    except AttributeError:
+        out = C.c_char_p()
+        pair = _tls.string_out = (out, C.byref(out))
+        return pair
+
+
+def _take_string(lib, out: C.c_char_p) -> str:
+    """Decode and free a C string returned through a ``char**`` out-param.
+
+    ``out.value`` already yields a bytes copy; casting it again first only
+    allocated another ctypes object per render. The out-param is reset to
+    NULL so a reused one never hands back a freed pointer.
+    """
     try:
-        s = C.cast(out, C.c_char_p).value.decode("utf-8", errors="replace")
+        return out.value.decode("utf-8", errors="replace")
     finally:
         lib.ratatui_string_free(out)
-    return s
+        out.value = None
+
+
+def _headless_renderer(name: str) -> Callable[[int, int, Any], str]:
+    """Build ``headless_render_<name>(width, height, widget) -> str``.
+
+    Every single-widget headless entry point shares the signature
+    ``(u16 w, u16 h, handle, char **out)``; only the symbol differs.
+    """
+    symbol = f"ratatui_headless_render_{name}"
+
+    def render(width: int, height: int, widget) -> str:
+        lib = widget._lib
+        out, out_ref = _string_out()
+        ok = getattr(lib, symbol)(width, height, widget._handle, out_ref)
+        if not ok or not out:
+            return ""
+        return _take_string(lib, out)
+
+    render.__name__ = render.__qualname__ = f"headless_render_{name}"
+    return render
+
+
+# Convenience: headless render paragraph
+
+headless_render_paragraph = _headless_renderer("paragraph")
 
 
 class List:
+    _default_lib = None
+
     def __init__(self):
-        self._lib = load_library()
+        self._lib = _class_lib(type(self))
         ptr = self._lib.ratatui_list_new()
         if not ptr:
             raise RuntimeError("ratatui_list_new failed")
         self._handle = C.c_void_p(ptr)
+        self._finalizer = weakref.finalize(self, self._lib.ratatui_list_free, self._handle)
+        # Bound once: append_item is called per row when building lists.
+        self._append_item = self._lib.ratatui_list_append_item
 
-    def append_item(self, text: str, style: Optional[Style] = None) -> None:
-        st = (style or Style()).to_ffi()
-        self._lib.ratatui_list_append_item(self._handle, text.encode("utf-8"), st)
+    def append_item(self, text: TextLike, style: Optional[Style] = None) -> None:
+        self._append_item(self._handle, _utf8(text), _style_ffi(style))
 
     def set_block_title(self, title: Optional[str], show_border: bool = True) -> None:
-        t = title.encode("utf-8") if title is not None else None
+        t = _label_bytes(title)
         self._lib.ratatui_list_set_block_title(self._handle, t, bool(show_border))
 
     def set_block_title_alignment(self, align: str | int) -> None:
@@ -525,7 +948,7 @@ class List:
         self._lib.ratatui_list_set_highlight_style(self._handle, style.to_ffi())
 
     def set_highlight_symbol(self, sym: Optional[str]) -> None:
-        s = None if sym is None else sym.encode("utf-8")
+        s = _label_bytes(sym)
         self._lib.ratatui_list_set_highlight_symbol(self._handle, s)
 
     # Advanced list configuration (v0.2.0+)
@@ -546,36 +969,67 @@ class List:
         arr, _keep = _build_lines_spans(items)
         self._lib.ratatui_list_append_items_spans(self._handle, arr, len(arr))
 
+    def extend_items(self, items: Iterable[TextLike], style: Optional[Style] = None) -> None:
+        """Append many single-style items, in one FFI call when supported."""
+        items = list(items)
+        if not items:
+            return
+        lib = self._lib
+        if hasattr(lib, 'ratatui_list_append_items_spans'):
+            st = style or Style()
+            arr, _keep = _build_lines_spans([((text, st),) for text in items])
+            lib.ratatui_list_append_items_spans(self._handle, arr, len(arr))
+            return
+        if hasattr(lib, 'ratatui_list_reserve_items'):
+            lib.ratatui_list_reserve_items(self._handle, C.c_size_t(len(items)))
+        append, handle, st = self._append_item, self._handle, _style_ffi(style)
+        for text in items:
+            append(handle, _utf8(text), st)
+
     def close(self) -> None:
         if getattr(self, "_handle", None):
-            self._lib.ratatui_list_free(self._handle)
+            self._finalizer()
             self._handle = None
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
-
 
 class Table:
+    _default_lib = None
+
     def __init__(self):
-        self._lib = load_library()
+        self._lib = _class_lib(type(self))
         ptr = self._lib.ratatui_table_new()
         if not ptr:
             raise RuntimeError("ratatui_table_new failed")
         self._handle = C.c_void_p(ptr)
+        self._finalizer = weakref.finalize(self, self._lib.ratatui_table_free, self._handle)
+        self._append_row = self._lib.ratatui_table_append_row
 
     def set_headers(self, headers: Sequence[str]) -> None:
-        tsv = "\t".join(headers).encode("utf-8")
+        tsv = _tsv(headers)
         self._lib.ratatui_table_set_headers(self._handle, tsv)
 
     def append_row(self, row: Sequence[str]) -> None:
-        tsv = "\t".join(row).encode("utf-8")
-        self._lib.ratatui_table_append_row(self._handle, tsv)
+        self._append_row(self._handle, _tsv(row))
+
+    def extend_rows(self, rows: Iterable[Sequence[TextLike]]) -> None:
+        """Append many rows, in one FFI call when supported."""
+        rows = list(rows)
+        if not rows:
+            return
+        lib = self._lib
+        if hasattr(lib, 'ratatui_table_append_rows_cells_lines'):
+            arr, _keep = _build_rows_cells_lines(rows)
+            lib.ratatui_table_append_rows_cells_lines(self._handle, arr, len(arr))
+            return
+        # Older builds: encode each row once and call the bound function directly.
+        if hasattr(lib, 'ratatui_table_reserve_rows'):
+            lib.ratatui_table_reserve_rows(self._handle, C.c_size_t(len(rows)))
+        append, handle = self._append_row, self._handle
+        for row in rows:
+            append(handle, _tsv(row))
 
     def set_block_title(self, title: Optional[str], show_border: bool = True) -> None:
-        t = title.encode("utf-8") if title is not None else None
+        t = _label_bytes(title)
         self._lib.ratatui_table_set_block_title(self._handle, t, bool(show_border))
 
     def set_block_title_alignment(self, align: str | int) -> None:
@@ -589,20 +1043,18 @@ class Table:
         self._lib.ratatui_table_set_row_highlight_style(self._handle, style.to_ffi())
 
     def set_highlight_symbol(self, sym: Optional[str]) -> None:
-        s = None if sym is None else sym.encode("utf-8")
+        s = _label_bytes(sym)
         self._lib.ratatui_table_set_highlight_symbol(self._handle, s)
 
     # Advanced table configuration (v0.2.0+)
     def set_widths(self, widths: Iterable[int]) -> None:
         if hasattr(self._lib, 'ratatui_table_set_widths'):
-            vals = list(widths)
-            arr = (C.c_uint16 * len(vals))(*vals)
+            arr = _c_array(C.c_uint16, "H", widths)
             self._lib.ratatui_table_set_widths(self._handle, arr, len(arr))
 
     def set_widths_percentages(self, percentages: Iterable[int]) -> None:
         if hasattr(self._lib, 'ratatui_table_set_widths_percentages'):
-            vals = list(percentages)
-            arr = (C.c_uint16 * len(vals))(*vals)
+            arr = _c_array(C.c_uint16, "H", percentages)
             self._lib.ratatui_table_set_widths_percentages(self._handle, arr, len(arr))
 
     def set_row_height(self, height: int) -> None:
@@ -637,14 +1089,8 @@ class Table:
             self.append_row([''.join(text for line in cell for text, _ in line) for cell in row])
             return
         # Build [FfiCellLines]
-        FfiLineSpans = load_library().FfiLineSpans
-        FfiCellLines = load_library().FfiCellLines
-        cell_arrays = []
-        keep: list[bytes] = []
-        for cell in row:
-            lines_arr, keep2 = _build_lines_spans(cell)
-            cell_arrays.append((lines_arr, keep2))
-            keep.extend(keep2)
+        FfiCellLines = self._lib.FfiCellLines
+        cell_arrays = [_build_lines_spans(cell) for cell in row]
         out = (FfiCellLines * len(row))()
         for i, (lines_arr, _k) in enumerate(cell_arrays):
             out[i] = FfiCellLines(lines_arr, len(lines_arr))
@@ -652,35 +1098,32 @@ class Table:
 
     def close(self) -> None:
         if getattr(self, "_handle", None):
-            self._lib.ratatui_table_free(self._handle)
+            self._finalizer()
             self._handle = None
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
-
 
 class Gauge:
+    _default_lib = None
+
     def __init__(self):
-        self._lib = load_library()
+        self._lib = _class_lib(type(self))
         ptr = self._lib.ratatui_gauge_new()
         if not ptr:
             raise RuntimeError("ratatui_gauge_new failed")
         self._handle = C.c_void_p(ptr)
+        self._finalizer = weakref.finalize(self, self._lib.ratatui_gauge_free, self._handle)
 
     def ratio(self, value: float) -> "Gauge":
         self._lib.ratatui_gauge_set_ratio(self._handle, float(value))
         return self
 
     def label(self, text: Optional[str]) -> "Gauge":
-        t = text.encode("utf-8") if text is not None else None
+        t = _label_bytes(text)
         self._lib.ratatui_gauge_set_label(self._handle, t)
         return self
 
     def set_block_title(self, title: Optional[str], show_border: bool = True) -> None:
-        t = title.encode("utf-8") if title is not None else None
+        t = _label_bytes(title)
         self._lib.ratatui_gauge_set_block_title(self._handle, t, bool(show_border))
 
     def set_block_title_alignment(self, align: str | int) -> None:
@@ -693,33 +1136,30 @@ class Gauge:
 
     def close(self) -> None:
         if getattr(self, "_handle", None):
-            self._lib.ratatui_gauge_free(self._handle)
+            self._finalizer()
             self._handle = None
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
-
 
 class Tabs:
+    _default_lib = None
+
     def __init__(self):
-        self._lib = load_library()
+        self._lib = _class_lib(type(self))
         ptr = self._lib.ratatui_tabs_new()
         if not ptr:
             raise RuntimeError("ratatui_tabs_new failed")
         self._handle = C.c_void_p(ptr)
+        self._finalizer = weakref.finalize(self, self._lib.ratatui_tabs_free, self._handle)
 
     def set_titles(self, titles: Sequence[str]) -> None:
-        tsv = "\t".join(titles).encode("utf-8")
+        tsv = _tsv(titles)
         self._lib.ratatui_tabs_set_titles(self._handle, tsv)
 
     def set_selected(self, idx: int) -> None:
         self._lib.ratatui_tabs_set_selected(self._handle, int(idx))
 
     def set_block_title(self, title: Optional[str], show_border: bool = True) -> None:
-        t = title.encode("utf-8") if title is not None else None
+        t = _label_bytes(title)
         self._lib.ratatui_tabs_set_block_title(self._handle, t, bool(show_border))
 
     def set_block_title_alignment(self, align: str | int) -> None:
@@ -732,7 +1172,7 @@ class Tabs:
 
     def set_divider(self, s: str) -> None:
         if hasattr(self._lib, 'ratatui_tabs_set_divider'):
-            self._lib.ratatui_tabs_set_divider(self._handle, s.encode('utf-8'))
+            self._lib.ratatui_tabs_set_divider(self._handle, _utf8(s))
 
     def set_styles(self, unselected: Style, selected: Style) -> None:
         if hasattr(self._lib, 'ratatui_tabs_set_styles'):
@@ -747,34 +1187,32 @@ class Tabs:
 
     def close(self) -> None:
         if getattr(self, "_handle", None):
-            self._lib.ratatui_tabs_free(self._handle)
+            self._finalizer()
             self._handle = None
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
-
 
 class BarChart:
+    _default_lib = None
+
     def __init__(self):
-        self._lib = load_library()
+        self._lib = _class_lib(type(self))
         ptr = self._lib.ratatui_barchart_new()
         if not ptr:
             raise RuntimeError("ratatui_barchart_new failed")
         self._handle = C.c_void_p(ptr)
+        self._finalizer = weakref.finalize(self, self._lib.ratatui_barchart_free, self._handle)
 
     def set_values(self, values: Iterable[int]) -> None:
-        arr = (C.c_uint64 * len(list(values)))(*list(values))
+        """Set the values; a uint64 numpy array is passed without copying."""
+        arr = _c_array(C.c_uint64, "Q", values)
         self._lib.ratatui_barchart_set_values(self._handle, arr, len(arr))
 
     def set_labels(self, labels: Sequence[str]) -> None:
-        tsv = "\t".join(labels).encode("utf-8")
+        tsv = _tsv(labels)
         self._lib.ratatui_barchart_set_labels(self._handle, tsv)
 
     def set_block_title(self, title: Optional[str], show_border: bool = True) -> None:
-        t = title.encode("utf-8") if title is not None else None
+        t = _label_bytes(title)
         self._lib.ratatui_barchart_set_block_title(self._handle, t, bool(show_border))
 
     def set_block_title_alignment(self, align: str | int) -> None:
@@ -795,30 +1233,28 @@ class BarChart:
 
     def close(self) -> None:
         if getattr(self, "_handle", None):
-            self._lib.ratatui_barchart_free(self._handle)
+            self._finalizer()
             self._handle = None
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
-
 
 class Sparkline:
+    _default_lib = None
+
     def __init__(self):
-        self._lib = load_library()
+        self._lib = _class_lib(type(self))
         ptr = self._lib.ratatui_sparkline_new()
         if not ptr:
             raise RuntimeError("ratatui_sparkline_new failed")
         self._handle = C.c_void_p(ptr)
+        self._finalizer = weakref.finalize(self, self._lib.ratatui_sparkline_free, self._handle)
 
     def set_values(self, values: Iterable[int]) -> None:
-        arr = (C.c_uint64 * len(list(values)))(*list(values))
+        """Set the values; a uint64 numpy array is passed without copying."""
+        arr = _c_array(C.c_uint64, "Q", values)
         self._lib.ratatui_sparkline_set_values(self._handle, arr, len(arr))
 
     def set_block_title(self, title: Optional[str], show_border: bool = True) -> None:
-        t = title.encode("utf-8") if title is not None else None
+        t = _label_bytes(title)
         self._lib.ratatui_sparkline_set_block_title(self._handle, t, bool(show_border))
 
     def set_block_title_alignment(self, align: str | int) -> None:
@@ -835,33 +1271,30 @@ class Sparkline:
 
     def close(self) -> None:
         if getattr(self, "_handle", None):
-            self._lib.ratatui_sparkline_free(self._handle)
+            self._finalizer()
             self._handle = None
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
-
 
 # Optional Scrollbar (only if built with feature)
 class Scrollbar:
+    _default_lib = None
+
     def __init__(self):
-        self._lib = load_library()
+        self._lib = _class_lib(type(self))
         if not hasattr(self._lib, 'ratatui_scrollbar_new'):
             raise RuntimeError("ratatui_ffi built without 'scrollbar' feature")
         ptr = self._lib.ratatui_scrollbar_new()
         if not ptr:
             raise RuntimeError("ratatui_scrollbar_new failed")
         self._handle = C.c_void_p(ptr)
+        self._finalizer = weakref.finalize(self, self._lib.ratatui_scrollbar_free, self._handle)
 
     def configure(self, orient: str, position: int, content_len: int, viewport_len: int) -> None:
         o = 0 if orient.lower().startswith('v') else 1
         self._lib.ratatui_scrollbar_configure(self._handle, o, int(position), int(content_len), int(viewport_len))
 
     def set_block_title(self, title: Optional[str], show_border: bool = True) -> None:
-        t = title.encode("utf-8") if title is not None else None
+        t = _label_bytes(title)
         self._lib.ratatui_scrollbar_set_block_title(self._handle, t, bool(show_border))
 
     def set_block_title_alignment(self, align: str | int) -> None:
@@ -870,103 +1303,39 @@ class Scrollbar:
 
     def close(self) -> None:
         if getattr(self, "_handle", None):
-            self._lib.ratatui_scrollbar_free(self._handle)
+            self._finalizer()
             self._handle = None
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
-
 
 # Headless helpers for other widgets
-def headless_render_list(width: int, height: int, lst: List) -> str:
-    lib = lst._lib
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_list(C.c_uint16(width), C.c_uint16(height), lst._handle, C.byref(out))
-    if not ok or not out:
-        return ""
-    try:
-        return C.cast(out, C.c_char_p).value.decode("utf-8", errors="replace")
-    finally:
-        lib.ratatui_string_free(out)
-
-def headless_render_table(width: int, height: int, tbl: Table) -> str:
-    lib = tbl._lib
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_table(C.c_uint16(width), C.c_uint16(height), tbl._handle, C.byref(out))
-    if not ok or not out:
-        return ""
-    try:
-        return C.cast(out, C.c_char_p).value.decode("utf-8", errors="replace")
-    finally:
-        lib.ratatui_string_free(out)
-
-def headless_render_gauge(width: int, height: int, g: Gauge) -> str:
-    lib = g._lib
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_gauge(C.c_uint16(width), C.c_uint16(height), g._handle, C.byref(out))
-    if not ok or not out:
-        return ""
-    try:
-        return C.cast(out, C.c_char_p).value.decode("utf-8", errors="replace")
-    finally:
-        lib.ratatui_string_free(out)
-
-def headless_render_tabs(width: int, height: int, t: Tabs) -> str:
-    lib = t._lib
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_tabs(C.c_uint16(width), C.c_uint16(height), t._handle, C.byref(out))
-    if not ok or not out:
-        return ""
-    try:
-        return C.cast(out, C.c_char_p).value.decode("utf-8", errors="replace")
-    finally:
-        lib.ratatui_string_free(out)
-
-def headless_render_barchart(width: int, height: int, b: BarChart) -> str:
-    lib = b._lib
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_barchart(C.c_uint16(width), C.c_uint16(height), b._handle, C.byref(out))
-    if not ok or not out:
-        return ""
-    try:
-        return C.cast(out, C.c_char_p).value.decode("utf-8", errors="replace")
-    finally:
-        lib.ratatui_string_free(out)
-
-def headless_render_sparkline(width: int, height: int, s: Sparkline) -> str:
-    lib = s._lib
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_sparkline(C.c_uint16(width), C.c_uint16(height), s._handle, C.byref(out))
-    if not ok or not out:
-        return ""
-    try:
-        return C.cast(out, C.c_char_p).value.decode("utf-8", errors="replace")
-    finally:
-        lib.ratatui_string_free(out)
+headless_render_list = _headless_renderer("list")
+headless_render_table = _headless_renderer("table")
+headless_render_gauge = _headless_renderer("gauge")
+headless_render_tabs = _headless_renderer("tabs")
+headless_render_barchart = _headless_renderer("barchart")
+headless_render_sparkline = _headless_renderer("sparkline")
 
 
 class Chart:
+    _default_lib = None
+
     def __init__(self):
-        self._lib = load_library()
+        self._lib = _class_lib(type(self))
         ptr = self._lib.ratatui_chart_new()
         if not ptr:
             raise RuntimeError("ratatui_chart_new failed")
         self._handle = C.c_void_p(ptr)
+        self._finalizer = weakref.finalize(self, self._lib.ratatui_chart_free, self._handle)
 
     def add_line(self, name: str, points: Sequence[Tuple[float, float]], style: Optional[Style] = None) -> None:
-        n = name.encode("utf-8")
-        flat = []
-        for (x, y) in points:
-            flat.extend([float(x), float(y)])
-        arr = (C.c_double * len(flat))(*flat)
-        self._lib.ratatui_chart_add_line(self._handle, n, arr, len(points), (style or Style()).to_ffi())
+        """Add a dataset; ``points`` may also be a float64 numpy array of shape (N, 2)."""
+        n = _utf8(name)
+        arr, count, _keep = _xy_buffer(points)
+        self._lib.ratatui_chart_add_line(self._handle, n, arr, count, _style_ffi(style))
 
     def set_axes_titles(self, x: Optional[str], y: Optional[str]) -> None:
-        xx = None if x is None else x.encode("utf-8")
-        yy = None if y is None else y.encode("utf-8")
+        xx = _label_bytes(x)
+        yy = _label_bytes(y)
         self._lib.ratatui_chart_set_axes_titles(self._handle, xx, yy)
 
     def set_bounds(self, x_min: float, x_max: float, y_min: float, y_max: float) -> None:
@@ -987,8 +1356,8 @@ class Chart:
 
     def set_hidden_legend_constraints(self, kinds2: Sequence[int], values2: Sequence[int]) -> None:
         if hasattr(self._lib, 'ratatui_chart_set_hidden_legend_constraints'):
-            k = (C.c_uint32 * len(kinds2))(*[int(x) for x in kinds2])
-            v = (C.c_uint16 * len(values2))(*[int(x) for x in values2])
+            k = _c_array(C.c_uint32, _U32, kinds2)
+            v = _c_array(C.c_uint16, "H", values2)
             self._lib.ratatui_chart_set_hidden_legend_constraints(self._handle, k, v)
 
     def set_labels_alignment(self, x_align: str | int, y_align: str | int) -> None:
@@ -1008,7 +1377,7 @@ class Chart:
         self._lib.ratatui_chart_set_y_labels_spans(self._handle, arr, len(arr))
 
     def set_block_title(self, title: Optional[str], show_border: bool = True) -> None:
-        t = None if title is None else title.encode("utf-8")
+        t = _label_bytes(title)
         self._lib.ratatui_chart_set_block_title(self._handle, t, bool(show_border))
 
     def set_block_title_alignment(self, align: str | int) -> None:
@@ -1017,57 +1386,38 @@ class Chart:
 
     def close(self) -> None:
         if getattr(self, "_handle", None):
-            self._lib.ratatui_chart_free(self._handle)
+            self._finalizer()
             self._handle = None
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
 
-
-def headless_render_chart(width: int, height: int, c: Chart) -> str:
-    lib = c._lib
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_chart(C.c_uint16(width), C.c_uint16(height), c._handle, C.byref(out))
-    if not ok or not out:
-        return ""
-    try:
-        return C.cast(out, C.c_char_p).value.decode("utf-8", errors="replace")
-    finally:
-        lib.ratatui_string_free(out)
+headless_render_chart = _headless_renderer("chart")
 
 
 def headless_render_logo(width: int, height: int) -> str:
     lib = load_library()
     if not hasattr(lib, 'ratatui_headless_render_ratatuilogo'):
         return ""
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_ratatuilogo(C.c_uint16(width), C.c_uint16(height), C.byref(out))
+    out, out_ref = _string_out()
+    ok = lib.ratatui_headless_render_ratatuilogo(width, height, out_ref)
     if not ok or not out:
         return ""
-    try:
-        return C.cast(out, C.c_char_p).value.decode('utf-8', errors='replace')
-    finally:
-        lib.ratatui_string_free(out)
+    return _take_string(lib, out)
 
 
 def headless_render_logo_sized(width: int, height: int, size: int) -> str:
     lib = load_library()
     if not hasattr(lib, 'ratatui_headless_render_ratatuilogo_sized'):
         return ""
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_ratatuilogo_sized(C.c_uint16(width), C.c_uint16(height), C.c_uint32(int(size)), C.byref(out))
+    out, out_ref = _string_out()
+    ok = lib.ratatui_headless_render_ratatuilogo_sized(width, height, int(size), out_ref)
     if not ok or not out:
         return ""
-    try:
-        return C.cast(out, C.c_char_p).value.decode('utf-8', errors='replace')
-    finally:
-        lib.ratatui_string_free(out)
+    return _take_string(lib, out)
 
 
 class DrawCmd:
+    __slots__ = ("kind", "handle", "rect", "owner")
+
     def __init__(self, kind: int, handle: C.c_void_p, rect: FfiRect, owner: Optional[object] = None):
         self.kind = int(kind)
         self.handle = handle
@@ -1078,48 +1428,151 @@ class DrawCmd:
 
     @staticmethod
     def paragraph(p: Paragraph, rect: RectLike) -> "DrawCmd":
-        return DrawCmd(FFI_WIDGET_KIND["Paragraph"], p._handle, _ffi_rect(rect), owner=p)
+        return DrawCmd(WidgetKind.Paragraph, p._handle, _ffi_rect(rect), owner=p)
 
     @staticmethod
     def list(lst: List, rect: RectLike) -> "DrawCmd":
-        return DrawCmd(FFI_WIDGET_KIND["List"], lst._handle, _ffi_rect(rect), owner=lst)
+        return DrawCmd(WidgetKind.List, lst._handle, _ffi_rect(rect), owner=lst)
 
     @staticmethod
     def table(t: Table, rect: RectLike) -> "DrawCmd":
-        return DrawCmd(FFI_WIDGET_KIND["Table"], t._handle, _ffi_rect(rect), owner=t)
+        return DrawCmd(WidgetKind.Table, t._handle, _ffi_rect(rect), owner=t)
 
     @staticmethod
     def gauge(g: Gauge, rect: RectLike) -> "DrawCmd":
-        return DrawCmd(FFI_WIDGET_KIND["Gauge"], g._handle, _ffi_rect(rect), owner=g)
+        return DrawCmd(WidgetKind.Gauge, g._handle, _ffi_rect(rect), owner=g)
 
     @staticmethod
     def tabs(t: Tabs, rect: RectLike) -> "DrawCmd":
-        return DrawCmd(FFI_WIDGET_KIND["Tabs"], t._handle, _ffi_rect(rect), owner=t)
+        return DrawCmd(WidgetKind.Tabs, t._handle, _ffi_rect(rect), owner=t)
 
     @staticmethod
     def barchart(b: BarChart, rect: RectLike) -> "DrawCmd":
-        return DrawCmd(FFI_WIDGET_KIND["BarChart"], b._handle, _ffi_rect(rect), owner=b)
+        return DrawCmd(WidgetKind.BarChart, b._handle, _ffi_rect(rect), owner=b)
 
     @staticmethod
     def sparkline(s: Sparkline, rect: RectLike) -> "DrawCmd":
-        return DrawCmd(FFI_WIDGET_KIND["Sparkline"], s._handle, _ffi_rect(rect), owner=s)
+        return DrawCmd(WidgetKind.Sparkline, s._handle, _ffi_rect(rect), owner=s)
 
     @staticmethod
     def chart(c: Chart, rect: RectLike) -> "DrawCmd":
-        return DrawCmd(FFI_WIDGET_KIND["Chart"], c._handle, _ffi_rect(rect), owner=c)
+        return DrawCmd(WidgetKind.Chart, c._handle, _ffi_rect(rect), owner=c)
+
+
+class FrameBuilder:
+    """Reusable draw-command buffer for ``Terminal.draw_frame_builder``.
+
+    Commands are written in place into an ``FfiDrawCmd`` array that doubles
+    when full and is kept across frames; call ``clear()`` before each frame.
+    """
+
+    __slots__ = ("_arr", "_n", "_owners", "_cmd_type")
+    _default_lib = None
+
+    def __init__(self, capacity: int = 16):
+        self._cmd_type = _class_lib(type(self)).FfiDrawCmd
+        self._arr = (self._cmd_type * max(1, int(capacity)))()
+        self._n = 0
+        # Widgets referenced by the buffer; keeps their handles alive.
+        self._owners: list = []
+
+    def __len__(self) -> int:
+        return self._n
+
+    def clear(self) -> None:
+        self._n = 0
+        self._owners.clear()
+
+    def _free_slot(self):
+        # The slot past the end; it only counts once ``_n`` is bumped, so a
+        # write that raises leaves the buffer as it was.
+        n = self._n
+        arr = self._arr
+        if n == len(arr):
+            grown = (self._cmd_type * (2 * n))()
+            C.memmove(grown, arr, C.sizeof(arr))
+            self._arr = arr = grown
+        return arr[n]
+
+    def add(self, kind: int, widget: Any, rect: RectLike) -> "FrameBuilder":
+        handle = widget._handle
+        cmd = self._free_slot()
+        if isinstance(rect, FfiRect):
+            cmd.rect = rect
+        else:
+            r = cmd.rect
+            try:
+                if type(rect) is not tuple:
+                    raise TypeError
+                r.x, r.y, r.width, r.height = rect
+            except TypeError:
+                if hasattr(rect, "to_tuple"):
+                    rect = rect.to_tuple()  # type: ignore[union-attr]
+                x, y, w, h = rect  # type: ignore[misc]
+                r.x = int(x)
+                r.y = int(y)
+                r.width = int(w)
+                r.height = int(h)
+        cmd.kind = kind
+        cmd.handle = handle
+        self._owners.append(widget)
+        self._n += 1
+        return self
+
+    def extend(self, cmds: Iterable["DrawCmd"]) -> "FrameBuilder":
+        """Copy prebuilt ``DrawCmd`` objects into the buffer."""
+        for cmd in cmds:
+            slot = self._free_slot()
+            slot.kind = cmd.kind
+            slot.handle = cmd.handle
+            slot.rect = cmd.rect
+            self._owners.append(cmd.owner)
+            self._n += 1
+        return self
+
+    def add_paragraph(self, p: Paragraph, rect: RectLike) -> "FrameBuilder":
+        return self.add(_WK_PARAGRAPH, p, rect)
+
+    def add_list(self, lst: "List", rect: RectLike) -> "FrameBuilder":
+        return self.add(WidgetKind.List, lst, rect)
+
+    def add_table(self, t: "Table", rect: RectLike) -> "FrameBuilder":
+        return self.add(WidgetKind.Table, t, rect)
+
+    def add_gauge(self, g: "Gauge", rect: RectLike) -> "FrameBuilder":
+        return self.add(WidgetKind.Gauge, g, rect)
+
+    def add_tabs(self, t: "Tabs", rect: RectLike) -> "FrameBuilder":
+        return self.add(WidgetKind.Tabs, t, rect)
+
+    def add_barchart(self, b: "BarChart", rect: RectLike) -> "FrameBuilder":
+        return self.add(WidgetKind.BarChart, b, rect)
+
+    def add_sparkline(self, s: "Sparkline", rect: RectLike) -> "FrameBuilder":
+        return self.add(WidgetKind.Sparkline, s, rect)
+
+    def add_chart(self, c: "Chart", rect: RectLike) -> "FrameBuilder":
+        return self.add(WidgetKind.Chart, c, rect)
 
 
 def _ffi_rect(rect: RectLike) -> FfiRect:
     """Accept either a tuple or a Rect and produce an FfiRect.
 
     This keeps the external API pythonic while preserving a zero-copy path
-    for the FFI struct construction.
+    for the FFI struct construction; an ``FfiRect`` is returned as-is.
     """
+    if isinstance(rect, FfiRect):
+        return rect
     if hasattr(rect, "to_tuple"):
-        x, y, w, h = rect.to_tuple()  # type: ignore[attr-defined]
+        rect = rect.to_tuple()  # type: ignore[attr-defined]
+    elif type(rect) is not tuple:
+        rect = tuple(rect)  # type: ignore[arg-type]
+    try:
+        return _pooled_rect(rect)
+    except TypeError:
+        # Unhashable components; build a one-off struct.
+        x, y, w, h = rect
         return FfiRect(int(x), int(y), int(w), int(h))
-    x, y, w, h = rect  # type: ignore[misc]
-    return FfiRect(int(x), int(y), int(w), int(h))
 
 
 def _align_value(align: str | int) -> int:
@@ -1141,6 +1594,15 @@ class Frame:
         self._cmds: _List[DrawCmd] = []
         self.ok: Optional[bool] = None
 
+    def draw(self, widget: Any, rect: RectLike) -> None:
+        """Queue any frame-drawable widget at ``rect``; the kind comes from its type."""
+        for cls in type(widget).__mro__:
+            entry = _HEADLESS_KINDS.get(cls)
+            if entry is not None:
+                self._cmds.append(DrawCmd(entry[0], widget._handle, _ffi_rect(rect), owner=widget))
+                return
+        raise TypeError(f"{type(widget).__name__} cannot be drawn in a frame")
+
     # mirror DrawCmd helpers for convenience
     def paragraph(self, p: Paragraph, rect: RectLike) -> None:
         self._cmds.append(DrawCmd.paragraph(p, rect))
@@ -1169,16 +1631,32 @@ class Frame:
     def canvas(self, cv: "Canvas", rect: RectLike) -> None:
         self._cmds.append(DrawCmd(FFI_WIDGET_KIND.get("Canvas", 0), cv._handle, _ffi_rect(rect), owner=cv))
 
+    def extend(self, cmds: Sequence[DrawCmd]) -> None:
+        self._cmds.extend(cmds)
+
+    def __enter__(self) -> "Frame":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.ok = self._term.draw_frame(self._cmds)
+
 
 class Canvas:
+    _default_lib = None
+
     def __init__(self, x_min: float = 0.0, x_max: float = 1.0, y_min: float = 0.0, y_max: float = 1.0):
-        self._lib = load_library()
+        self._lib = _class_lib(type(self))
         if not hasattr(self._lib, 'ratatui_canvas_new'):
             raise RuntimeError('ratatui_ffi lacks Canvas APIs')
         ptr = self._lib.ratatui_canvas_new(C.c_double(x_min), C.c_double(x_max), C.c_double(y_min), C.c_double(y_max))
         if not ptr:
             raise RuntimeError('ratatui_canvas_new failed')
         self._handle = C.c_void_p(ptr)
+        self._finalizer = weakref.finalize(self, self._lib.ratatui_canvas_free, self._handle)
+        # Shapes are added one call each, often hundreds per frame.
+        self._add_line = self._lib.ratatui_canvas_add_line
+        self._add_rect = self._lib.ratatui_canvas_add_rect
 
     def set_bounds(self, x_min: float, x_max: float, y_min: float, y_max: float) -> "Canvas":
         self._lib.ratatui_canvas_set_bounds(self._handle, C.c_double(x_min), C.c_double(x_max), C.c_double(y_min), C.c_double(y_max))
@@ -1189,7 +1667,7 @@ class Canvas:
         return self
 
     def set_block_title(self, title: Optional[str], show_border: bool = True) -> "Canvas":
-        t = None if title is None else title.encode('utf-8')
+        t = _label_bytes(title)
         self._lib.ratatui_canvas_set_block_title(self._handle, t, bool(show_border))
         return self
 
@@ -1203,50 +1681,23 @@ class Canvas:
         return self
 
     def add_line(self, x1: float, y1: float, x2: float, y2: float, style: Optional[Style] = None) -> None:
-        self._lib.ratatui_canvas_add_line(self._handle, C.c_double(x1), C.c_double(y1), C.c_double(x2), C.c_double(y2), (style or Style()).to_ffi())
+        # The argtypes convert plain floats; no c_double wrappers needed.
+        self._add_line(self._handle, x1, y1, x2, y2, _style_ffi(style))
 
     def add_rect(self, x: float, y: float, w: float, h: float, style: Optional[Style] = None, filled: bool = False) -> None:
-        self._lib.ratatui_canvas_add_rect(self._handle, C.c_double(x), C.c_double(y), C.c_double(w), C.c_double(h), (style or Style()).to_ffi(), bool(filled))
+        self._add_rect(self._handle, x, y, w, h, _style_ffi(style), bool(filled))
 
     def add_points(self, points: Sequence[Tuple[float, float]], style: Optional[Style] = None, marker: int = 0) -> None:
-        vals: list[float] = []
-        for (x, y) in points:
-            vals.extend([float(x), float(y)])
-        arr = (C.c_double * len(vals))(*vals)
-        self._lib.ratatui_canvas_add_points(self._handle, arr, len(points), (style or Style()).to_ffi(), C.c_uint32(int(marker)))
+        arr, count, _keep = _xy_buffer(points)
+        self._lib.ratatui_canvas_add_points(self._handle, arr, count, _style_ffi(style), C.c_uint32(int(marker)))
 
     def close(self) -> None:
         if getattr(self, '_handle', None):
-            self._lib.ratatui_canvas_free(self._handle)
+            self._finalizer()
             self._handle = None
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
-
-
-def headless_render_canvas(width: int, height: int, canvas: Canvas) -> str:
-    lib = canvas._lib
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_canvas(C.c_uint16(width), C.c_uint16(height), canvas._handle, C.byref(out))
-    if not ok or not out:
-        return ""
-    try:
-        return C.cast(out, C.c_char_p).value.decode('utf-8', errors='replace')
-    finally:
-        lib.ratatui_string_free(out)
-
-    def extend(self, cmds: Sequence[DrawCmd]) -> None:
-        self._cmds.extend(cmds)
 
-    def __enter__(self) -> "Frame":
-        return self
-
-    def __exit__(self, exc_type, exc, tb) -> None:
-        if exc_type is None:
-            self.ok = self._term.draw_frame(self._cmds)
+headless_render_canvas = _headless_renderer("canvas")
 
 
 # Headless frame helpers
@@ -1254,85 +1705,228 @@ def headless_render_frame(width: int, height: int, cmds: Sequence[DrawCmd]) -> s
     lib = load_library()
     if not hasattr(lib, 'ratatui_headless_render_frame'):
         return ""
-    FfiDrawCmd = lib.FfiDrawCmd
-    arr = (FfiDrawCmd * len(cmds))()
-    for i, cmd in enumerate(cmds):
-        arr[i] = FfiDrawCmd(cmd.kind, cmd.handle, cmd.rect)
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_frame(C.c_uint16(width), C.c_uint16(height), arr, len(cmds), C.byref(out))
+    arr = _pack_draw_cmds((lib.FfiDrawCmd * len(cmds))(), cmds)
+    out, out_ref = _string_out()
+    ok = lib.ratatui_headless_render_frame(width, height, arr, len(cmds), out_ref)
     if not ok or not out:
         return ""
-    try:
-        return C.cast(out, C.c_char_p).value.decode('utf-8', errors='replace')
-    finally:
-        lib.ratatui_string_free(out)
+    return _take_string(lib, out)
 
 
 def headless_render_frame_styles_ex(width: int, height: int, cmds: Sequence[DrawCmd]) -> str:
     lib = load_library()
     if not hasattr(lib, 'ratatui_headless_render_frame_styles_ex'):
         return ""
-    FfiDrawCmd = lib.FfiDrawCmd
-    arr = (FfiDrawCmd * len(cmds))()
-    for i, cmd in enumerate(cmds):
-        arr[i] = FfiDrawCmd(cmd.kind, cmd.handle, cmd.rect)
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_frame_styles_ex(C.c_uint16(width), C.c_uint16(height), arr, len(cmds), C.byref(out))
+    arr = _pack_draw_cmds((lib.FfiDrawCmd * len(cmds))(), cmds)
+    out, out_ref = _string_out()
+    ok = lib.ratatui_headless_render_frame_styles_ex(width, height, arr, len(cmds), out_ref)
     if not ok or not out:
         return ""
-    try:
-        return C.cast(out, C.c_char_p).value.decode('utf-8', errors='replace')
-    finally:
-        lib.ratatui_string_free(out)
+    return _take_string(lib, out)
 
 
 def headless_render_frame_cells(width: int, height: int, cmds: Sequence[DrawCmd]):
     lib = load_library()
     if not hasattr(lib, 'ratatui_headless_render_frame_cells'):
         return []
-    FfiDrawCmd = lib.FfiDrawCmd
-    arr = (FfiDrawCmd * len(cmds))()
-    for i, cmd in enumerate(cmds):
-        arr[i] = FfiDrawCmd(cmd.kind, cmd.handle, cmd.rect)
+    arr = _pack_draw_cmds((lib.FfiDrawCmd * len(cmds))(), cmds)
     cap = int(width) * int(height)
     Cell = lib.FfiCellInfo
     buf = (Cell * cap)()
-    n = int(lib.ratatui_headless_render_frame_cells(C.c_uint16(width), C.c_uint16(height), arr, len(cmds), buf, cap))
-    out = []
-    for i in range(min(n, cap)):
-        c = buf[i]
-        out.append({"ch": int(c.ch), "fg": int(c.fg), "bg": int(c.bg), "mods": int(c.mods)})
+    n = min(int(lib.ratatui_headless_render_frame_cells(width, height, arr, len(cmds), buf, cap)), cap)
+    # One unpack over the raw buffer instead of a ctypes attribute access per
+    # field per cell.
+    fmt = "@IIIH" + "x" * (C.sizeof(Cell) - struct.calcsize("@IIIH"))
+    keys = ("ch", "fg", "bg", "mods")
+    raw = memoryview(buf).cast("B")[: n * C.sizeof(Cell)]
+    return [dict(zip(keys, c)) for c in struct.iter_unpack(fmt, raw)]
+
+
+def headless_render_frame_cells_np(width: int, height: int, cmds: Sequence[DrawCmd]):
+    """Like ``headless_render_frame_cells`` but as a numpy structured array.
+
+    The library writes straight into the array (fields ``ch``, ``fg``, ``bg``,
+    ``mods``), so whole frames can be compared with vectorised numpy ops.
+    Requires numpy.
+    """
+    np = _numpy()
+    if np is None:
+        raise RuntimeError("headless_render_frame_cells_np requires numpy")
+    lib = load_library()
+    Cell = lib.FfiCellInfo
+    if not hasattr(lib, 'ratatui_headless_render_frame_cells'):
+        return np.empty(0, dtype=np.dtype(Cell))
+    arr = _pack_draw_cmds((lib.FfiDrawCmd * len(cmds))(), cmds)
+    cap = int(width) * int(height)
+    out = np.empty(cap, dtype=np.dtype(Cell))
+    n = int(lib.ratatui_headless_render_frame_cells(width, height, arr, len(cmds), out.ctypes.data_as(C.POINTER(Cell)), cap))
+    return out[:min(n, cap)]
+
+
+# Widget class -> (frame draw kind, single-widget headless renderer).
+_HEADLESS_KINDS = {
+    Paragraph: (WidgetKind.Paragraph, headless_render_paragraph),
+    List: (WidgetKind.List, headless_render_list),
+    Table: (WidgetKind.Table, headless_render_table),
+    Gauge: (WidgetKind.Gauge, headless_render_gauge),
+    Tabs: (WidgetKind.Tabs, headless_render_tabs),
+    BarChart: (WidgetKind.BarChart, headless_render_barchart),
+    Sparkline: (WidgetKind.Sparkline, headless_render_sparkline),
+    Chart: (WidgetKind.Chart, headless_render_chart),
+}
+
+
+def _headless_entry(widget: Any):
+    for cls in type(widget).__mro__:
+        entry = _HEADLESS_KINDS.get(cls)
+        if entry is not None:
+            return entry
+    raise TypeError(f"unsupported widget for headless render: {type(widget).__name__}")
+
+
+def headless_render_many(items: Sequence[Tuple[int, int, Any]]) -> _List[str]:
+    """Render several widgets, each ``(width, height, widget)``, in one call.
+
+    Widgets of the same width are stacked in a single headless frame and the
+    output is split back by rows, so each result equals the matching
+    ``headless_render_<kind>(width, height, widget)``. Rows are never cut by
+    column: the text encoding of wide glyphs is the library's business. Builds
+    without the headless frame API render each widget separately.
+    """
+    if not items:
+        return []
+    entries = [_headless_entry(widget) for _w, _h, widget in items]
+    lib = load_library()
+    if not hasattr(lib, 'ratatui_headless_render_frame'):
+        return [entry[1](w, h, widget) for entry, (w, h, widget) in zip(entries, items)]
+    groups: Dict[int, _List[int]] = {}
+    for i, (w, _h, _widget) in enumerate(items):
+        groups.setdefault(int(w), []).append(i)
+    out: _List[str] = [""] * len(items)
+    for w, idxs in groups.items():
+        total_h = sum(int(items[i][1]) for i in idxs)
+        if total_h > 0xFFFF:
+            for i in idxs:
+                iw, ih, widget = items[i]
+                out[i] = entries[i][1](iw, ih, widget)
+            continue
+        cmds = []
+        y = 0
+        for i in idxs:
+            h, widget = int(items[i][1]), items[i][2]
+            cmds.append(DrawCmd(entries[i][0], widget._handle, FfiRect(0, y, w, h), owner=widget))
+            y += h
+        text = headless_render_frame(w, total_h, cmds)
+        # keep the library's row terminator so every slice reads like a single render
+        tail = "\n" if text.endswith("\n") else ""
+        rows = (text[:-1] if tail else text).split("\n")
+        y = 0
+        for i in idxs:
+            h = int(items[i][1])
+            out[i] = "\n".join(rows[y:y + h]) + tail
+            y += h
     return out
 
 
+# Span arrays are written field-wise: every text goes into one NUL-separated
+# block and each FfiSpan points into it, so no FfiSpan/FfiLineSpans temporary
+# is built per element. Pointer+length structs share one layout.
+_SPAN = struct.Struct("@PIIH" + "x" * (C.sizeof(FfiSpan) - struct.calcsize("@PIIH")))
+_PTR_LEN = struct.Struct("@PN")
+_SPAN_DTYPE = None
+# Below this many spans the per-element pack beats numpy's setup cost.
+_SPAN_NP_MIN = 64
+
+
+def _span_dtype(np):
+    # numpy cannot derive a dtype from FfiSpan (c_char_p field), so mirror its
+    # layout with the text pointer as an unsigned address.
+    global _SPAN_DTYPE
+    if _SPAN_DTYPE is None:
+        st = FfiSpan.style.offset
+        _SPAN_DTYPE = np.dtype({
+            "names": ["text", "fg", "bg", "mods"],
+            "formats": [np.uintp, np.uint32, np.uint32, np.uint16],
+            "offsets": [FfiSpan.text_utf8.offset, st + FfiStyle.fg.offset, st + FfiStyle.bg.offset, st + FfiStyle.mods.offset],
+            "itemsize": C.sizeof(FfiSpan),
+        })
+    return _SPAN_DTYPE
+
+
+def _fill_spans(bufs: Sequence[bytes], styles: Sequence[Optional["Style"]]):
+    """Return ``(FfiSpan array, keepalive)`` for parallel texts and styles."""
+    n = len(bufs)
+    arr = (FfiSpan * n)()
+    if not n:
+        return arr, (arr,)
+    block = C.create_string_buffer(b"\0".join(bufs))
+    base = C.addressof(block)
+    fields = [(0, 0, 0) if st is None else (int(st.fg), int(st.bg), int(st.mods)) for st in styles]
+    np = _numpy() if n >= _SPAN_NP_MIN else None
+    if np is not None:
+        view = np.frombuffer(arr, dtype=_span_dtype(np))
+        lens = np.fromiter((len(b) + 1 for b in bufs), dtype=np.uintp, count=n)
+        view["text"][0] = base
+        np.cumsum(lens[:-1], out=view["text"][1:])
+        view["text"][1:] += base
+        cols = np.array(fields, dtype=np.uint32).reshape(n, 3)
+        view["fg"], view["bg"], view["mods"] = cols[:, 0], cols[:, 1], cols[:, 2]
+    else:
+        pack, size = _SPAN.pack_into, _SPAN.size
+        off = 0
+        for b, (fg, bg, mods) in zip(bufs, fields):
+            pack(arr, off, base, fg, bg, mods)
+            off += size
+            base += len(b) + 1
+    return arr, (arr, block)
+
+
 def _build_spans(spans: Sequence[tuple[str, "Style"]]):
     # Build an array[FfiSpan] and keep UTF-8 bytes alive across the call
-    bufs = [text.encode('utf-8') for text, _ in spans]
-    arr = (load_library().FfiSpan * len(spans))()
-    for i, (buf, (_, style)) in enumerate(zip(bufs, spans)):
-        arr[i] = load_library().FfiSpan(buf, style.to_ffi())
-    return arr, bufs
+    return _fill_spans([_utf8(text) for text, _ in spans], [style for _, style in spans])
 
 
 def _build_lines_spans(lines: Sequence[Sequence[tuple[str, "Style"]]]):
-    # Build nested arrays: [FfiLineSpans] where each has spans pointer + len
-    span_arrays = []
-    keep: list[bytes] = []
-    FfiSpan = load_library().FfiSpan
-    FfiLineSpans = load_library().FfiLineSpans
-    for spans in lines:
-        bufs = [text.encode('utf-8') for text, _ in spans]
-        arr = (FfiSpan * len(spans))()
-        for i, (buf, (_, style)) in enumerate(zip(bufs, spans)):
-            arr[i] = FfiSpan(buf, style.to_ffi())
-        span_arrays.append((arr, bufs))
-        keep.extend(bufs)
+    # [FfiLineSpans] over one flat span array; line i points at its first span.
+    flat = [span for spans in lines for span in spans]
+    spans_arr, keep = _build_spans(flat)
     out = (FfiLineSpans * len(lines))()
-    for i, (arr, _bufs) in enumerate(span_arrays):
-        out[i] = FfiLineSpans(arr, len(arr))
+    pack, size = _PTR_LEN.pack_into, _PTR_LEN.size
+    addr, span_size = C.addressof(spans_arr), C.sizeof(FfiSpan)
+    off = 0
+    for spans in lines:
+        k = len(spans)
+        pack(out, off, addr, k)
+        off += size
+        addr += k * span_size
     return out, keep
 
 
+def _build_rows_cells_lines(rows: Sequence[Sequence[TextLike]], style: Optional[Style] = None):
+    # Plain rows as [FfiRowCellsLines]: every cell is one line of one span, so
+    # the spans, lines and cells live in three flat arrays indexed alike and
+    # each row points at its first cell.
+    bufs = [_utf8(text) for row in rows for text in row]
+    n = len(bufs)
+    spans, keep = _fill_spans(bufs, [style] * n)
+    lines = (FfiLineSpans * n)()
+    cells = (FfiCellLines * n)()
+    pack, size = _PTR_LEN.pack_into, _PTR_LEN.size
+    span_addr, line_addr = C.addressof(spans), C.addressof(lines)
+    span_size, line_size = C.sizeof(FfiSpan), C.sizeof(FfiLineSpans)
+    for i in range(n):
+        pack(lines, i * size, span_addr + i * span_size, 1)
+        pack(cells, i * size, line_addr + i * line_size, 1)
+    out = (FfiRowCellsLines * len(rows))()
+    cell_addr, cell_size = C.addressof(cells), C.sizeof(FfiCellLines)
+    i = 0
+    for r, row in enumerate(rows):
+        k = len(row)
+        pack(out, r * size, cell_addr + i * cell_size if k else 0, k)
+        i += k
+    return out, (lines, cells, keep)
+
+
 # Terminal context managers for raw and alt modes
 class _RawMode:
     def __enter__(self):
@@ -1416,8 +2010,10 @@ def color_indexed(i: int) -> int:
 
 # Stateful list and table
 class ListState:
+    _default_lib = None
+
     def __init__(self):
-        lib = load_library()
+        lib = _class_lib(type(self))
         if not hasattr(lib, 'ratatui_list_state_new'):
             raise RuntimeError('ratatui_ffi lacks ListState APIs')
         ptr = lib.ratatui_list_state_new()
@@ -1425,6 +2021,7 @@ class ListState:
             raise RuntimeError('ratatui_list_state_new failed')
         self._lib = lib
         self._handle = C.c_void_p(ptr)
+        self._finalizer = weakref.finalize(self, self._lib.ratatui_list_state_free, self._handle)
 
     def set_selected(self, idx: Optional[int]) -> None:
         self._lib.ratatui_list_state_set_selected(self._handle, -1 if idx is None else int(idx))
@@ -1434,19 +2031,15 @@ class ListState:
 
     def close(self) -> None:
         if getattr(self, '_handle', None):
-            self._lib.ratatui_list_state_free(self._handle)
+            self._finalizer()
             self._handle = None
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
-
 
 class TableState:
+    _default_lib = None
+
     def __init__(self):
-        lib = load_library()
+        lib = _class_lib(type(self))
         if not hasattr(lib, 'ratatui_table_state_new'):
             raise RuntimeError('ratatui_ffi lacks TableState APIs')
         ptr = lib.ratatui_table_state_new()
@@ -1454,6 +2047,7 @@ class TableState:
             raise RuntimeError('ratatui_table_state_new failed')
         self._lib = lib
         self._handle = C.c_void_p(ptr)
+        self._finalizer = weakref.finalize(self, self._lib.ratatui_table_state_free, self._handle)
 
     def set_selected(self, idx: Optional[int]) -> None:
         self._lib.ratatui_table_state_set_selected(self._handle, -1 if idx is None else int(idx))
@@ -1463,27 +2057,18 @@ class TableState:
 
     def close(self) -> None:
         if getattr(self, '_handle', None):
-            self._lib.ratatui_table_state_free(self._handle)
+            self._finalizer()
             self._handle = None
 
-    def __del__(self):
-        try:
-            self.close()
-        except Exception:
-            pass
-
 
 # Terminal helpers for stateful widgets
 def headless_render_list_state(width: int, height: int, lst: List, state: ListState) -> str:
     lib = lst._lib
-    out = C.c_char_p()
-    ok = lib.ratatui_headless_render_list_state(C.c_uint16(width), C.c_uint16(height), lst._handle, state._handle, C.byref(out))
+    out, out_ref = _string_out()
+    ok = lib.ratatui_headless_render_list_state(width, height, lst._handle, state._handle, out_ref)
     if not ok or not out:
         return ""
-    try:
-        return C.cast(out, C.c_char_p).value.decode("utf-8", errors="replace")
-    finally:
-        lib.ratatui_string_free(out)
+    return _take_string(lib, out)
 
 
 def _term_draw_list_state(term: Terminal, lst: List, state: ListState, rect: RectLike) -> bool:
@@ -1,6 +1,6 @@
 from __future__ import annotations
-from typing import Optional, Sequence, Tuple, overload
-from .types import RectLike, Rect, Point, Size, Color, KeyCode, KeyMods, MouseKind, MouseButton, Event
+from typing import Iterable, Optional, Sequence, Tuple, overload
+from .types import RectLike, Rect, Point, Size, Color, KeyCode, KeyMods, MouseKind, MouseButton, Event, EventRecord
 from ._ffi import FfiRect, FfiStyle
 
 class Style:
@@ -14,13 +14,19 @@ class Paragraph:
     _handle: object
     def __init__(self, handle: int, lib: object | None = ...) -> None: ...
     @classmethod
-    def from_text(cls, text: str) -> Paragraph: ...
+    def from_text(cls, text: str | bytes | bytearray | memoryview) -> Paragraph: ...
+    @classmethod
+    def from_text_cached(cls, text: str | bytes) -> Paragraph: ...
+    @staticmethod
+    def invalidate_cache() -> None: ...
     @classmethod
     def new_empty(cls) -> Paragraph: ...
-    def append_span(self, text: str, style: Style | None = ...) -> None: ...
+    def append_span(self, text: str | bytes | bytearray | memoryview, style: Style | None = ...) -> None: ...
     def line_break(self) -> None: ...
-    def set_block_title(self, title: str | None, show_border: bool = ...) -> None: ...
-    def append_line(self, text: str, style: Style | None = ...) -> None: ...
+    def set_block_title(self, title: str | bytes | None, show_border: bool = ...) -> None: ...
+    def append_line(self, text: str | bytes | bytearray | memoryview, style: Style | None = ...) -> None: ...
+    def append_lines_bulk(self, lines: Sequence[tuple[str, Style | None]]) -> None: ...
+    def extend_lines(self, lines: Iterable[str | bytes | bytearray | memoryview], style: Style | None = ...) -> None: ...
     def close(self) -> None: ...
 
 class Terminal:
@@ -31,6 +37,7 @@ class Terminal:
     def draw_paragraph(self, p: Paragraph) -> bool: ...
     @overload
     def draw_paragraph(self, p: Paragraph, rect: RectLike) -> bool: ...
+    def draw(self, kind: int, handle: object, rect: RectLike) -> bool: ...
     def draw_list(self, lst: List, rect: RectLike) -> bool: ...
     def draw_table(self, tbl: Table, rect: RectLike) -> bool: ...
     def draw_gauge(self, g: Gauge, rect: RectLike) -> bool: ...
@@ -39,8 +46,12 @@ class Terminal:
     def draw_sparkline(self, s: Sparkline, rect: RectLike) -> bool: ...
     def draw_chart(self, c: Chart, rect: RectLike) -> bool: ...
     def draw_frame(self, cmds: Sequence[DrawCmd]) -> bool: ...
+    def draw_batch(self, items: Sequence[tuple[Paragraph, RectLike]]) -> bool: ...
+    def draw_frame_builder(self, fb: FrameBuilder) -> bool: ...
     def size(self) -> tuple[int, int]: ...
-    def next_event(self, timeout_ms: int) -> dict | None: ...
+    def next_event(self, timeout_ms: int) -> EventRecord | None: ...
+    def next_events(self, timeout_ms: int, max_events: int = ...) -> list[EventRecord]: ...
+    def next_events_soa(self, timeout_ms: int, max_events: int = ...) -> dict: ...
     def next_event_typed(self, timeout_ms: int) -> Event | None: ...
     def frame(self) -> Frame: ...
     def close(self) -> None: ...
@@ -79,11 +90,27 @@ class DrawCmd:
     @staticmethod
     def chart(c: Chart, rect: RectLike) -> DrawCmd: ...
 
+class FrameBuilder:
+    def __init__(self, capacity: int = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def clear(self) -> None: ...
+    def add(self, kind: int, widget: object, rect: RectLike) -> FrameBuilder: ...
+    def extend(self, cmds: Iterable[DrawCmd]) -> FrameBuilder: ...
+    def add_paragraph(self, p: Paragraph, rect: RectLike) -> FrameBuilder: ...
+    def add_list(self, lst: List, rect: RectLike) -> FrameBuilder: ...
+    def add_table(self, t: Table, rect: RectLike) -> FrameBuilder: ...
+    def add_gauge(self, g: Gauge, rect: RectLike) -> FrameBuilder: ...
+    def add_tabs(self, t: Tabs, rect: RectLike) -> FrameBuilder: ...
+    def add_barchart(self, b: BarChart, rect: RectLike) -> FrameBuilder: ...
+    def add_sparkline(self, s: Sparkline, rect: RectLike) -> FrameBuilder: ...
+    def add_chart(self, c: Chart, rect: RectLike) -> FrameBuilder: ...
+
 class Frame:
     ok: bool | None
     def __enter__(self) -> Frame: ...
     def __exit__(self, exc_type, exc, tb) -> None: ...
     def extend(self, cmds: Sequence[DrawCmd]) -> None: ...
+    def draw(self, widget: object, rect: RectLike) -> None: ...
     def paragraph(self, p: Paragraph, rect: RectLike) -> None: ...
     def list(self, lst: List, rect: RectLike) -> None: ...
     def table(self, t: Table, rect: RectLike) -> None: ...
@@ -105,3 +132,5 @@ def headless_render_tabs(width: int, height: int, t: Tabs) -> str: ...
 def headless_render_barchart(width: int, height: int, b: BarChart) -> str: ...
 def headless_render_sparkline(width: int, height: int, s: Sparkline) -> str: ...
 def headless_render_chart(width: int, height: int, c: Chart) -> str: ...
+def headless_render_many(items: Sequence[tuple[int, int, object]]) -> list[str]: ...
+def headless_render_frame_cells_np(width: int, height: int, cmds: Sequence[DrawCmd]) -> object: ...
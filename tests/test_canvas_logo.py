@@ -24,3 +24,31 @@ def test_headless_canvas_nonempty():
         pytest.skip("headless canvas not available in this FFI build")
     assert len(out.strip()) > 0
 
+
+def test_headless_sparkline_accepts_generator():
+    from ratatui_py import Sparkline, headless_render_sparkline
+
+    try:
+        sp = Sparkline()
+        sp.set_values(v * 2 for v in range(1, 9))
+        out = headless_render_sparkline(10, 3, sp)
+    except OSError:
+        pytest.skip("libratatui_ffi not available in this environment")
+    if out == "":
+        pytest.skip("headless sparkline not available in this FFI build")
+    assert len(out.strip()) > 0
+
+
+def test_headless_sparkline_numpy_matches_list():
+    np = pytest.importorskip("numpy")
+    from ratatui_py import Sparkline, headless_render_sparkline
+
+    try:
+        a, b = Sparkline(), Sparkline()
+        a.set_values([1, 4, 2, 8, 5])
+        b.set_values(np.array([1, 4, 2, 8, 5], dtype=np.uint64))
+        out_a = headless_render_sparkline(10, 3, a)
+        out_b = headless_render_sparkline(10, 3, b)
+    except OSError:
+        pytest.skip("libratatui_ffi not available in this environment")
+    assert out_a == out_b
@@ -0,0 +1,48 @@
+from ratatui_py import EventRecord
+from ratatui_py.types import EVENT_NONE
+
+
+def test_event_record_keeps_dict_interface():
+    evt = EventRecord.key(0, ord("q"), 0)
+    assert evt.kind == "key" and evt["ch"] == ord("q")
+    assert evt.get("width", 7) == 7
+    assert "mods" in evt and "x" not in evt
+    assert dict(evt) == {"kind": "key", "code": 0, "ch": ord("q"), "mods": 0}
+    assert evt == {"kind": "key", "code": 0, "ch": ord("q"), "mods": 0}
+
+    rs = EventRecord.resize(80, 24)
+    assert rs.get("kind") == "resize" and (rs["width"], rs["height"]) == (80, 24)
+    assert EVENT_NONE == {"kind": "none"}
+
+
+def test_event_record_to_dict_is_plain_copy():
+    import json
+
+    evt = EventRecord.mouse(3, 4, 1, 0, 2)
+    d = evt.to_dict()
+    assert type(d) is dict and d == evt
+    assert json.loads(json.dumps(d)) == d
+    d["x"] = 9
+    assert evt["x"] == 3
+    assert EVENT_NONE.to_dict() == {"kind": "none"}
+
+
+def test_kind_enums_match_ffi_tables():
+    from ratatui_py import EventKind, WidgetKind, FFI_EVENT_KIND, FFI_WIDGET_KIND
+
+    assert {k.name: int(k) for k in EventKind} == FFI_EVENT_KIND
+    assert {k.name: int(k) for k in WidgetKind} == FFI_WIDGET_KIND
+
+
+def test_demo_key_actions_fold_only_ascii_letters():
+    from ratatui_py.demo_runner import DemoBase
+
+    hits = []
+
+    class Demo(DemoBase):
+        _KEY_ACTIONS = {ord("q"): lambda self: hits.append("q"), ord("["): lambda self: hits.append("[")}
+
+    demo = Demo()
+    for ch in "Qq[{\r-":
+        demo._char_action(ord(ch))
+    assert hits == ["q", "q", "["]
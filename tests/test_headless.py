@@ -46,3 +46,68 @@ def test_headless_gauge_shows_label():
     except OSError:
         pytest.skip("libratatui_ffi not available in this environment")
     assert "50%" in out
+
+
+def test_headless_paragraph_bulk_lines():
+    try:
+        p = Paragraph.new_empty()
+        p.append_lines_bulk([("first", None), ("second", None)])
+        out = headless_render_paragraph(20, 4, p)
+    except OSError:
+        pytest.skip("libratatui_ffi not available in this environment")
+    assert "first" in out and "second" in out
+
+
+def test_headless_bulk_extend_items_and_rows():
+    try:
+        lst = List()
+        lst.extend_items(["One", b"Two"])
+        out_l = headless_render_list(20, 4, lst)
+        tbl = Table()
+        tbl.set_headers(["A", "B"])
+        tbl.extend_rows([["1", "2"], ["3", "4"]])
+        out_t = headless_render_table(20, 5, tbl)
+    except OSError:
+        pytest.skip("libratatui_ffi not available in this environment")
+    assert "One" in out_l and "Two" in out_l
+    assert "1" in out_t and "3" in out_t
+
+
+def test_headless_render_many_splits_per_widget():
+    from ratatui_py import headless_render_many
+
+    class Labels(List):
+        pass
+
+    try:
+        lst = Labels()
+        lst.append_item("One")
+        lst.append_item("表格 wide")
+        t = Table()
+        t.set_headers(["A", "B"])
+        t.append_row(["1", "2"])
+        g = Gauge().ratio(0.5).label("50%")
+        items = [(20, 4, lst), (12, 3, t), (20, 3, g)]
+        out = headless_render_many(items)
+        want = [
+            headless_render_list(20, 4, lst),
+            headless_render_table(12, 3, t),
+            headless_render_gauge(20, 3, g),
+        ]
+    except OSError:
+        pytest.skip("libratatui_ffi not available in this environment")
+    assert out == want
+
+
+def test_headless_frame_cells_np_matches_dicts():
+    pytest.importorskip("numpy")
+    from ratatui_py import DrawCmd, headless_render_frame_cells, headless_render_frame_cells_np
+
+    try:
+        p = Paragraph.from_text("Hi")
+        cmds = [DrawCmd.paragraph(p, (0, 0, 4, 1))]
+        cells = headless_render_frame_cells(4, 1, cmds)
+        arr = headless_render_frame_cells_np(4, 1, cmds)
+    except OSError:
+        pytest.skip("libratatui_ffi not available in this environment")
+    assert [int(c) for c in arr["ch"]] == [c["ch"] for c in cells]
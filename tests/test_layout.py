@@ -1,3 +1,5 @@
+import pytest
+
 from ratatui_py import margin, split_h, split_v
 
 
@@ -15,3 +17,89 @@ def test_margin_and_splits():
     assert len(cols) == 2
     assert cols[0][0] == 0 and cols[1][0] == cols[0][2] + 1
 
+
+
+class _FakeLayoutLib:
+    """Stands in for the FFI solver: each constraint gets a 1-row band."""
+
+    def __init__(self, *names):
+        self.calls = []
+        for name in names:
+            setattr(self, name, getattr(self, "_" + name))
+
+    def _fill(self, w, h, n, l, t, r, b, out):
+        for i in range(n):
+            out[i].x, out[i].y, out[i].width, out[i].height = l, t + i, w - l - r, 1
+        return n
+
+    def _ratatui_layout_split_ex(self, w, h, d, kinds, a, b_arr, n, spacing, l, t, r, b, out, cap):
+        self.calls.append(("ex", None if b_arr is None else list(b_arr)))
+        return self._fill(w, h, n, l, t, r, b, out)
+
+    _ratatui_layout_split_ex2 = _ratatui_layout_split_ex
+
+    def _ratatui_layout_split(self, w, h, d, kinds, a, b_arr, n, out, cap):
+        self.calls.append(("base", w, h))
+        return self._fill(w, h, n, 0, 0, 0, 0, out)
+
+
+@pytest.fixture
+def use_lib(monkeypatch):
+    from ratatui_py import layout
+
+    def install(lib):
+        monkeypatch.setattr(layout, "load_library", lambda: lib)
+        layout._solve_layout.cache_clear()
+        return layout
+
+    yield install
+    layout._solve_layout.cache_clear()
+
+
+def test_layout_split_ffi_caches_by_size_and_shifts_origin(use_lib):
+    lib = _FakeLayoutLib("ratatui_layout_split_ex")
+    layout = use_lib(lib)
+    at_zero = layout.layout_split_ffi((0, 0, 20, 10), constraints=[("len", 3), ("min", 1)])
+    assert at_zero == ((0, 0, 20, 1), (0, 1, 20, 1))
+    moved = layout.layout_split_ffi((5, 7, 20, 10), constraints=[["len", 3], ["min", 1]])
+    assert moved == ((5, 7, 20, 1), (5, 8, 20, 1))
+    assert layout.layout_split_ffi((0, 0, 20, 10), constraints=(("len", 3), ("min", 1))) == at_zero
+    assert len(lib.calls) == 1 and lib.calls[0] == ("ex", None)
+    with pytest.raises(ValueError):
+        layout.layout_split_ffi((0, 0, 20, 10), constraints=["len"])
+
+
+def test_layout_split_ffi_passes_ratio_denominators(use_lib):
+    lib = _FakeLayoutLib("ratatui_layout_split_ex", "ratatui_layout_split_ex2")
+    layout = use_lib(lib)
+    layout.layout_split_ffi((0, 0, 20, 10), constraints=[("ratio", 1, 3), ("len", 2)])
+    assert lib.calls == [("ex", [3, 0])]
+
+
+def test_layout_split_ffi_base_split_applies_margins(use_lib):
+    lib = _FakeLayoutLib("ratatui_layout_split")
+    layout = use_lib(lib)
+    rects = layout.layout_split_ffi((2, 3, 20, 10), constraints=[("len", 3)], margins=(1, 2, 3, 4))
+    assert lib.calls == [("base", 16, 4)]
+    assert rects == ((3, 5, 16, 1),)
+
+
+def test_split_spans_last_span_absorbs_rounding():
+    from ratatui_py.layout import _split_spans
+
+    assert _split_spans(0, 24, [1, 1], 2) == [(0, 11), (13, 11)]
+    assert _split_spans(0, 10, [1, 1, 1], 0) == [(0, 3), (3, 3), (6, 4)]
+    assert _split_spans(5, 7, [1], 3) == [(5, 7)]
+    # zero-sum fractions and gaps wider than the area clamp to empty spans
+    assert _split_spans(3, 10, [0, 0], 1) == [(3, 0), (4, 9)]
+    assert _split_spans(0, 5, [1, 1, 1], 4) == [(0, 0), (4, 0), (8, 0)]
+    assert _split_spans(0, 0, [], 1) == []
+
+
+def test_split_tuple_and_rect_variants_agree():
+    from ratatui_py import split_h_rect, split_v_rect
+
+    base = (2, 3, 31, 17)
+    for fractions, gap in (((0.7, 0.3), 1), ((1, 2, 3), 0), ((0.25, 0.5, 0.25), 2)):
+        assert tuple(r.to_tuple() for r in split_h_rect(base, *fractions, gap=gap)) == split_h(base, *fractions, gap=gap)
+        assert tuple(r.to_tuple() for r in split_v_rect(base, *fractions, gap=gap)) == split_v(base, *fractions, gap=gap)
@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from ratatui_py.examples import _step
+
+np = pytest.importorskip("numpy")
+
+# (h, w): single rows/columns, odd widths and widths around the 64-cell word.
+_SHAPES = [(1, 1), (1, 5), (2, 3), (3, 7), (5, 63), (4, 64), (6, 65), (2, 129), (9, 1)]
+
+
+def _grids(seed=7):
+    rnd = random.Random(seed)
+    for h, w in _SHAPES:
+        yield [[1 if rnd.random() < 0.4 else 0 for _ in range(w)] for _ in range(h)]
+
+
+def test_packed_step_matches_list_step():
+    from ratatui_py.examples import _step_packed
+
+    for rows in _grids():
+        grid = np.array(rows, dtype=np.uint8)
+        for _ in range(3):
+            want = _step(rows)
+            got = _step_packed(np, grid)
+            assert got.tolist() == want
+            rows, grid = want, got
+
+
+def test_np_step_matches_list_step_across_the_halo():
+    from ratatui_py.examples import _step_np
+
+    for rows in _grids(seed=11):
+        grid = np.array(rows, dtype=np.uint8)
+        for _ in range(3):
+            want = _step(rows)
+            got = _step_np(np, grid)
+            assert got.tolist() == want
+            rows, grid = want, got
+    # A glider straddling the corner only survives if all four edges wrap.
+    rows = [[0] * 6 for _ in range(5)]
+    for y, x in ((4, 5), (0, 0), (1, 4), (1, 5), (1, 0)):
+        rows[y][x] = 1
+    grid = np.array(rows, dtype=np.uint8)
+    for _ in range(8):
+        rows, grid = _step(rows), _step_np(np, grid)
+        assert grid.tolist() == rows and grid.sum() == 5
+
+
+def test_numpy_life_helpers_match_list_versions():
+    from ratatui_py.examples import _grid_size, _rand_grid, _render_text
+
+    grid = _rand_grid(7, 3, 0.5)
+    assert grid.shape == (3, 7) and grid.dtype == np.uint8
+    assert _grid_size(grid) == (7, 3)
+    rows = grid.tolist()
+    assert _render_text(grid) == _render_text(rows)
+    spare = np.empty_like(grid)
+    for _ in range(4):
+        nxt = _step(grid, out=spare)
+        rows = _step(rows)
+        assert nxt.tolist() == rows and _render_text(nxt) == _render_text(rows)
+        grid, spare = nxt, grid
+    # the reused text buffer follows a change of grid size
+    assert _render_text(np.ones((2, 2), dtype=np.uint8)) == "██\n██"
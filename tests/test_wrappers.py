@@ -0,0 +1,69 @@
+from ratatui_py import wrappers as W
+
+
+def test_utf8_interns_only_short_text():
+    W._str_bytes.cache_clear()
+    label = "Item 1"
+    assert W._utf8(label) is W._utf8("Item " + "1")
+    body = "x" * (W._INTERN_MAX + 1)
+    assert W._utf8(body) == body.encode("utf-8")
+    assert W._str_bytes.cache_info().currsize == 1
+
+
+def test_pooled_structs_are_read_only():
+    import pytest
+    from ratatui_py import DrawCmd, Paragraph, Style
+
+    st = Style(fg=1).to_ffi()
+    with pytest.raises(AttributeError):
+        st.fg = 99
+    assert Style(fg=1).to_ffi().fg == 1
+
+    p = object.__new__(Paragraph)
+    p._handle = 0
+    cmd = DrawCmd.paragraph(p, (1, 2, 3, 4))
+    with pytest.raises(AttributeError):
+        cmd.rect.x = 7
+    assert DrawCmd.paragraph(p, (1, 2, 3, 4)).rect.x == 1
+
+
+def test_frame_builder_failed_add_claims_no_slot(monkeypatch):
+    import types
+
+    import pytest
+    from ratatui_py import DrawCmd, FrameBuilder
+    from ratatui_py._ffi import FfiDrawCmd
+
+    monkeypatch.setattr(FrameBuilder, "_default_lib", types.SimpleNamespace(FfiDrawCmd=FfiDrawCmd))
+    p = types.SimpleNamespace(_handle=0x1234)
+    fb = FrameBuilder(capacity=1)
+    fb.add(1, p, (0, 0, 2, 2))
+    fb.clear()
+    with pytest.raises(AttributeError):
+        fb.add(1, object(), (0, 0, 1, 1))
+    with pytest.raises(ValueError):
+        fb.add(1, p, (0, 0, 1))
+    with pytest.raises(AttributeError):
+        fb.extend([DrawCmd(1, 0x1234, W._ffi_rect((0, 0, 1, 1)), owner=p), object()])
+    assert len(fb) == 1 and fb._owners == [p]
+    fb.add(1, p, (1.0, 2, 3, 4))
+    r = fb._arr[1].rect
+    assert len(fb) == 2 and (r.x, r.y, r.width, r.height) == (1, 2, 3, 4)
+
+
+def test_set_block_title_sees_in_place_title_changes():
+    from ratatui_py import Paragraph
+
+    calls = []
+    p = object.__new__(Paragraph)
+    p._handle = 0
+    p._last_title = None
+    p._set_title = lambda handle, title, border: calls.append((title, border))
+    title = bytearray(b"one")
+    p.set_block_title(title)
+    p.set_block_title(title)
+    title[:] = b"two"
+    p.set_block_title(title)
+    assert calls == [(b"one", True), (b"two", True)]
+    p.set_block_title("two")
+    assert len(calls) == 2